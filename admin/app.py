@@ -9,6 +9,7 @@ from admin.manifest_view import (
     build_status_matrix,
     filter_manifest_entries,
     flatten_manifest_entries,
+    manifest_caption,
     status_cell_style,
     timeframe_sort_key,
 )
@@ -17,22 +18,54 @@ st.set_page_config(page_title="Coin Predict MVP", layout="wide")
 
 BASE_URL = os.getenv("API_URL", "http://nginx")
 MANIFEST_URL = f"{BASE_URL}/static/manifest.json"
+MANIFEST_V2_BASE_URL = f"{BASE_URL}/static/manifest_v2"
+
+
+def _fetch_json_object(url: str) -> dict:
+    response = requests.get(url, timeout=5)
+    response.raise_for_status()
+    payload = response.json()
+    if not isinstance(payload, dict):
+        raise ValueError(f"payload is not a JSON object: {url}")
+    return payload
 
 
 @st.cache_data(ttl=60)
 def get_manifest_payload():
-    """Manifest를 1차 소스로 조회한다."""
+    """
+    Manifest를 1차 소스로 조회한다.
+
+    v2 index(summary + shard 목록)가 있으면 그것을, 없으면 v1 단일 manifest를 쓴다.
+    """
     try:
-        response = requests.get(MANIFEST_URL, timeout=5)
-        response.raise_for_status()
-        payload = response.json()
-        if not isinstance(payload, dict):
-            raise ValueError("manifest payload is not a JSON object")
-        return payload, None
+        return _fetch_json_object(f"{MANIFEST_V2_BASE_URL}/index.json"), None
+    except Exception:
+        pass
+    try:
+        return _fetch_json_object(MANIFEST_URL), None
     except Exception as e:
         return None, str(e)
 
 
+@st.cache_data(ttl=3600, max_entries=2048)
+def get_manifest_shard(url: str, sha256: str):
+    """
+    shard는 (url, sha256)로 캐시한다. hash가 바뀐 shard만 다시 받는다.
+    (`sha256`은 cache key로만 쓴다. `_` prefix를 붙이면 streamlit이 key에서 뺀다.)
+    """
+    try:
+        return _fetch_json_object(f"{MANIFEST_V2_BASE_URL}/{url}")
+    except Exception:
+        return None
+
+
+def load_manifest_shard(shard: dict):
+    url = shard.get("url")
+    if not isinstance(url, str):
+        return None
+    return get_manifest_shard(url, str(shard.get("sha256", "")))
+
+
 st.title("Coin Predict Admin Dashboard")
 st.markdown("Manifest-first runtime status board")
 
@@ -53,12 +86,16 @@ if manifest_payload is None:
 
 summary = manifest_payload.get("summary", {})
 entries_df = flatten_manifest_entries(
-    manifest_payload, now=datetime.now(timezone.utc)
+    manifest_payload,
+    now=datetime.now(timezone.utc),
+    shard_loader=load_manifest_shard,
 )
 
 if entries_df.empty:
     st.warning("Manifest entries are empty. Wait for a publish cycle.")
-    st.json({"summary": summary, "generated_at": manifest_payload.get("generated_at")})
+    st.json(
+        {"summary": summary, "last_changed_at": manifest_payload.get("generated_at")}
+    )
     st.stop()
 
 all_symbols = sorted(entries_df["symbol"].dropna().unique().tolist())
@@ -103,10 +140,7 @@ filtered_df = filter_manifest_entries(
     serve_mode=serve_mode,
 )
 
-st.caption(
-    f"Manifest generated_at={manifest_payload.get('generated_at')} / "
-    f"entry_count={summary.get('entry_count', 0)}"
-)
+st.caption(manifest_caption(manifest_payload))
 
 metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
 metric_col1.metric(
@@ -152,7 +186,6 @@ else:
         columns={
             "prediction_updated_at": "prediction_updated_at_utc",
             "prediction_delay_minutes": "updated_delay_minutes",
-            "prediction_age_minutes": "prediction_age_minutes_in_manifest",
             "history_updated_at": "history_updated_at_utc",
             "last_prediction_success_at": "last_success_at_utc",
             "last_prediction_failure_at": "last_failure_at_utc",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
 
 import pandas as pd
 
@@ -48,13 +48,6 @@ def _to_int(value) -> int | None:
         return None
 
 
-def _to_float(value) -> float | None:
-    try:
-        return round(float(value), 2)
-    except (TypeError, ValueError):
-        return None
-
-
 def _prediction_delay_minutes(
     prediction_updated_at: str | None, now: datetime
 ) -> float | None:
@@ -69,8 +62,63 @@ def _prediction_delay_minutes(
     return round(delay.total_seconds() / 60, 2)
 
 
+def manifest_caption(manifest_payload: dict) -> str:
+    """
+    대시보드 상단 caption. `generated_at`은 마지막 변경 시각으로 표시한다.
+
+    v1 manifest와 v2 index 모두 내용이 같은 cycle에는 다시 쓰지 않으므로(skip-unchanged)
+    `generated_at`은 마지막 cycle 시각이 아니라 내용이 마지막으로 바뀐 시각이다.
+    """
+    summary = manifest_payload.get("summary")
+    if not isinstance(summary, dict):
+        summary = {}
+    source = "Manifest v2 index" if "shards" in manifest_payload else "Manifest"
+    return (
+        f"{source} last changed at={manifest_payload.get('generated_at')} / "
+        f"entry_count={summary.get('entry_count', 0)}"
+    )
+
+
+def iter_manifest_entries(
+    manifest_payload: dict,
+    *,
+    shard_loader: Callable[[dict], dict | None] | None = None,
+    symbols: Iterable[str] | None = None,
+) -> Iterator[dict]:
+    """
+    manifest v1(`entries`) 또는 v2 index(`shards`)의 entry를 순서대로 내보낸다.
+
+    v2는 shard를 필요할 때 하나씩 `shard_loader(shard_ref)`로 읽는다.
+    `symbols`를 주면 해당 symbol shard만 읽는다. loader가 없거나 실패한 shard는 건너뛴다.
+    """
+    entries = manifest_payload.get("entries")
+    if isinstance(entries, list):
+        yield from entries
+        return
+
+    shards = manifest_payload.get("shards")
+    if not isinstance(shards, list) or shard_loader is None:
+        return
+    selected_symbols = set(_as_list(symbols))
+    for shard in shards:
+        if not isinstance(shard, dict):
+            continue
+        if selected_symbols and shard.get("symbol") not in selected_symbols:
+            continue
+        shard_payload = shard_loader(shard)
+        if not isinstance(shard_payload, dict):
+            continue
+        shard_entries = shard_payload.get("entries")
+        if isinstance(shard_entries, list):
+            yield from shard_entries
+
+
 def flatten_manifest_entries(
-    manifest_payload: dict, now: datetime | None = None
+    manifest_payload: dict,
+    now: datetime | None = None,
+    *,
+    shard_loader: Callable[[dict], dict | None] | None = None,
+    symbols: Iterable[str] | None = None,
 ) -> pd.DataFrame:
     resolved_now = now or datetime.now(timezone.utc)
     if resolved_now.tzinfo is None:
@@ -78,12 +126,10 @@ def flatten_manifest_entries(
     else:
         resolved_now = resolved_now.astimezone(timezone.utc)
 
-    entries = manifest_payload.get("entries")
-    if not isinstance(entries, list):
-        return pd.DataFrame(columns=MANIFEST_VIEW_COLUMNS)
-
     rows: list[dict] = []
-    for entry in entries:
+    for entry in iter_manifest_entries(
+        manifest_payload, shard_loader=shard_loader, symbols=symbols
+    ):
         if not isinstance(entry, dict):
             continue
         prediction = entry.get("prediction")
@@ -107,7 +153,11 @@ def flatten_manifest_entries(
             "visibility": entry.get("visibility") or "unknown",
             "symbol_state": entry.get("symbol_state") or "unknown",
             "prediction_updated_at": prediction_updated_at,
-            "prediction_age_minutes": _to_float(prediction.get("age_minutes")),
+            # 파일의 age_minutes는 내용이 바뀐 마지막 write 시점 값이라(skip-unchanged)
+            # 멈춰 보인다. v1/v2 모두 updated_at에서 지금 기준으로 계산한다.
+            "prediction_age_minutes": _prediction_delay_minutes(
+                prediction_updated_at, resolved_now
+            ),
             "prediction_delay_minutes": _prediction_delay_minutes(
                 prediction_updated_at, resolved_now
             ),
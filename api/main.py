@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from influxdb_client import InfluxDBClient
 from contextlib import asynccontextmanager
@@ -6,10 +6,13 @@ import pandas as pd
 import json
 import os
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Annotated
 from utils.logger import get_logger
 from utils.config import FRESHNESS_THRESHOLDS, FRESHNESS_HARD_THRESHOLDS
+from utils.freshness import parse_utc_timestamp
+from utils.http_cache import format_http_date, is_not_modified, weak_etag
 from utils.prediction_status import evaluate_prediction_status
 
 logger = get_logger(__name__)
@@ -194,11 +197,43 @@ def predict_price(symbol: str):
     )
 
 
+def _status_last_modified(snapshot, health: dict) -> datetime | None:
+    """
+    `/status` 표현이 마지막으로 바뀐 시각.
+
+    - prediction updated_at, health 성공/실패 시각 중 가장 늦은 값
+    - stale이면 fresh -> stale 전이 시각(updated_at + soft limit)도 포함한다.
+      파일이 바뀌지 않아도 status가 바뀌므로 If-Modified-Since가 이를 놓치지 않게 한다.
+    """
+    candidates = [
+        parse_utc_timestamp(snapshot.updated_at),
+        parse_utc_timestamp(health.get("last_success_at")),
+        parse_utc_timestamp(health.get("last_failure_at")),
+    ]
+    updated_at = candidates[0]
+    if (
+        snapshot.status == "stale"
+        and updated_at is not None
+        and snapshot.soft_limit_minutes is not None
+    ):
+        candidates.append(updated_at + timedelta(minutes=snapshot.soft_limit_minutes))
+    resolved = [value for value in candidates if value is not None]
+    return max(resolved) if resolved else None
+
+
 @app.get("/status/{symbol:path}")
-def check_status(symbol: str, timeframe: str = "1h"):
+def check_status(
+    symbol: str,
+    response: Response,
+    timeframe: str = "1h",
+    if_none_match: Annotated[str | None, Header()] = None,
+    if_modified_since: Annotated[str | None, Header()] = None,
+):
     """
     정적 파일의 신선도(Freshness) 검사
     - 파일이 없거나, 너무 오래되었으면 503에러 반환
+    - 200 응답에는 ETag/Last-Modified를 붙이고, 조건부 요청이 일치하면 304를 반환한다.
+      ETag는 (updated_at, status, health) 기준 weak ETag라 age_minutes 변화는 무시한다.
     """
     try:
         snapshot = evaluate_prediction_status(
@@ -232,7 +267,7 @@ def check_status(symbol: str, timeframe: str = "1h"):
         logger.error(f"Status Check Error: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
-    response = {
+    payload = {
         "status": snapshot.status,
         "updated_at": snapshot.updated_at,
         "age_minutes": snapshot.age_minutes,
@@ -243,17 +278,31 @@ def check_status(symbol: str, timeframe: str = "1h"):
     }
     # freshness 상태와 독립적으로 prediction 파이프라인 상태(degraded)를 별도 노출한다.
     health = _load_prediction_health(symbol, timeframe)
-    response["degraded"] = health["degraded"]
-    response["last_prediction_success_at"] = health["last_success_at"]
-    response["last_prediction_failure_at"] = health["last_failure_at"]
-    response["prediction_failure_count"] = health["consecutive_failures"]
+    payload["degraded"] = health["degraded"]
+    payload["last_prediction_success_at"] = health["last_success_at"]
+    payload["last_prediction_failure_at"] = health["last_failure_at"]
+    payload["prediction_failure_count"] = health["consecutive_failures"]
     if health["degraded"]:
-        response["degraded_reason"] = (
+        payload["degraded_reason"] = (
             health["last_error"] or "prediction_pipeline_degraded"
         )
     if snapshot.status == "stale":
-        response["warning"] = "Data is stale but within soft-stale tolerance."
-    return response
+        payload["warning"] = "Data is stale but within soft-stale tolerance."
+
+    etag = weak_etag(snapshot.updated_at, snapshot.status, health)
+    last_modified = _status_last_modified(snapshot, health)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+    if is_not_modified(
+        etag=etag,
+        last_modified=last_modified,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+    ):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
 
 
 @app.get("/")
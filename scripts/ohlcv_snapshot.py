@@ -0,0 +1,524 @@
+"""
+OHLCV store bulk snapshot/restore CLI.
+
+Why this module exists:
+- Influx 볼륨이 유실되면 지금은 모든 symbol/timeframe을
+  `resolve_ingest_since`(`bootstrap_exchange_earliest`) 경로로 거래소에서 다시 받아야 한다.
+  이는 느리고 rate limit에 묶인다.
+- `ohlcv` series 전체를 압축 Parquet로 떠 두고, 복구 시 line protocol bulk write로
+  되돌려 거래소를 건드리지 않고 DR/스테이징 구성을 분 단위로 끝내기 위함이다.
+
+Usage:
+- `python -m scripts.ohlcv_snapshot snapshot [--dest DIR]`
+- `python -m scripts.ohlcv_snapshot restore --source DIR`
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+from influxdb_client.client.write_api import SYNCHRONOUS, WritePrecision
+
+from scripts.data_extractor import _get_influx_client, _query_chunk
+from scripts.worker_config import (
+    BASE_DIR,
+    INFLUXDB_BUCKET,
+    INFLUXDB_ORG,
+)
+from utils.file_io import atomic_write_json
+from utils.logger import get_logger
+from workers import ingest as ingest_ops
+
+logger = get_logger(__name__)
+
+SNAPSHOT_ROOT_DIR = BASE_DIR / "backups" / "ohlcv"
+SNAPSHOT_MANIFEST_NAME = "snapshot_manifest.json"
+SNAPSHOT_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+SNAPSHOT_FIELDS = ["open", "high", "low", "close", "volume"]
+# 1h 기준 1년 = 8760 row. 청크 단위 조회로 대형 series의 메모리 피크를 제한한다.
+SNAPSHOT_CHUNK_DAYS = int(os.getenv("SNAPSHOT_CHUNK_DAYS", "365"))
+SNAPSHOT_PARQUET_COMPRESSION = os.getenv("SNAPSHOT_PARQUET_COMPRESSION", "zstd")
+RESTORE_BATCH_LINES = int(os.getenv("RESTORE_BATCH_LINES", "5000"))
+DEFAULT_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class SeriesSnapshotResult:
+    symbol: str
+    timeframe: str
+    file: str | None
+    rows: int
+    source_rows: int | None
+    first_at: str | None
+    last_at: str | None
+    verified: bool
+    error: str | None = None
+
+
+def _ctx():
+    """
+    workers.ingest 함수에 넘길 컨텍스트(INFLUXDB_BUCKET, logger)를 반환한다.
+
+    Why:
+    - count/first 조회 구현을 복제하지 않고 pipeline_worker와 같은 ctx 패턴으로 재사용한다.
+    """
+    return sys.modules[__name__]
+
+
+def _format_utc(value) -> str | None:
+    if value is None or pd.isna(value):
+        return None
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return ts.tz_convert("UTC").strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _series_file_name(symbol: str, timeframe: str) -> str:
+    safe_symbol = symbol.replace("/", "_")
+    return f"ohlcv_{safe_symbol}_{timeframe}.parquet"
+
+
+def discover_ohlcv_series(query_api) -> list[tuple[str, str]]:
+    """
+    bucket 안의 `ohlcv` series(symbol, timeframe) 목록을 조회한다.
+
+    Why:
+    - `last()`는 series(table)마다 1 row만 돌려주므로 전체 scan 없이 tag 조합을 얻는다.
+    - timeframe tag가 없는 legacy row는 복구 계약 밖이므로 제외한다.
+    """
+    query = f"""
+    from(bucket: "{INFLUXDB_BUCKET}")
+      |> range(start: 0)
+      |> filter(fn: (r) => r["_measurement"] == "ohlcv")
+      |> filter(fn: (r) => r["_field"] == "close")
+      |> last()
+    """
+    series: set[tuple[str, str]] = set()
+    skipped_legacy = 0
+    for table in query_api.query(query=query):
+        for record in table.records:
+            symbol = record.values.get("symbol")
+            timeframe = record.values.get("timeframe")
+            if not symbol:
+                continue
+            if not timeframe:
+                skipped_legacy += 1
+                continue
+            series.add((symbol, timeframe))
+    if skipped_legacy:
+        logger.warning(
+            f"[Snapshot] skipped {skipped_legacy} legacy series without timeframe tag."
+        )
+    return sorted(series)
+
+
+def _query_series_first_timestamp(
+    query_api, symbol: str, timeframe: str
+) -> datetime | None:
+    query = f"""
+    from(bucket: "{INFLUXDB_BUCKET}")
+      |> range(start: 0)
+      |> filter(fn: (r) => r["_measurement"] == "ohlcv")
+      |> filter(fn: (r) => r["symbol"] == "{symbol}")
+      |> filter(fn: (r) => r["timeframe"] == "{timeframe}")
+      |> filter(fn: (r) => r["_field"] == "close")
+      |> first(column: "_time")
+    """
+    return ingest_ops.query_first_timestamp(query_api, query)
+
+
+def load_series_frame(
+    query_api,
+    symbol: str,
+    timeframe: str,
+    *,
+    now: datetime | None = None,
+) -> pd.DataFrame:
+    """
+    series 전체를 청크 단위로 조회해 단일 DataFrame으로 합친다.
+    """
+    resolved_now = now or datetime.now(timezone.utc)
+    first_at = _query_series_first_timestamp(query_api, symbol, timeframe)
+    if first_at is None:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+
+    # range stop은 exclusive이므로 마지막 봉이 빠지지 않게 1일 여유를 둔다.
+    stop_at = resolved_now + timedelta(days=1)
+    chunk = timedelta(days=max(1, SNAPSHOT_CHUNK_DAYS))
+    frames: list[pd.DataFrame] = []
+    cursor = first_at
+    while cursor < stop_at:
+        chunk_stop = min(cursor + chunk, stop_at)
+        chunk_df = _query_chunk(query_api, symbol, timeframe, cursor, chunk_stop)
+        if not chunk_df.empty:
+            frames.append(chunk_df)
+        cursor = chunk_stop
+
+    if not frames:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+
+    merged = pd.concat(frames, ignore_index=True)
+    merged.drop_duplicates(subset=["timestamp"], keep="last", inplace=True)
+    merged.sort_values(by="timestamp", inplace=True)
+    merged.reset_index(drop=True, inplace=True)
+    return merged[SNAPSHOT_COLUMNS]
+
+
+def _write_parquet_atomic(df: pd.DataFrame, path: Path) -> None:
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        df.to_parquet(
+            temp_path, index=False, compression=SNAPSHOT_PARQUET_COMPRESSION
+        )
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def snapshot_series(
+    query_api,
+    symbol: str,
+    timeframe: str,
+    dest_dir: Path,
+    *,
+    now: datetime | None = None,
+) -> SeriesSnapshotResult:
+    """
+    단일 series를 Parquet로 저장하고 Influx row count와 대조한다.
+    """
+    try:
+        df = load_series_frame(query_api, symbol, timeframe, now=now)
+        file_name = _series_file_name(symbol, timeframe)
+        _write_parquet_atomic(df, dest_dir / file_name)
+        source_rows = ingest_ops.count_ohlcv_rows(
+            _ctx(), query_api, symbol=symbol, timeframe=timeframe
+        )
+        rows = int(len(df))
+        verified = rows == source_rows
+        if not verified:
+            logger.warning(
+                f"[{symbol} {timeframe}] snapshot row mismatch: "
+                f"parquet={rows}, influx={source_rows}"
+            )
+        return SeriesSnapshotResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            file=file_name,
+            rows=rows,
+            source_rows=source_rows,
+            first_at=_format_utc(df["timestamp"].min()) if rows else None,
+            last_at=_format_utc(df["timestamp"].max()) if rows else None,
+            verified=verified,
+        )
+    except Exception as e:
+        logger.error(f"[{symbol} {timeframe}] snapshot failed: {e}")
+        return SeriesSnapshotResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            file=None,
+            rows=0,
+            source_rows=None,
+            first_at=None,
+            last_at=None,
+            verified=False,
+            error=str(e),
+        )
+
+
+def _escape_tag_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(",", "\\,").replace(
+        "=", "\\="
+    ).replace(" ", "\\ ")
+
+
+def build_line_protocol(df: pd.DataFrame, symbol: str, timeframe: str) -> list[str]:
+    """
+    snapshot DataFrame을 `ohlcv` line protocol(ns precision)로 변환한다.
+
+    Why:
+    - DataFrame serializer를 거치지 않고 문자열을 한 번에 만들어 bulk write 비용을 줄인다.
+    - measurement/tag/field 구성은 ingest(`fetch_and_save`)가 쓰는 계약과 동일하다.
+    """
+    if df.empty:
+        return []
+
+    prefix = (
+        f"ohlcv,symbol={_escape_tag_value(symbol)},"
+        f"timeframe={_escape_tag_value(timeframe)} "
+    )
+    timestamps = pd.to_datetime(df["timestamp"], utc=True)
+    epoch_ns = timestamps.astype("int64").tolist()
+    columns = [df[field].astype("float64").tolist() for field in SNAPSHOT_FIELDS]
+
+    lines: list[str] = []
+    for index, ts_ns in enumerate(epoch_ns):
+        fields = ",".join(
+            f"{field}={columns[pos][index]!r}"
+            for pos, field in enumerate(SNAPSHOT_FIELDS)
+            if not math.isnan(columns[pos][index])
+        )
+        if not fields:
+            continue
+        lines.append(f"{prefix}{fields} {ts_ns}")
+    return lines
+
+
+def restore_series(
+    write_api,
+    query_api,
+    entry: dict,
+    source_dir: Path,
+) -> SeriesSnapshotResult:
+    """
+    단일 series Parquet를 line protocol batch로 복구하고 row count를 검증한다.
+    """
+    symbol = entry.get("symbol", "")
+    timeframe = entry.get("timeframe", "")
+    file_name = entry.get("file")
+    try:
+        if not file_name:
+            raise ValueError("snapshot entry has no file.")
+        df = pd.read_parquet(source_dir / file_name)
+        lines = build_line_protocol(df, symbol, timeframe)
+        batch_size = max(1, RESTORE_BATCH_LINES)
+        for start in range(0, len(lines), batch_size):
+            write_api.write(
+                bucket=INFLUXDB_BUCKET,
+                org=INFLUXDB_ORG,
+                record=lines[start : start + batch_size],
+                write_precision=WritePrecision.NS,
+            )
+
+        rows = int(len(df))
+        source_rows = ingest_ops.count_ohlcv_rows(
+            _ctx(), query_api, symbol=symbol, timeframe=timeframe
+        )
+        # 복구 대상 bucket에 이미 데이터가 있으면 count가 더 클 수 있다.
+        # 그 경우도 스냅샷과 불일치이므로 verified=false로 드러낸다.
+        verified = source_rows == rows
+        if not verified:
+            logger.warning(
+                f"[{symbol} {timeframe}] restore row mismatch: "
+                f"parquet={rows}, influx={source_rows}"
+            )
+        return SeriesSnapshotResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            file=file_name,
+            rows=rows,
+            source_rows=source_rows,
+            first_at=entry.get("first_at"),
+            last_at=entry.get("last_at"),
+            verified=verified,
+        )
+    except Exception as e:
+        logger.error(f"[{symbol} {timeframe}] restore failed: {e}")
+        return SeriesSnapshotResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            file=file_name,
+            rows=0,
+            source_rows=None,
+            first_at=None,
+            last_at=None,
+            verified=False,
+            error=str(e),
+        )
+
+
+def _filter_series(
+    series: list[tuple[str, str]],
+    symbols: list[str] | None,
+    timeframes: list[str] | None,
+) -> list[tuple[str, str]]:
+    return [
+        (symbol, timeframe)
+        for symbol, timeframe in series
+        if (not symbols or symbol in symbols)
+        and (not timeframes or timeframe in timeframes)
+    ]
+
+
+def run_snapshot(
+    *,
+    client,
+    dest_dir: Path,
+    workers: int = DEFAULT_WORKERS,
+    symbols: list[str] | None = None,
+    timeframes: list[str] | None = None,
+    now: datetime | None = None,
+) -> dict:
+    """
+    전체 `ohlcv` series를 병렬로 snapshot하고 manifest를 기록한다.
+    """
+    resolved_now = now or datetime.now(timezone.utc)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    query_api = client.query_api()
+    series = _filter_series(discover_ohlcv_series(query_api), symbols, timeframes)
+    logger.info(f"[Snapshot] start series={len(series)} dest={dest_dir}")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(
+            executor.map(
+                lambda item: snapshot_series(
+                    query_api, item[0], item[1], dest_dir, now=resolved_now
+                ),
+                series,
+            )
+        )
+
+    manifest = {
+        "version": 1,
+        "created_at": _format_utc(resolved_now),
+        "bucket": INFLUXDB_BUCKET,
+        "compression": SNAPSHOT_PARQUET_COMPRESSION,
+        "entries": [asdict(result) for result in results],
+        "summary": _summarize(results),
+    }
+    atomic_write_json(dest_dir / SNAPSHOT_MANIFEST_NAME, manifest, indent=2)
+    logger.info(f"[Snapshot] done summary={manifest['summary']}")
+    return manifest
+
+
+def run_restore(
+    *,
+    client,
+    source_dir: Path,
+    workers: int = DEFAULT_WORKERS,
+    symbols: list[str] | None = None,
+    timeframes: list[str] | None = None,
+) -> dict:
+    """
+    snapshot manifest 기준으로 series를 병렬 복구한다.
+    """
+    with open(source_dir / SNAPSHOT_MANIFEST_NAME, "r") as f:
+        manifest = json.load(f)
+    entries = [
+        entry
+        for entry in manifest.get("entries", [])
+        if isinstance(entry, dict)
+        and entry.get("file")
+        and not entry.get("error")
+        and (not symbols or entry.get("symbol") in symbols)
+        and (not timeframes or entry.get("timeframe") in timeframes)
+    ]
+    write_api = client.write_api(write_options=SYNCHRONOUS)
+    query_api = client.query_api()
+    logger.info(f"[Restore] start series={len(entries)} source={source_dir}")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(
+            executor.map(
+                lambda entry: restore_series(write_api, query_api, entry, source_dir),
+                entries,
+            )
+        )
+
+    summary = _summarize(results)
+    logger.info(f"[Restore] done summary={summary}")
+    return {"entries": [asdict(result) for result in results], "summary": summary}
+
+
+def _summarize(results: list[SeriesSnapshotResult]) -> dict:
+    return {
+        "series": len(results),
+        "rows": sum(result.rows for result in results),
+        "verified": len([r for r in results if r.verified]),
+        "mismatched": len([r for r in results if not r.verified and not r.error]),
+        "failed": len([r for r in results if r.error]),
+    }
+
+
+def _parse_csv(raw: str | None) -> list[str] | None:
+    if not raw:
+        return None
+    values = [value.strip() for value in raw.split(",") if value.strip()]
+    return values or None
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Snapshot/restore the InfluxDB ohlcv store to/from Parquet."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = subparsers.add_parser("snapshot", help="Dump ohlcv series.")
+    snapshot_parser.add_argument(
+        "--dest",
+        default=None,
+        help=f"Output directory (default: {SNAPSHOT_ROOT_DIR}/<UTC timestamp>).",
+    )
+
+    restore_parser = subparsers.add_parser("restore", help="Load ohlcv series.")
+    restore_parser.add_argument(
+        "--source", required=True, help="Snapshot directory to restore."
+    )
+
+    for sub in (snapshot_parser, restore_parser):
+        sub.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_WORKERS,
+            help=f"Parallel series workers (default: {DEFAULT_WORKERS}).",
+        )
+        sub.add_argument("--symbols", default=None, help="Comma-separated filter.")
+        sub.add_argument(
+            "--timeframes", default=None, help="Comma-separated filter."
+        )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    if args.workers <= 0:
+        logger.error("[Snapshot] --workers must be a positive integer.")
+        return 2
+
+    symbols = _parse_csv(args.symbols)
+    timeframes = _parse_csv(args.timeframes)
+    client = _get_influx_client()
+    try:
+        if args.command == "snapshot":
+            dest_dir = (
+                Path(args.dest)
+                if args.dest
+                else SNAPSHOT_ROOT_DIR
+                / datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            )
+            result = run_snapshot(
+                client=client,
+                dest_dir=dest_dir,
+                workers=args.workers,
+                symbols=symbols,
+                timeframes=timeframes,
+            )
+        else:
+            result = run_restore(
+                client=client,
+                source_dir=Path(args.source),
+                workers=args.workers,
+                symbols=symbols,
+                timeframes=timeframes,
+            )
+    finally:
+        client.close()
+
+    summary = result["summary"]
+    if summary["failed"] > 0 or summary["mismatched"] > 0:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
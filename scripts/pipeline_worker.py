@@ -18,16 +18,30 @@ import json
 import os
 import shutil
 import sys
+import threading
 import time
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import requests
 import traceback
 from utils.logger import get_logger
-from utils.file_io import atomic_write_json
+from utils.file_io import (
+    atomic_link_or_copy,
+    atomic_write_bytes,
+    atomic_write_chunks,
+    atomic_write_json,
+    atomic_write_text,
+    consume_write_counts,
+    deferred_fsync,
+    file_sha256,
+    precompressed_sibling_paths,
+)
+from utils.inference_pool import RecyclingProcessPool
 from utils.ingest_state import IngestStateStore
+from utils.model_cache import ModelCache
 from utils.pipeline_contracts import (
     DetectionGateReason,
     DetectionGateDecision,
@@ -49,7 +63,20 @@ from utils.pipeline_contracts import (
     parse_utc_datetime,
 )
 from utils.pipeline_runtime_state import SymbolActivationStore
-from utils.prediction_status import evaluate_prediction_status
+from utils.prediction_memo import PredictionMemo
+from utils.prediction_status import (
+    evaluate_prediction_status,
+    prediction_file_candidates,
+    snapshot_from_updated_at,
+)
+from utils.publish_registry import PublishRegistry
+from utils.static_release import (
+    activate_release,
+    collect_release_sources,
+    prune_releases,
+    retire_releases,
+    stage_release,
+)
 from utils.time_alignment import (
     detect_timeframe_gaps,
     last_closed_candle_open,
@@ -73,6 +100,23 @@ from scripts.worker_config import (  # noqa: F401
     DISK_WATERMARK_WARN_PERCENT,
     FULL_BACKFILL_TOLERANCE_HOURS,
     FULL_HISTORY_EXPORT_TIMEFRAMES,
+    HISTORY_ARROW_EXPORT_ENABLED,
+    HISTORY_ARROW_SUFFIX,
+    HISTORY_EXPORT_BATCH_QUERY,
+    HISTORY_EXPORT_FLOAT_DECIMALS,
+    HISTORY_EXPORT_FORMAT,
+    HISTORY_EXPORT_FULL_RECONCILE_SECONDS,
+    HISTORY_EXPORT_MODE,
+    HISTORY_INDICATORS,
+    HISTORY_INDICATORS_ENABLED,
+    HISTORY_PYRAMID_DIRNAME,
+    HISTORY_PYRAMID_ENABLED,
+    HISTORY_PYRAMID_LEVELS,
+    HISTORY_SEGMENT_PERIOD_BY_TIMEFRAME,
+    HISTORY_SEGMENTS_DIRNAME,
+    HISTORY_SEGMENTS_ENABLED,
+    HISTORY_TAIL_CANDLES,
+    HISTORY_TAIL_ENABLED,
     INGEST_STATE_FILE,
     INGEST_WATERMARK_FILE,
     INFLUXDB_BUCKET,
@@ -82,22 +126,47 @@ from scripts.worker_config import (  # noqa: F401
     LOOKBACK_DAYS,
     LOOKBACK_MIN_ROWS_RATIO,
     MANIFEST_FILE,
+    MANIFEST_V2_DIRNAME,
+    MANIFEST_V2_ENABLED,
     MIN_SAMPLE_BY_TIMEFRAME,
+    MODEL_CACHE_MAX_MB,
+    MODEL_CACHE_PRELOAD,
     MODELS_DIR,
+    PREDICT_ENGINE,
+    PREDICT_FORECAST_TABLE_ENABLED,
+    PREDICT_INTERVAL_METHOD,
+    PREDICT_INTERVAL_SAMPLES,
+    PREDICT_PROCESS_MAX_RSS_MB,
+    PREDICT_PROCESS_MAX_TASKS,
+    PREDICT_PROCESS_WORKERS,
     PREDICTION_DISABLED_TIMEFRAMES,
     PREDICTION_HEALTH_FILE,
+    PREDICTION_MEMO_ENABLED,
+    PREDICTIONS_BUNDLE_ENABLED,
+    PREDICTIONS_BUNDLE_FILE,
     PRIMARY_TIMEFRAME,
+    PUBLISH_WORKERS,
     RETENTION_1M_DEFAULT_DAYS,
     RETENTION_1M_MAX_DAYS,
     RETENTION_ENFORCE_INTERVAL_SECONDS,
     RUNTIME_METRICS_FILE,
     RUNTIME_METRICS_WINDOW_SIZE,
     SERVE_ALLOWED_STATUSES,
+    STATIC_CURRENT_LINK_NAME,
     STATIC_DIR,
+    STATIC_PRECOMPRESS_ENABLED,
+    STATIC_RELEASES_DIRNAME,
+    STATIC_RELEASES_ENABLED,
+    STATIC_RELEASES_KEEP,
+    STATIC_SKIP_UNCHANGED_WRITES,
     SYMBOL_ACTIVATION_FILE,
     SYMBOL_ACTIVATION_SOURCE_TIMEFRAME,
     TARGET_COINS,
     TIMEFRAMES,
+    VALID_HISTORY_EXPORT_FORMATS,
+    VALID_HISTORY_EXPORT_MODES,
+    VALID_PREDICT_ENGINES,
+    VALID_PREDICT_INTERVAL_METHODS,
     VALID_WORKER_SCHEDULER_MODES,
     WORKER_SCHEDULER_MODE,
 )
@@ -116,6 +185,18 @@ from scripts.worker_scheduling import (  # noqa: F401
 
 logger = get_logger(__name__)
 
+# export/predict가 기록한 산출물 메타데이터. manifest가 파일 재읽기 대신 사용한다.
+publish_registry = PublishRegistry()
+# 역직렬화한 Prophet 모델. 파일 signature가 바뀌면(재학습) 다음 조회에서 다시 적재한다.
+model_cache = ModelCache(MODEL_CACHE_MAX_MB * 1024 * 1024)
+# series별 마지막 발행 forecast key(model_version, 예측 시작 경계). 같으면 재발행하지 않는다.
+prediction_memo = PredictionMemo()
+# Prophet predict를 실행할 자식 프로세스 pool. run_worker()가 PREDICT_PROCESS_WORKERS > 0일
+# 때만 만든다. None이면 predict는 이 프로세스에서 model_cache로 실행된다.
+inference_pool: RecyclingProcessPool | None = None
+# 병렬 publish에서 prediction health 파일(read-modify-write)과 전이 알림을 직렬화한다.
+_prediction_health_lock = threading.Lock()
+
 
 def _ctx():
     """
@@ -169,6 +250,7 @@ def _static_export_paths(
     symbol: str,
     timeframe: str,
     static_dir: Path | None = None,
+    suffix: str = ".json",
 ) -> tuple[Path, Path | None]:
     """
     정적 산출물 파일 경로를 반환한다.
@@ -182,18 +264,55 @@ def _static_export_paths(
       - symbol: 심볼
       - timeframe: 타임프레임 (1m, 1h, 1d, 1w, 1M)
       - static_dir: 정적 산출물 디렉토리
+      - suffix: 파일 확장자 (binary export는 `.arrow`)
     Returns:
       - tuple[Path, Path | None]: (canonical, legacy)
     """
     safe_symbol = symbol.replace("/", "_")
     resolved_static_dir = static_dir or STATIC_DIR
-    canonical = resolved_static_dir / f"{kind}_{safe_symbol}_{timeframe}.json"
-    legacy = resolved_static_dir / f"{kind}_{safe_symbol}.json"
+    canonical = resolved_static_dir / f"{kind}_{safe_symbol}_{timeframe}{suffix}"
+    legacy = resolved_static_dir / f"{kind}_{safe_symbol}{suffix}"
     if canonical == legacy:
         return canonical, None
     return canonical, legacy
 
 
+def _history_segment_dir(
+    symbol: str,
+    timeframe: str,
+    static_dir: Path | None = None,
+) -> Path:
+    """
+    history v2(segment + tail + index) 산출물 디렉토리를 반환한다.
+
+    Args:
+      - symbol: 심볼
+      - timeframe: 타임프레임
+      - static_dir: 정적 산출물 디렉토리
+    Returns:
+      - Path: `{static_dir}/history_v2/{safe_symbol}_{timeframe}`
+    """
+    safe_symbol = symbol.replace("/", "_")
+    resolved_static_dir = static_dir or STATIC_DIR
+    return resolved_static_dir / HISTORY_SEGMENTS_DIRNAME / f"{safe_symbol}_{timeframe}"
+
+
+def _history_pyramid_dir(
+    symbol: str,
+    timeframe: str,
+    static_dir: Path | None = None,
+) -> Path:
+    """
+    history pyramid(downsampled level) 산출물 디렉토리를 반환한다.
+
+    Returns:
+      - Path: `{static_dir}/history_pyramid/{safe_symbol}_{timeframe}`
+    """
+    safe_symbol = symbol.replace("/", "_")
+    resolved_static_dir = static_dir or STATIC_DIR
+    return resolved_static_dir / HISTORY_PYRAMID_DIRNAME / f"{safe_symbol}_{timeframe}"
+
+
 def prediction_enabled_for_timeframe(timeframe: str) -> bool:
     """
     timeframe별 prediction 생성 허용 여부.
@@ -367,7 +486,15 @@ def _save_watermark_entries(
         "updated_at": format_utc_datetime(datetime.now(timezone.utc)) or "",
         "entries": payload_entries,
     }
-    atomic_write_json(path, payload, indent=2)
+    # watermark가 전진하지 않은 idle cycle에는 파일을 다시 쓰지 않는다.
+    atomic_write_json(
+        path,
+        payload,
+        indent=2,
+        skip_unchanged=True,
+        ignore_keys=("updated_at",),
+        durable=True,
+    )
 
 
 def _parse_utc(text: str | None) -> datetime | None:
@@ -443,7 +570,8 @@ def _remove_static_exports_for_symbol(
     symbol: str, timeframes: list[str], *, static_dir: Path = STATIC_DIR
 ) -> None:
     """
-    심볼의 정적 산출물(history/prediction)을 제거한다.
+    심볼의 정적 산출물(history/history_tail/history_indicators/prediction, arrow,
+    history v2 segment, history pyramid)을 제거한다.
 
     Called from:
     - run_worker()에서 hidden_backfilling 심볼 처리 시점
@@ -452,19 +580,40 @@ def _remove_static_exports_for_symbol(
     - full backfill 전 심볼의 오노출을 fail-closed로 차단하기 위함이다.
     """
     for timeframe in timeframes:
-        for kind in ("history", "prediction"):
+        for kind, suffix in (
+            ("history", ".json"),
+            ("history", HISTORY_ARROW_SUFFIX),
+            ("history_tail", ".json"),
+            ("history_indicators", ".json"),
+            ("prediction", ".json"),
+        ):
             canonical_path, legacy_path = _static_export_paths(
-                kind, symbol, timeframe, static_dir=static_dir
+                kind, symbol, timeframe, static_dir=static_dir, suffix=suffix
             )
             for path in (canonical_path, legacy_path):
                 if path is None:
                     continue
-                try:
-                    path.unlink(missing_ok=True)
-                except OSError as e:
-                    logger.warning(
-                        f"[{symbol} {timeframe}] failed to remove static file {path}: {e}"
-                    )
+                for target in (path, *precompressed_sibling_paths(path)):
+                    try:
+                        target.unlink(missing_ok=True)
+                    except OSError as e:
+                        logger.warning(
+                            f"[{symbol} {timeframe}] failed to remove static file "
+                            f"{target}: {e}"
+                        )
+        for derived_dir in (
+            _history_segment_dir(symbol, timeframe, static_dir=static_dir),
+            _history_pyramid_dir(symbol, timeframe, static_dir=static_dir),
+        ):
+            if not derived_dir.exists():
+                continue
+            try:
+                shutil.rmtree(derived_dir)
+            except OSError as e:
+                logger.warning(
+                    f"[{symbol} {timeframe}] failed to remove history artifacts "
+                    f"{derived_dir}: {e}"
+                )
 
 
 def _load_runtime_metrics(path: Path = RUNTIME_METRICS_FILE) -> list[dict]:
@@ -627,6 +776,8 @@ def append_runtime_cycle_metrics(
     detection_gate_run_counts: dict[str, int] | None = None,
     boundary_tracking_mode: str = "poll_loop",
     missed_boundary_count: int | None = None,
+    static_write_counts: dict[str, int] | None = None,
+    model_cache_counts: dict[str, int | float] | None = None,
     path: Path = RUNTIME_METRICS_FILE,
     target_cycle_seconds: int = CYCLE_TARGET_SECONDS,
     window_size: int = RUNTIME_METRICS_WINDOW_SIZE,
@@ -670,6 +821,19 @@ def append_runtime_cycle_metrics(
         "detection_gate_run_counts": _normalize_source_counts(
             detection_gate_run_counts
         ),
+        # skip_unchanged 대상 정적/상태 파일의 written/skipped 횟수.
+        "static_write_counts": _normalize_source_counts(static_write_counts),
+        # 모델 cache hit/miss/eviction 횟수와 miss 적재 시간.
+        "model_cache_counts": _normalize_source_counts(
+            {
+                key: value
+                for key, value in (model_cache_counts or {}).items()
+                if key != "load_seconds"
+            }
+        ),
+        "model_load_seconds": round(
+            float((model_cache_counts or {}).get("load_seconds", 0.0)), 3
+        ),
     }
     entries.append(entry)
 
@@ -692,6 +856,14 @@ def append_runtime_cycle_metrics(
     detection_run_counts = _aggregate_reason_counts(
         entries, "detection_gate_run_counts"
     )
+    static_write_counts_total = _aggregate_reason_counts(
+        entries, "static_write_counts"
+    )
+    static_write_attempts = sum(static_write_counts_total.values())
+    model_cache_counts_total = _aggregate_reason_counts(entries, "model_cache_counts")
+    model_cache_lookups = model_cache_counts_total.get(
+        "hits", 0
+    ) + model_cache_counts_total.get("misses", 0)
     if resolved_boundary_mode == "boundary_scheduler":
         boundary_counts = [
             max(0, int(item.get("missed_boundary_count") or 0)) for item in entries
@@ -731,6 +903,24 @@ def append_runtime_cycle_metrics(
         "detection_gate_skip_events": sum(detection_skip_counts.values()),
         "detection_gate_run_counts": detection_run_counts,
         "detection_gate_run_events": sum(detection_run_counts.values()),
+        "static_write_counts": static_write_counts_total,
+        "static_write_skip_ratio": (
+            round(
+                static_write_counts_total.get("skipped", 0) / static_write_attempts,
+                4,
+            )
+            if static_write_attempts
+            else None
+        ),
+        "model_cache_counts": model_cache_counts_total,
+        "model_cache_hit_ratio": (
+            round(model_cache_counts_total.get("hits", 0) / model_cache_lookups, 4)
+            if model_cache_lookups
+            else None
+        ),
+        "model_load_seconds": round(
+            sum(float(item.get("model_load_seconds") or 0.0) for item in entries), 3
+        ),
     }
 
     payload = {
@@ -966,9 +1156,9 @@ def write_runtime_manifest(
     prediction_health_path: Path | None = None,
     symbol_activation_entries: dict[str, SymbolActivationSnapshot | dict] | None = None,
     path: Path | None = None,
-) -> None:
+) -> dict:
     """
-    runtime manifest 저장 래퍼.
+    runtime manifest 저장 래퍼. 생성한 manifest payload를 반환한다.
 
     Called from:
     - run_worker() export stage 완료 시점
@@ -982,7 +1172,7 @@ def write_runtime_manifest(
             elif isinstance(entry, dict):
                 serialized_activation_entries[symbol] = entry
 
-    export_ops.write_runtime_manifest(
+    return export_ops.write_runtime_manifest(
         _ctx(),
         symbols,
         timeframes,
@@ -994,6 +1184,35 @@ def write_runtime_manifest(
     )
 
 
+def write_predictions_bundle(
+    manifest: dict,
+    *,
+    static_dir: Path | None = None,
+    path: Path | None = None,
+) -> Path:
+    """
+    prediction bundle 저장 래퍼.
+
+    Called from:
+    - `_persist_cycle_runtime_state()` manifest 기록 직후
+    """
+    return export_ops.write_predictions_bundle(
+        _ctx(), manifest, static_dir=static_dir, path=path
+    )
+
+
+def write_runtime_manifest_v2(
+    manifest: dict, *, static_dir: Path | None = None
+) -> Path:
+    """
+    manifest v2(index + shard) 저장 래퍼.
+
+    Called from:
+    - `_persist_cycle_runtime_state()` manifest 기록 직후
+    """
+    return export_ops.write_runtime_manifest_v2(_ctx(), manifest, static_dir=static_dir)
+
+
 def _query_last_timestamp(query_api, query: str) -> datetime | None:
     """
     last timestamp 쿼리 래퍼.
@@ -1258,6 +1477,16 @@ def run_prediction_and_save(
     )
 
 
+def preload_models(symbols: list[str], timeframes: list[str]) -> int:
+    """
+    model cache preload 래퍼.
+
+    Called from:
+    - run_worker() 시작 시 1회
+    """
+    return predict_ops.preload_models(_ctx(), symbols, timeframes)
+
+
 def run_prediction_and_save_outcome(
     write_api,
     query_api,
@@ -1289,6 +1518,16 @@ def update_full_history_file(query_api, symbol, timeframe) -> bool:
     return export_ops.update_full_history_file(_ctx(), query_api, symbol, timeframe)
 
 
+def prefetch_history_frames(query_api, symbol: str, timeframes: list[str]) -> int:
+    """
+    symbol 단위 batch history 조회 래퍼.
+
+    Called from:
+    - `_run_symbol_timeframe_cycle_stages()` (HISTORY_EXPORT_BATCH_QUERY)
+    """
+    return export_ops.prefetch_history_frames(_ctx(), query_api, symbol, timeframes)
+
+
 @dataclass
 class WorkerPersistentState:
     """
@@ -1874,36 +2113,134 @@ def _run_publish_timeframe_step(
         if prediction_outcome.result == PredictionExecutionResult.SKIPPED:
             return
 
-        prediction_ok = prediction_outcome.result == PredictionExecutionResult.OK
-        health, was_degraded, is_degraded = upsert_prediction_health(
-            symbol,
-            timeframe,
-            prediction_ok=prediction_ok,
-            error=prediction_outcome.error,
+        # memo hit도 발행본이 유효한 성공이므로 prediction_health를 똑같이 갱신한다.
+        prediction_ok = prediction_outcome.result in (
+            PredictionExecutionResult.OK,
+            PredictionExecutionResult.MEMO_HIT,
         )
-        if is_degraded and not was_degraded:
-            logger.warning(
-                f"[{symbol} {timeframe}] prediction degraded: "
-                f"reason={health.get('last_error')}"
-            )
-            send_alert(
-                "[Predict Degraded] "
-                f"{symbol} {timeframe}\n"
-                f"reason={health.get('last_error')}\n"
-                f"last_success_at={health.get('last_success_at')}"
-            )
-        elif prediction_ok and was_degraded:
-            logger.info(f"[{symbol} {timeframe}] prediction recovered.")
-            send_alert(
-                "[Predict Recovery] "
-                f"{symbol} {timeframe}\n"
-                f"last_success_at={health.get('last_success_at')}"
+        with _prediction_health_lock:
+            health, was_degraded, is_degraded = upsert_prediction_health(
+                symbol,
+                timeframe,
+                prediction_ok=prediction_ok,
+                error=prediction_outcome.error,
             )
-        elif is_degraded:
-            logger.info(
-                f"[{symbol} {timeframe}] prediction still degraded "
-                f"(consecutive_failures={health.get('consecutive_failures')})"
+            if is_degraded and not was_degraded:
+                logger.warning(
+                    f"[{symbol} {timeframe}] prediction degraded: "
+                    f"reason={health.get('last_error')}"
+                )
+                send_alert(
+                    "[Predict Degraded] "
+                    f"{symbol} {timeframe}\n"
+                    f"reason={health.get('last_error')}\n"
+                    f"last_success_at={health.get('last_success_at')}"
+                )
+            elif prediction_ok and was_degraded:
+                logger.info(f"[{symbol} {timeframe}] prediction recovered.")
+                send_alert(
+                    "[Predict Recovery] "
+                    f"{symbol} {timeframe}\n"
+                    f"last_success_at={health.get('last_success_at')}"
+                )
+            elif is_degraded:
+                logger.info(
+                    f"[{symbol} {timeframe}] prediction still degraded "
+                    f"(consecutive_failures={health.get('consecutive_failures')})"
+                )
+
+
+def _merge_reason_counts(target: dict[str, int], source: dict[str, int]) -> None:
+    for reason, count in source.items():
+        target[reason] = target.get(reason, 0) + count
+
+
+def _run_publish_jobs_parallel(
+    jobs: list[tuple[str, str, SymbolActivationSnapshot]],
+    *,
+    write_api,
+    query_api,
+    cycle_now: datetime,
+    run_export_stage: bool,
+    run_predict_stage: bool,
+    state: WorkerPersistentState,
+    cycle_export_gate_skip_counts: dict[str, int],
+    cycle_predict_gate_skip_counts: dict[str, int],
+    max_workers: int,
+) -> None:
+    """
+    수집된 publish job(symbol, timeframe, activation)을 symbol 단위로 thread pool에서 실행한다.
+
+    Called from:
+    - `_run_symbol_timeframe_cycle_stages()` (PUBLISH_WORKERS > 1)
+
+    Why:
+    - publish는 Influx 조회/파일 write/Prophet predict 대기가 대부분이라 symbol 간
+      병렬화로 wall time을 줄일 수 있다.
+    - 같은 symbol의 timeframe은 timeframe 없는 legacy 경로(`history_{symbol}.json`,
+      `prediction_{symbol}.json` 등)를 함께 갱신한다. symbol 안에서는 job 순서대로 직렬
+      실행해 legacy 경로의 최종 내용이 직렬 경로와 같게(마지막 timeframe) 유지한다.
+    - job 1건 안에서는 기존과 같이 export -> predict 순서를 유지한다.
+    - gate skip count는 job별 dict에 모은 뒤 제출 순서대로 합산해 공유 dict 경합을 피한다.
+    - ingest는 이미 끝난 뒤라 watermark gate는 이번 cycle 값을 그대로 읽는다.
+    - 한 job이 실패해도 나머지 job은 끝까지 실행하고, 첫 예외를 다시 올려
+      직렬 경로와 같은 cycle 실패 처리를 탄다.
+    """
+    symbol_jobs: dict[str, list[tuple[str, SymbolActivationSnapshot]]] = {}
+    for symbol, timeframe, activation in jobs:
+        symbol_jobs.setdefault(symbol, []).append((timeframe, activation))
+
+    def _run_symbol_jobs(
+        symbol: str,
+        timeframe_jobs: list[tuple[str, SymbolActivationSnapshot]],
+    ) -> list[tuple[str, dict[str, int], dict[str, int], Exception | None]]:
+        results = []
+        for timeframe, symbol_activation in timeframe_jobs:
+            export_gate_skip_counts: dict[str, int] = {}
+            predict_gate_skip_counts: dict[str, int] = {}
+            error: Exception | None = None
+            try:
+                _run_publish_timeframe_step(
+                    write_api=write_api,
+                    query_api=query_api,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    cycle_now=cycle_now,
+                    symbol_activation=symbol_activation,
+                    run_export_stage=run_export_stage,
+                    run_predict_stage=run_predict_stage,
+                    state=state,
+                    cycle_export_gate_skip_counts=export_gate_skip_counts,
+                    cycle_predict_gate_skip_counts=predict_gate_skip_counts,
+                )
+            except Exception as e:
+                error = e
+            results.append(
+                (timeframe, export_gate_skip_counts, predict_gate_skip_counts, error)
             )
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(symbol_jobs))),
+        thread_name_prefix="publish",
+    ) as executor:
+        futures = [
+            (symbol, executor.submit(_run_symbol_jobs, symbol, timeframe_jobs))
+            for symbol, timeframe_jobs in symbol_jobs.items()
+        ]
+
+    first_error: BaseException | None = None
+    for symbol, future in futures:
+        for timeframe, export_counts, predict_counts, error in future.result():
+            if error is not None:
+                logger.error(f"[{symbol} {timeframe}] publish job failed: {error}")
+                if first_error is None:
+                    first_error = error
+                continue
+            _merge_reason_counts(cycle_export_gate_skip_counts, export_counts)
+            _merge_reason_counts(cycle_predict_gate_skip_counts, predict_counts)
+    if first_error is not None:
+        raise first_error
 
 
 def _persist_cycle_runtime_state(
@@ -1919,6 +2256,8 @@ def _persist_cycle_runtime_state(
     - ingest_state cursor/status는 ingest 단계에서 즉시 커밋된다.
     - 이 함수는 메모리 state(symbol_activation + ingest watermark)를 파일로 반영한다.
     - manifest 파일 반영은 이 함수 이후 상태를 기준으로 확인한다.
+    - prediction bundle은 방금 만든 manifest의 `serve_allowed`를 기준으로 묶는다.
+    - manifest v2(index + shard)도 같은 manifest payload를 나눠 기록한다.
     """
     if run_ingest_stage:
         try:
@@ -1932,8 +2271,9 @@ def _persist_cycle_runtime_state(
             send_alert(f"[Symbol Activation Error] {e}")
 
     if run_export_stage:
+        manifest = None
         try:
-            write_runtime_manifest(
+            manifest = write_runtime_manifest(
                 TARGET_COINS,
                 TIMEFRAMES,
                 symbol_activation_entries=state.symbol_activation_entries,
@@ -1942,6 +2282,104 @@ def _persist_cycle_runtime_state(
             logger.error(f"Runtime manifest update failed: {e}")
             send_alert(f"[Manifest Error] {e}")
 
+        if MANIFEST_V2_ENABLED and manifest is not None:
+            try:
+                write_runtime_manifest_v2(manifest)
+            except Exception as e:
+                logger.error(f"Runtime manifest v2 update failed: {e}")
+                send_alert(f"[Manifest V2 Error] {e}")
+
+        if PREDICTIONS_BUNDLE_ENABLED and manifest is not None:
+            try:
+                write_predictions_bundle(manifest)
+            except Exception as e:
+                logger.error(f"Predictions bundle update failed: {e}")
+                send_alert(f"[Predictions Bundle Error] {e}")
+
+
+def _stage_static_release(
+    cycle_now: datetime, *, static_dir: Path | None = None
+) -> Path | None:
+    """
+    이번 cycle의 공개 산출물을 release 디렉터리로 모은다. 실패하면 None.
+
+    Called from:
+    - run_worker() (STATIC_RELEASES_ENABLED, deferred fsync 구간 끝)
+
+    Why:
+    - manifest/bundle까지 기록된 뒤의 작업 디렉터리를 hard link로 고정해
+      cross-file로 일관된 snapshot을 만든다. worker 상태 파일은 담지 않는다.
+    """
+    resolved_static_dir = static_dir or STATIC_DIR
+    try:
+        sources = collect_release_sources(
+            resolved_static_dir,
+            file_prefixes=("history_", "prediction_"),
+            file_names=(MANIFEST_FILE.name, PREDICTIONS_BUNDLE_FILE.name),
+            directories=(
+                HISTORY_SEGMENTS_DIRNAME,
+                HISTORY_PYRAMID_DIRNAME,
+                MANIFEST_V2_DIRNAME,
+            ),
+            exclude_names=(PREDICTION_HEALTH_FILE.name,),
+        )
+        return stage_release(
+            resolved_static_dir,
+            resolved_static_dir / STATIC_RELEASES_DIRNAME,
+            sources,
+            cycle_now.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        )
+    except Exception as e:
+        logger.error(f"Static release staging failed: {e}")
+        send_alert(f"[Static Release Error] staging: {e}")
+        return None
+
+
+def _activate_static_release(
+    release_dir: Path, *, static_dir: Path | None = None
+) -> None:
+    """
+    `current` symlink를 새 release로 교체하고 오래된 release를 정리한다.
+
+    Called from:
+    - run_worker() (syncfs 이후)
+    """
+    resolved_static_dir = static_dir or STATIC_DIR
+    current_link = resolved_static_dir / STATIC_CURRENT_LINK_NAME
+    try:
+        activate_release(release_dir, current_link)
+        prune_releases(
+            resolved_static_dir / STATIC_RELEASES_DIRNAME,
+            STATIC_RELEASES_KEEP,
+            current_link,
+        )
+    except Exception as e:
+        logger.error(f"Static release activation failed: {e}")
+        send_alert(f"[Static Release Error] activation: {e}")
+
+
+def _retire_static_releases(*, static_dir: Path | None = None) -> None:
+    """
+    release 모드가 꺼져 있을 때 이전에 남은 `current`/release를 치운다.
+
+    Called from:
+    - run_worker() 시작 시 (export 단계를 돌리고 STATIC_RELEASES_ENABLED=false)
+
+    Why:
+    - nginx는 `current`가 있으면 그 snapshot을 우선 서빙한다. 모드를 끈 뒤에도 남아 있으면
+      갱신이 멈춘 snapshot이 계속 나가므로 작업 디렉터리 서빙으로 되돌린다.
+    """
+    resolved_static_dir = static_dir or STATIC_DIR
+    try:
+        if retire_releases(
+            resolved_static_dir / STATIC_RELEASES_DIRNAME,
+            resolved_static_dir / STATIC_CURRENT_LINK_NAME,
+        ):
+            logger.info("[Static Release] release mode disabled; retired current link")
+    except OSError as e:
+        logger.error(f"Static release retire failed: {e}")
+        send_alert(f"[Static Release Error] retire: {e}")
+
 
 def _run_symbol_timeframe_cycle_stages(
     *,
@@ -1967,8 +2405,101 @@ def _run_symbol_timeframe_cycle_stages(
 ) -> None:
     """
     cycle 내 symbol/timeframe ingest+publish 단계를 실행한다.
+
+    - PUBLISH_WORKERS > 1이면 ingest는 그대로 직렬로 돌리고, publish job만 모아
+      모든 ingest가 끝난 뒤 `_run_publish_jobs_parallel()`로 실행한다.
+    - HISTORY_EXPORT_BATCH_QUERY면 symbol의 ingest가 모두 끝난 뒤 export 대상
+      timeframe history를 한 번에 조회해 두고, 그 symbol의 publish job을 실행한다.
+    """
+    publish_jobs: list[tuple[str, str, SymbolActivationSnapshot]] = []
+    batch_history_query = HISTORY_EXPORT_BATCH_QUERY and run_export_stage
+    try:
+        _run_symbol_cycle_loops(
+            run_ingest_stage=run_ingest_stage,
+            run_publish_stage=run_publish_stage,
+            run_predict_stage=run_predict_stage,
+            run_export_stage=run_export_stage,
+            batch_history_query=batch_history_query,
+            write_api=write_api,
+            query_api=query_api,
+            activation_exchange=activation_exchange,
+            ingest_state_store=ingest_state_store,
+            scheduler_mode=scheduler_mode,
+            cycle_now=cycle_now,
+            active_timeframes=active_timeframes,
+            disk_level=disk_level,
+            disk_usage_percent=disk_usage_percent,
+            state=state,
+            publish_jobs=publish_jobs,
+            cycle_since_source_counts=cycle_since_source_counts,
+            cycle_detection_skip_counts=cycle_detection_skip_counts,
+            cycle_detection_run_counts=cycle_detection_run_counts,
+            cycle_export_gate_skip_counts=cycle_export_gate_skip_counts,
+            cycle_predict_gate_skip_counts=cycle_predict_gate_skip_counts,
+        )
+        if publish_jobs:
+            _run_publish_jobs_parallel(
+                publish_jobs,
+                write_api=write_api,
+                query_api=query_api,
+                cycle_now=cycle_now,
+                run_export_stage=run_export_stage,
+                run_predict_stage=run_predict_stage,
+                state=state,
+                cycle_export_gate_skip_counts=cycle_export_gate_skip_counts,
+                cycle_predict_gate_skip_counts=cycle_predict_gate_skip_counts,
+                max_workers=PUBLISH_WORKERS,
+            )
+    finally:
+        if batch_history_query:
+            export_ops.clear_history_prefetch()
+
+
+def _history_prefetch_timeframes(
+    jobs: list[tuple[str, str, SymbolActivationSnapshot]],
+    state: WorkerPersistentState,
+) -> list[str]:
+    """export가 실제로 돌 job(노출 중 + ingest watermark 있음)의 timeframe만 고른다."""
+    return [
+        timeframe
+        for symbol, timeframe, symbol_activation in jobs
+        if symbol_activation.visibility != SymbolVisibility.HIDDEN_BACKFILLING
+        and _resolve_watermark_datetime(
+            state.ingest_watermarks.get(_prediction_health_key(symbol, timeframe))
+        )
+        is not None
+    ]
+
+
+def _run_symbol_cycle_loops(
+    *,
+    run_ingest_stage: bool,
+    run_publish_stage: bool,
+    run_predict_stage: bool,
+    run_export_stage: bool,
+    batch_history_query: bool,
+    write_api,
+    query_api,
+    activation_exchange,
+    ingest_state_store: IngestStateStore,
+    scheduler_mode: str,
+    cycle_now: datetime,
+    active_timeframes: list[str],
+    disk_level: StorageGuardLevel,
+    disk_usage_percent: float | None,
+    state: WorkerPersistentState,
+    publish_jobs: list[tuple[str, str, SymbolActivationSnapshot]],
+    cycle_since_source_counts: dict[str, int],
+    cycle_detection_skip_counts: dict[str, int],
+    cycle_detection_run_counts: dict[str, int],
+    cycle_export_gate_skip_counts: dict[str, int],
+    cycle_predict_gate_skip_counts: dict[str, int],
+) -> None:
+    """
+    symbol별 ingest loop를 돌리고 publish를 즉시 실행하거나 `publish_jobs`에 모은다.
     """
     for symbol in TARGET_COINS:
+        symbol_jobs: list[tuple[str, str, SymbolActivationSnapshot]] = []
         (
             symbol_activation,
             exchange_earliest,
@@ -2021,6 +2552,10 @@ def _run_symbol_timeframe_cycle_stages(
             if not run_publish_stage:
                 continue
 
+            if PUBLISH_WORKERS > 1 or batch_history_query:
+                symbol_jobs.append((symbol, timeframe, symbol_activation))
+                continue
+
             _run_publish_timeframe_step(
                 write_api=write_api,
                 query_api=query_api,
@@ -2035,6 +2570,28 @@ def _run_symbol_timeframe_cycle_stages(
                 cycle_predict_gate_skip_counts=cycle_predict_gate_skip_counts,
             )
 
+        if batch_history_query:
+            prefetch_timeframes = _history_prefetch_timeframes(symbol_jobs, state)
+            if prefetch_timeframes:
+                prefetch_history_frames(query_api, symbol, prefetch_timeframes)
+        if PUBLISH_WORKERS > 1:
+            publish_jobs.extend(symbol_jobs)
+            continue
+        for job_symbol, timeframe, job_activation in symbol_jobs:
+            _run_publish_timeframe_step(
+                write_api=write_api,
+                query_api=query_api,
+                symbol=job_symbol,
+                timeframe=timeframe,
+                cycle_now=cycle_now,
+                symbol_activation=job_activation,
+                run_export_stage=run_export_stage,
+                run_predict_stage=run_predict_stage,
+                state=state,
+                cycle_export_gate_skip_counts=cycle_export_gate_skip_counts,
+                cycle_predict_gate_skip_counts=cycle_predict_gate_skip_counts,
+            )
+
 
 def _append_cycle_runtime_metrics_if_enabled(
     *,
@@ -2057,6 +2614,22 @@ def _append_cycle_runtime_metrics_if_enabled(
     """
     if not enabled:
         return
+    static_write_counts = consume_write_counts()
+    if any(static_write_counts.values()):
+        logger.info(
+            "[Writes] static write skipped=%s written=%s",
+            static_write_counts["skipped"],
+            static_write_counts["written"],
+        )
+    model_cache_counts = model_cache.consume_stats()
+    if model_cache_counts["hits"] or model_cache_counts["misses"]:
+        logger.info(
+            "[Model Cache] hits=%s misses=%s evictions=%s load_seconds=%s",
+            model_cache_counts["hits"],
+            model_cache_counts["misses"],
+            model_cache_counts["evictions"],
+            model_cache_counts["load_seconds"],
+        )
     try:
         append_runtime_cycle_metrics(
             started_at=started_at,
@@ -2072,6 +2645,8 @@ def _append_cycle_runtime_metrics_if_enabled(
                 "boundary_scheduler" if scheduler_mode == "boundary" else "poll_loop"
             ),
             missed_boundary_count=cycle_missed_boundary_count,
+            static_write_counts=static_write_counts,
+            model_cache_counts=model_cache_counts,
         )
     except Exception as metrics_error:
         logger.error("%s: %s", error_log_prefix, metrics_error)
@@ -2087,6 +2662,7 @@ def run_worker():
     3) publish stage(export/predict + watermark gate)
     4) runtime metrics 기록 및 sleep/overrun 처리
     """
+    global inference_pool
     scheduler_mode = WORKER_SCHEDULER_MODE
     if scheduler_mode not in VALID_WORKER_SCHEDULER_MODES:
         logger.warning(
@@ -2094,6 +2670,26 @@ def run_worker():
             scheduler_mode,
         )
         scheduler_mode = "poll_loop"
+    if HISTORY_EXPORT_MODE not in VALID_HISTORY_EXPORT_MODES:
+        logger.warning(
+            "[Export] unsupported HISTORY_EXPORT_MODE=%s, using full export.",
+            HISTORY_EXPORT_MODE,
+        )
+    if HISTORY_EXPORT_FORMAT not in VALID_HISTORY_EXPORT_FORMATS:
+        logger.warning(
+            "[Export] unsupported HISTORY_EXPORT_FORMAT=%s, using records format.",
+            HISTORY_EXPORT_FORMAT,
+        )
+    if PREDICT_ENGINE not in VALID_PREDICT_ENGINES:
+        logger.warning(
+            "[Predict] unsupported PREDICT_ENGINE=%s, using prophet.",
+            PREDICT_ENGINE,
+        )
+    if PREDICT_INTERVAL_METHOD not in VALID_PREDICT_INTERVAL_METHODS:
+        logger.warning(
+            "[Predict] unsupported PREDICT_INTERVAL_METHOD=%s, using sampling.",
+            PREDICT_INTERVAL_METHOD,
+        )
 
     # D-033: role/mode 실행 매트릭스를 제거하고 단일 실행 경로를 고정한다.
     run_ingest_stage = True
@@ -2138,6 +2734,36 @@ def run_worker():
             TIMEFRAMES,
         )
 
+    if PREDICT_PROCESS_WORKERS > 0 and run_predict_stage:
+        # 자식 프로세스는 각자 model cache를 가지며 task 수/RSS 상한으로 교체된다.
+        # 어느 자식이 어떤 series를 받을지 정해져 있지 않으므로 preload는 하지 않는다.
+        inference_pool = RecyclingProcessPool(
+            PREDICT_PROCESS_WORKERS,
+            max_tasks_per_child=PREDICT_PROCESS_MAX_TASKS,
+            max_rss_bytes=PREDICT_PROCESS_MAX_RSS_MB * 1024 * 1024,
+            initializer=predict_ops.init_inference_worker,
+            initargs=(MODEL_CACHE_MAX_MB * 1024 * 1024,),
+        )
+        logger.info(
+            "[Predict Pool] %s processes (max_tasks=%s, max_rss_mb=%s)",
+            PREDICT_PROCESS_WORKERS,
+            PREDICT_PROCESS_MAX_TASKS,
+            PREDICT_PROCESS_MAX_RSS_MB,
+        )
+    elif MODEL_CACHE_PRELOAD and run_predict_stage:
+        preload_started = time.time()
+        preloaded = preload_models(TARGET_COINS, TIMEFRAMES)
+        logger.info(
+            "[Model Cache] preloaded %s models in %.2fs",
+            preloaded,
+            time.time() - preload_started,
+        )
+        # preload 적재는 cycle 메트릭(miss)에 섞지 않는다.
+        model_cache.consume_stats()
+
+    if run_export_stage and not STATIC_RELEASES_ENABLED:
+        _retire_static_releases()
+
     send_alert("Worker Started.")
 
     while True:
@@ -2243,33 +2869,42 @@ def run_worker():
                     logger.error(f"[Retention] enforcement failed: {e}")
                     send_alert(f"[Retention Error] {e}")
 
-            _run_symbol_timeframe_cycle_stages(
-                run_ingest_stage=run_ingest_stage,
-                run_publish_stage=run_publish_stage,
-                run_predict_stage=run_predict_stage,
-                run_export_stage=run_export_stage,
-                write_api=write_api,
-                query_api=query_api,
-                activation_exchange=activation_exchange,
-                ingest_state_store=ingest_state_store,
-                scheduler_mode=scheduler_mode,
-                cycle_now=cycle_now,
-                active_timeframes=active_timeframes,
-                disk_level=disk_level,
-                disk_usage_percent=disk_usage_percent,
-                state=state,
-                cycle_since_source_counts=cycle_since_source_counts,
-                cycle_detection_skip_counts=cycle_detection_skip_counts,
-                cycle_detection_run_counts=cycle_detection_run_counts,
-                cycle_export_gate_skip_counts=cycle_export_gate_skip_counts,
-                cycle_predict_gate_skip_counts=cycle_predict_gate_skip_counts,
-            )
+            # release 모드: cycle 동안 파일별 fsync를 미루고, release를 모은 뒤
+            # syncfs 1회로 flush한 다음 `current`를 교체한다.
+            release_cycle = STATIC_RELEASES_ENABLED and run_export_stage
+            staged_release: Path | None = None
+            with deferred_fsync(STATIC_DIR if release_cycle else None):
+                _run_symbol_timeframe_cycle_stages(
+                    run_ingest_stage=run_ingest_stage,
+                    run_publish_stage=run_publish_stage,
+                    run_predict_stage=run_predict_stage,
+                    run_export_stage=run_export_stage,
+                    write_api=write_api,
+                    query_api=query_api,
+                    activation_exchange=activation_exchange,
+                    ingest_state_store=ingest_state_store,
+                    scheduler_mode=scheduler_mode,
+                    cycle_now=cycle_now,
+                    active_timeframes=active_timeframes,
+                    disk_level=disk_level,
+                    disk_usage_percent=disk_usage_percent,
+                    state=state,
+                    cycle_since_source_counts=cycle_since_source_counts,
+                    cycle_detection_skip_counts=cycle_detection_skip_counts,
+                    cycle_detection_run_counts=cycle_detection_run_counts,
+                    cycle_export_gate_skip_counts=cycle_export_gate_skip_counts,
+                    cycle_predict_gate_skip_counts=cycle_predict_gate_skip_counts,
+                )
 
-            _persist_cycle_runtime_state(
-                run_ingest_stage=run_ingest_stage,
-                run_export_stage=run_export_stage,
-                state=state,
-            )
+                _persist_cycle_runtime_state(
+                    run_ingest_stage=run_ingest_stage,
+                    run_export_stage=run_export_stage,
+                    state=state,
+                )
+                if release_cycle:
+                    staged_release = _stage_static_release(cycle_now)
+            if staged_release is not None:
+                _activate_static_release(staged_release)
 
             if run_publish_stage:
                 if cycle_predict_gate_skip_counts:
@@ -9,6 +9,7 @@ Why this file exists:
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import hashlib
 import os
 from datetime import datetime, timezone
@@ -21,14 +22,36 @@ from influxdb_client import InfluxDBClient
 from scripts.data_extractor import extract_ohlcv_to_parquet, _get_influx_client
 from prophet.serialize import model_to_json
 
-from utils.file_io import atomic_write_json
+from utils.file_io import (
+    atomic_link_or_copy,
+    atomic_write_bytes,
+    atomic_write_json,
+    atomic_write_text,
+)
 from utils.config import PRIMARY_TIMEFRAME, TARGET_SYMBOLS
+from utils.forecast_table import (
+    FORECAST_STEPS,
+    ForecastTable,
+    encode_forecast_table,
+    forecast_table_from_frame,
+    forecast_table_path,
+)
+from utils.prophet_numpy import (
+    COMPACT_MODEL_FORMAT_VERSION,
+    UnsupportedProphetModel,
+    compact_model_path,
+    encode_prophet_params,
+    extract_prophet_params,
+)
+from utils.time_alignment import next_timeframe_boundary, timeframe_to_pandas_freq
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 MODELS_DIR = BASE_DIR / "models"
 STATIC_DIR = BASE_DIR / "static_data"
 DEFAULT_LOOKBACK_LIMIT = 500
 DEFAULT_MLFLOW_EXPERIMENT = "coin-train"
+# 학습 직후 미리 계산해 둘 미래 예측 구간(일). 0이면 forecast table을 만들지 않는다.
+DEFAULT_FORECAST_HORIZON_DAYS = 90
 
 
 def _parse_csv(raw: str | None, *, default: list[str]) -> list[str]:
@@ -134,6 +157,37 @@ def _prepare_prophet_train_df(df: pd.DataFrame) -> pd.DataFrame:
     return train_df
 
 
+def _build_forecast_table(
+    model: Any,
+    *,
+    timeframe: str,
+    last_candle_open: Any,
+    horizon_days: int,
+    model_version: str,
+) -> ForecastTable:
+    """
+    학습 데이터 마지막 candle 다음 경계부터 horizon만큼의 예측을 미리 계산한다.
+
+    publish는 24 step을 잘라 쓰므로 horizon 끝 시점에서도 24행이 남도록 늘려 잡는다.
+    """
+    start = next_timeframe_boundary(
+        pd.Timestamp(last_candle_open).to_pydatetime(), timeframe
+    )
+    freq = timeframe_to_pandas_freq(timeframe)
+    horizon_steps = len(
+        pd.date_range(start=start, end=start + pd.Timedelta(days=horizon_days), freq=freq)
+    )
+    future = pd.DataFrame(
+        {
+            "ds": pd.date_range(
+                start=start, periods=horizon_steps + FORECAST_STEPS - 1, freq=freq
+            )
+        }
+    )
+    future["ds"] = future["ds"].dt.tz_localize(None)
+    return forecast_table_from_frame(model.predict(future), model_version)
+
+
 def _build_model_metadata(
     *,
     run_id: str,
@@ -144,6 +198,7 @@ def _build_model_metadata(
     model_version: str | None,
     snapshot_path: Path,
     status: str,
+    compact_model: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     return {
         "schema_version": 1,
@@ -156,6 +211,7 @@ def _build_model_metadata(
         "model_version": model_version,
         "snapshot_path": str(snapshot_path),
         "status": status,
+        "compact_model": compact_model,
     }
 
 
@@ -166,6 +222,7 @@ def train_and_save(
     lookback_limit: int,
     client: InfluxDBClient,
     mlflow: Any,
+    forecast_horizon_days: int = DEFAULT_FORECAST_HORIZON_DAYS,
 ) -> dict[str, Any]:
     print(f"[{symbol}] 모델 학습 시작...")
     run_name = f"{symbol.replace('/', '_')}__{timeframe}"
@@ -224,11 +281,52 @@ def train_and_save(
         model_version = hashlib.sha256(serialized_model.encode("utf-8")).hexdigest()[
             :12
         ]
-        with open(canonical_path, "w") as fout:
-            fout.write(serialized_model)
+        # 한 번만 기록하고 legacy는 hard link(불가하면 copy)로 발행한다.
+        atomic_write_text(canonical_path, serialized_model)
         if legacy_path is not None:
-            with open(legacy_path, "w") as fout:
-                fout.write(serialized_model)
+            atomic_link_or_copy(canonical_path, legacy_path)
+
+        # publish가 predict 대신 잘라 쓸 forecast table. meta의 model_version과
+        # 일치할 때만 쓰이므로 meta보다 먼저 기록한다.
+        table_paths: list[Path] = []
+        if forecast_horizon_days > 0:
+            table = _build_forecast_table(
+                model,
+                timeframe=timeframe,
+                last_candle_open=df["timestamp"].max(),
+                horizon_days=forecast_horizon_days,
+                model_version=model_version,
+            )
+            table_paths.append(forecast_table_path(canonical_path))
+            atomic_write_bytes(table_paths[0], encode_forecast_table(table))
+            if legacy_path is not None:
+                table_paths.append(forecast_table_path(legacy_path))
+                atomic_link_or_copy(table_paths[0], table_paths[1])
+            mlflow.log_metric("forecast_table_rows", len(table.ds_ns))
+
+        # numpy engine이 모델 JSON 대신 읽는 compact artifact(학습 파라미터만).
+        # table과 같은 이유로 meta보다 먼저 기록한다.
+        compact_paths: list[Path] = []
+        compact_model: dict[str, Any] | None = None
+        try:
+            params = extract_prophet_params(model)
+        except UnsupportedProphetModel as e:
+            print(f"[{symbol}] compact 모델 생략: {e}")
+        else:
+            compact_bytes = encode_prophet_params(
+                dataclasses.replace(params, model_version=model_version)
+            )
+            compact_paths.append(compact_model_path(canonical_path))
+            atomic_write_bytes(compact_paths[0], compact_bytes)
+            if legacy_path is not None:
+                compact_paths.append(compact_model_path(legacy_path))
+                atomic_link_or_copy(compact_paths[0], compact_paths[1])
+            compact_model = {
+                "format_version": COMPACT_MODEL_FORMAT_VERSION,
+                "version": hashlib.sha256(compact_bytes).hexdigest()[:12],
+                "size_bytes": len(compact_bytes),
+            }
+            mlflow.log_metric("compact_model_bytes", len(compact_bytes))
 
         metadata = _build_model_metadata(
             run_id=run_id,
@@ -239,19 +337,22 @@ def train_and_save(
             model_version=model_version,
             snapshot_path=parquet_path,
             status="ok",
+            compact_model=compact_model,
         )
         canonical_meta_path, legacy_meta_path = _resolve_model_metadata_paths(
             symbol, timeframe
         )
         atomic_write_json(canonical_meta_path, metadata, indent=2)
         if legacy_meta_path is not None:
-            atomic_write_json(legacy_meta_path, metadata, indent=2)
+            atomic_link_or_copy(canonical_meta_path, legacy_meta_path)
 
         mlflow.log_param("model_version", model_version)
         mlflow.log_dict(metadata, "run_metadata.json")
         mlflow.log_artifact(str(canonical_path), artifact_path="models")
         if legacy_path is not None:
             mlflow.log_artifact(str(legacy_path), artifact_path="models")
+        for sidecar_path in table_paths + compact_paths:
+            mlflow.log_artifact(str(sidecar_path), artifact_path="models")
         mlflow.log_artifact(str(canonical_meta_path), artifact_path="models")
         if legacy_meta_path is not None:
             mlflow.log_artifact(str(legacy_meta_path), artifact_path="models")
@@ -268,6 +369,7 @@ def run_training_job(
     symbols: list[str],
     timeframes: list[str],
     lookback_limit: int,
+    forecast_horizon_days: int = DEFAULT_FORECAST_HORIZON_DAYS,
 ) -> dict[str, Any]:
     mlflow = _load_mlflow_module()
     tracking_uri = _resolve_mlflow_tracking_uri()
@@ -293,6 +395,7 @@ def run_training_job(
                         lookback_limit=lookback_limit,
                         client=client,
                         mlflow=mlflow,
+                        forecast_horizon_days=forecast_horizon_days,
                     )
                     results.append(result)
                 except Exception as exc:
@@ -359,6 +462,17 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=_parse_env_int("TRAIN_LOOKBACK_LIMIT", default=DEFAULT_LOOKBACK_LIMIT),
         help=f"OHLCV candle lookback size (default: {DEFAULT_LOOKBACK_LIMIT}).",
     )
+    parser.add_argument(
+        "--forecast-horizon-days",
+        type=int,
+        default=_parse_env_int(
+            "TRAIN_FORECAST_HORIZON_DAYS", default=DEFAULT_FORECAST_HORIZON_DAYS
+        ),
+        help=(
+            "Days of future forecast to precompute next to each model "
+            f"(0 disables, default: {DEFAULT_FORECAST_HORIZON_DAYS})."
+        ),
+    )
     return parser
 
 
@@ -380,7 +494,10 @@ def main(argv: list[str] | None = None) -> int:
         % (symbols, timeframes, lookback_limit)
     )
     summary = run_training_job(
-        symbols=symbols, timeframes=timeframes, lookback_limit=lookback_limit
+        symbols=symbols,
+        timeframes=timeframes,
+        lookback_limit=lookback_limit,
+        forecast_horizon_days=args.forecast_horizon_days,
     )
     if summary["failed"] > 0:
         print("[Train] completed_with_partial_failures")
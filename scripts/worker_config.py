@@ -13,7 +13,13 @@ Note:
 import os
 from pathlib import Path
 
-from utils.config import INGEST_TIMEFRAMES, PRIMARY_TIMEFRAME, TARGET_SYMBOLS
+from utils.config import (
+    INGEST_TIMEFRAMES,
+    PRIMARY_TIMEFRAME,
+    TARGET_SYMBOLS,
+    _parse_bool_env,
+)
+from utils.indicators import parse_indicator_specs
 
 # ── InfluxDB ──
 INFLUXDB_URL = os.getenv("INFLUXDB_URL")
@@ -46,6 +52,7 @@ FULL_HISTORY_EXPORT_TIMEFRAMES = {"1d", "1w", "1M"}
 INGEST_STATE_FILE = STATIC_DIR / "ingest_state.json"
 PREDICTION_HEALTH_FILE = STATIC_DIR / "prediction_health.json"
 MANIFEST_FILE = STATIC_DIR / "manifest.json"
+PREDICTIONS_BUNDLE_FILE = STATIC_DIR / "predictions_bundle.json"
 RUNTIME_METRICS_FILE = STATIC_DIR / "runtime_metrics.json"
 SYMBOL_ACTIVATION_FILE = STATIC_DIR / "symbol_activation.json"
 INGEST_WATERMARK_FILE = STATIC_DIR / "ingest_watermarks.json"
@@ -92,3 +99,165 @@ MIN_SAMPLE_BY_TIMEFRAME: dict[str, int] = {
 # ── Scheduler ──
 WORKER_SCHEDULER_MODE = os.getenv("WORKER_SCHEDULER_MODE", "boundary").strip().lower()
 VALID_WORKER_SCHEDULER_MODES = {"poll_loop", "boundary"}
+
+# ── Publish parallelism ──
+# publish(export+predict) 단계를 symbol 단위로 병렬 실행할 worker 수.
+# 같은 symbol의 timeframe은 legacy 경로를 공유하므로 한 worker 안에서 직렬로 돈다.
+# 1이면 기존처럼 ingest 직후 같은 loop에서 직렬 실행한다.
+PUBLISH_WORKERS = max(1, int(os.getenv("PUBLISH_WORKERS", "1")))
+
+# ── Prophet model cache ──
+# publish 단계가 역직렬화한 모델을 프로세스 메모리에 유지하는 예산(MB, 모델 JSON 크기 기준).
+# 0이면 cache를 끄고 매번 모델 파일을 다시 적재한다.
+MODEL_CACHE_MAX_MB = max(0, int(os.getenv("MODEL_CACHE_MAX_MB", "512")))
+# worker 시작 시 예측 대상 모델을 미리 적재해 첫 cycle에서도 적재 비용을 치르지 않는다.
+MODEL_CACHE_PRELOAD = _parse_bool_env(os.getenv("MODEL_CACHE_PRELOAD"), default=True)
+
+# ── Prediction engine ──
+# prophet: `Prophet.predict`(기본값).
+# numpy: 학습 파라미터로 trend/seasonality/구간을 직접 평가한다(utils.prophet_numpy).
+#        holiday/regressor/logistic 모델은 자동으로 prophet 경로를 탄다.
+PREDICT_ENGINE = os.getenv("PREDICT_ENGINE", "prophet").strip().lower()
+VALID_PREDICT_ENGINES = {"prophet", "numpy"}
+# numpy engine 구간 계산: sampling(Prophet과 같은 시뮬레이션) 또는 analytic(정규 근사).
+PREDICT_INTERVAL_METHOD = (
+    os.getenv("PREDICT_INTERVAL_METHOD", "sampling").strip().lower()
+)
+VALID_PREDICT_INTERVAL_METHODS = {"sampling", "analytic"}
+# sampling 샘플 수. 0이면 모델의 uncertainty_samples(Prophet 기본 1000)를 쓴다.
+PREDICT_INTERVAL_SAMPLES = max(0, int(os.getenv("PREDICT_INTERVAL_SAMPLES", "0")))
+
+# ── Precomputed forecast tables ──
+# train_model이 모델 옆에 남긴 `.forecast.npz`가 이번 구간을 덮으면 predict 대신 잘라 쓴다.
+# 표가 없거나 horizon 밖이면 실시간 예측으로 되돌아간다.
+PREDICT_FORECAST_TABLE_ENABLED = _parse_bool_env(
+    os.getenv("PREDICT_FORECAST_TABLE_ENABLED"), default=True
+)
+
+# ── Prediction memo ──
+# 같은 (model_version, 예측 시작 경계)로 이미 발행했으면 추론/정적 write/Influx write를 건너뛴다.
+PREDICTION_MEMO_ENABLED = _parse_bool_env(
+    os.getenv("PREDICTION_MEMO_ENABLED"), default=True
+)
+
+# ── Prediction process pool ──
+# Prophet predict(CPU-bound)를 실행할 spawn 자식 프로세스 수. 0이면 worker 프로세스에서
+# 직접 실행한다(기존 동작). 여러 series를 동시에 predict하려면 PUBLISH_WORKERS도 함께 올린다.
+PREDICT_PROCESS_WORKERS = max(0, int(os.getenv("PREDICT_PROCESS_WORKERS", "0")))
+# 자식 1개가 처리할 predict 수. 넘으면 새 자식으로 교체한다(0이면 무제한).
+PREDICT_PROCESS_MAX_TASKS = max(0, int(os.getenv("PREDICT_PROCESS_MAX_TASKS", "500")))
+# predict 직후 자식 RSS가 이를 넘으면 진행 중 task가 끝난 뒤 pool을 교체한다(0이면 검사 안 함).
+PREDICT_PROCESS_MAX_RSS_MB = max(
+    0, int(os.getenv("PREDICT_PROCESS_MAX_RSS_MB", "1536"))
+)
+
+# ── History export ──
+# full: 매 publish마다 export 범위 전체 재조회(기본값).
+# incremental: 마지막 export 이후 candle만 조회해 기존 산출물에 이어 붙인다.
+HISTORY_EXPORT_MODE = os.getenv("HISTORY_EXPORT_MODE", "full").strip().lower()
+VALID_HISTORY_EXPORT_MODES = {"full", "incremental"}
+# incremental 모드에서도 이 주기마다 full 재조회로 누적 drift를 정리한다.
+HISTORY_EXPORT_FULL_RECONCILE_SECONDS = int(
+    os.getenv("HISTORY_EXPORT_FULL_RECONCILE_SECONDS", str(6 * 60 * 60))
+)
+# publish 단계에서 symbol의 timeframe history를 Flux 한 번(timeframe tag group)으로 받아
+# series별로 나눠 export한다. 켜면 symbol의 publish는 해당 symbol ingest가 모두 끝난 뒤 돈다.
+HISTORY_EXPORT_BATCH_QUERY = _parse_bool_env(
+    os.getenv("HISTORY_EXPORT_BATCH_QUERY"), default=False
+)
+# records: `data: [{timestamp, open, ...}]`(기본, 기존 계약).
+# columnar: `start/step`(또는 `time`) + open/high/low/close/volume 배열.
+HISTORY_EXPORT_FORMAT = os.getenv("HISTORY_EXPORT_FORMAT", "records").strip().lower()
+VALID_HISTORY_EXPORT_FORMATS = {"records", "columnar"}
+# columnar float 반올림 자릿수. 비우면 원값(repr) 그대로 쓴다.
+_history_float_decimals_raw = os.getenv("HISTORY_EXPORT_FLOAT_DECIMALS", "").strip()
+HISTORY_EXPORT_FLOAT_DECIMALS = (
+    int(_history_float_decimals_raw) if _history_float_decimals_raw else None
+)
+
+# ── History tail feed ──
+# 마지막 K개 candle + sequence만 담은 `history_tail_*` 파일을 history와 함께 발행한다.
+# polling 클라이언트는 전체 history 대신 이 파일만 받아 최신 candle을 갱신한다.
+HISTORY_TAIL_ENABLED = _parse_bool_env(os.getenv("HISTORY_TAIL_ENABLED"), default=True)
+HISTORY_TAIL_CANDLES = max(1, int(os.getenv("HISTORY_TAIL_CANDLES", "200")))
+
+# ── History binary export ──
+# JSON과 같은 이름 규칙으로 Arrow IPC stream(`.arrow`)을 함께 발행한다(opt-in).
+HISTORY_ARROW_EXPORT_ENABLED = _parse_bool_env(
+    os.getenv("HISTORY_ARROW_EXPORT_ENABLED"), default=False
+)
+HISTORY_ARROW_SUFFIX = ".arrow"
+
+# ── History segments (export format v2) ──
+# 닫힌 기간(month/year) segment + mutable tail + index를 legacy 단일 파일과 병행 발행한다.
+HISTORY_SEGMENTS_ENABLED = _parse_bool_env(
+    os.getenv("HISTORY_SEGMENTS_ENABLED"), default=False
+)
+HISTORY_SEGMENTS_DIRNAME = "history_v2"
+# timeframe별 segment 기간. 목록에 없으면 month.
+HISTORY_SEGMENT_PERIOD_BY_TIMEFRAME = {"1d": "year", "1w": "year", "1M": "year"}
+
+# ── History pyramid (downsampled levels) ──
+# point budget별 축소본(OHLCV bucket + close LTTB)을 발행한다(opt-in).
+# candle 수가 budget 이하인 level은 만들지 않는다.
+HISTORY_PYRAMID_ENABLED = _parse_bool_env(
+    os.getenv("HISTORY_PYRAMID_ENABLED"), default=False
+)
+HISTORY_PYRAMID_DIRNAME = "history_pyramid"
+HISTORY_PYRAMID_LEVELS = sorted(
+    {
+        int(value.strip())
+        for value in os.getenv("HISTORY_PYRAMID_LEVELS", "2000,500").split(",")
+        if value.strip()
+    },
+    reverse=True,
+)
+
+# ── History indicator sidecars ──
+# history와 함께 기술 지표(`history_indicators_*`)를 발행한다(opt-in).
+# spec 형식은 `{kind}_{period}`(sma/ema/rsi/atr/bb), 잘못된 값이면 import 시 ValueError.
+HISTORY_INDICATORS_ENABLED = _parse_bool_env(
+    os.getenv("HISTORY_INDICATORS_ENABLED"), default=False
+)
+HISTORY_INDICATORS = parse_indicator_specs(
+    os.getenv("HISTORY_INDICATORS", "sma_20,sma_50,ema_20,rsi_14,atr_14,bb_20")
+)
+
+# ── Prediction bundle ──
+# cycle 종료 시 serve_allowed series의 forecast를 `predictions_bundle.json` 하나로 묶는다.
+PREDICTIONS_BUNDLE_ENABLED = _parse_bool_env(
+    os.getenv("PREDICTIONS_BUNDLE_ENABLED"), default=True
+)
+
+# ── Manifest v2 (sharded) ──
+# `manifest_v2/index.json`(summary + shard 목록/hash) + symbol별 shard를 v1 manifest와
+# 함께 발행한다(opt-in). 내용이 바뀐 shard만 다시 쓴다.
+MANIFEST_V2_ENABLED = _parse_bool_env(os.getenv("MANIFEST_V2_ENABLED"), default=False)
+MANIFEST_V2_DIRNAME = "manifest_v2"
+
+# ── Skip-if-unchanged writes ──
+# history/segment/arrow/manifest는 내용(volatile timestamp 제외)이 같으면 다시 쓰지 않는다.
+# prediction 파일은 updated_at이 freshness 판정 기준이라 대상에서 제외한다.
+STATIC_SKIP_UNCHANGED_WRITES = _parse_bool_env(
+    os.getenv("STATIC_SKIP_UNCHANGED_WRITES"), default=True
+)
+
+# ── Static precompression ──
+# 공개 산출물(history/segment/prediction/manifest)에 `.gz`(+brotli 설치 시 `.br`)
+# sibling을 함께 기록해 nginx `gzip_static`이 요청마다 압축하지 않게 한다.
+STATIC_PRECOMPRESS_ENABLED = _parse_bool_env(
+    os.getenv("STATIC_PRECOMPRESS_ENABLED"), default=True
+)
+
+# ── Static releases ──
+# export cycle이 끝나면 공개 산출물을 `releases/<id>/`에 hard link로 모으고
+# `current` symlink를 한 번에 교체한다(opt-in). 이 모드에서는 파일별 fsync 대신
+# cycle당 syncfs 1회로 flush한다. nginx는 `current`가 있으면 그 안의 파일을 우선 서빙하고,
+# 끄면 worker가 시작 시 `current`를 지워 작업 디렉터리 서빙으로 되돌린다.
+STATIC_RELEASES_ENABLED = _parse_bool_env(
+    os.getenv("STATIC_RELEASES_ENABLED"), default=False
+)
+STATIC_RELEASES_DIRNAME = "releases"
+STATIC_CURRENT_LINK_NAME = "current"
+# 유지할 최신 release 수(current는 항상 유지).
+STATIC_RELEASES_KEEP = max(1, int(os.getenv("STATIC_RELEASES_KEEP", "3")))
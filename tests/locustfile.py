@@ -157,6 +157,15 @@ class BaselineLoadUser(_BaseLoadUser):
             required_keys=("symbol", "timeframe", "forecast"),
         )
 
+    @tag("baseline")
+    @task(1)
+    def predictions_bundle_baseline(self):
+        self._request_static_json(
+            "/static/predictions_bundle.json",
+            name="/static/predictions_bundle.json",
+            required_keys=("entries", "entry_count"),
+        )
+
 
 class StressLoadUser(_BaseLoadUser):
     wait_time = between(0.1, 0.5)
@@ -2,7 +2,7 @@ import json
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 import api.main as api_main
 
@@ -60,7 +60,7 @@ def test_check_status_returns_503_when_file_is_missing(tmp_path, monkeypatch):
     monkeypatch.setattr(api_main, "STATIC_DIR", tmp_path)
 
     with pytest.raises(HTTPException) as exc:
-        api_main.check_status("BTC/USDT")
+        api_main.check_status("BTC/USDT", response=Response())
 
     assert exc.value.status_code == 503
     assert exc.value.detail == "Not initialized yet."
@@ -72,7 +72,7 @@ def test_check_status_returns_503_on_corrupted_json(tmp_path, monkeypatch):
     path.write_text("{this-is-not-json")
 
     with pytest.raises(HTTPException) as exc:
-        api_main.check_status("BTC/USDT")
+        api_main.check_status("BTC/USDT", response=Response())
 
     assert exc.value.status_code == 503
     assert exc.value.detail == "Data corruption detected"
@@ -85,7 +85,7 @@ def test_check_status_returns_503_for_invalid_updated_at_format(
     _write_prediction_file(tmp_path, "BTC/USDT", {"updated_at": "bad-format"})
 
     with pytest.raises(HTTPException) as exc:
-        api_main.check_status("BTC/USDT")
+        api_main.check_status("BTC/USDT", response=Response())
 
     assert exc.value.status_code == 503
     assert exc.value.detail == "Invalid data format"
@@ -107,7 +107,7 @@ def test_check_status_returns_fresh_state(tmp_path, monkeypatch):
     _write_prediction_file(
         tmp_path, "BTC/USDT", {"updated_at": now.strftime("%Y-%m-%dT%H:%M:%SZ")}
     )
-    response = api_main.check_status("BTC/USDT")
+    response = api_main.check_status("BTC/USDT", response=Response())
 
     assert response["status"] == "fresh"
     assert response["threshold_minutes"] == {"soft": 10, "hard": 20}
@@ -136,7 +136,7 @@ def test_check_status_returns_stale_with_warning_in_soft_window(
         "BTC/USDT",
         {"updated_at": updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")},
     )
-    response = api_main.check_status("BTC/USDT")
+    response = api_main.check_status("BTC/USDT", response=Response())
 
     assert response["status"] == "stale"
     assert response["degraded"] is False
@@ -160,7 +160,7 @@ def test_check_status_returns_503_beyond_hard_limit(tmp_path, monkeypatch):
     )
 
     with pytest.raises(HTTPException) as exc:
-        api_main.check_status("BTC/USDT")
+        api_main.check_status("BTC/USDT", response=Response())
 
     assert exc.value.status_code == 503
     assert "hard limit" in exc.value.detail
@@ -182,7 +182,11 @@ def test_check_status_uses_1h_threshold_as_fallback(tmp_path, monkeypatch):
         {"updated_at": updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")},
         timeframe="unknown",
     )
-    response = api_main.check_status("BTC/USDT", timeframe="unknown")
+    response = api_main.check_status(
+        "BTC/USDT",
+        response=Response(),
+        timeframe="unknown",
+    )
 
     assert response["status"] == "stale"
 
@@ -206,7 +210,7 @@ def test_check_status_reads_legacy_prediction_file_as_fallback(
         legacy=True,
     )
 
-    response = api_main.check_status("BTC/USDT", timeframe="1h")
+    response = api_main.check_status("BTC/USDT", response=Response(), timeframe="1h")
     assert response["status"] == "fresh"
 
 
@@ -230,7 +234,7 @@ def test_check_status_non_primary_does_not_read_legacy_prediction_file(
     )
 
     with pytest.raises(HTTPException) as exc:
-        api_main.check_status("BTC/USDT", timeframe="1d")
+        api_main.check_status("BTC/USDT", response=Response(), timeframe="1d")
 
     assert exc.value.status_code == 503
     assert exc.value.detail == "Not initialized yet."
@@ -269,7 +273,7 @@ def test_check_status_exposes_degraded_state_from_prediction_health(
         },
     )
 
-    response = api_main.check_status("BTC/USDT")
+    response = api_main.check_status("BTC/USDT", response=Response())
     assert response["status"] == "fresh"
     assert response["degraded"] is True
     assert response["degraded_reason"] == "model_missing"
@@ -298,7 +302,101 @@ def test_check_status_marks_degraded_when_prediction_health_file_is_corrupted(
     )
     (tmp_path / "prediction_health.json").write_text("{not-json")
 
-    response = api_main.check_status("BTC/USDT")
+    response = api_main.check_status("BTC/USDT", response=Response())
     assert response["status"] == "fresh"
     assert response["degraded"] is True
     assert response["degraded_reason"] == "prediction_health_read_error"
+
+
+def test_check_status_sets_validators_and_returns_304_when_unchanged(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(api_main, "STATIC_DIR", tmp_path)
+    monkeypatch.setattr(
+        api_main, "PREDICTION_HEALTH_FILE", tmp_path / "prediction_health.json"
+    )
+    updated_at = datetime.now(timezone.utc).replace(microsecond=0)
+    _write_prediction_file(
+        tmp_path,
+        "BTC/USDT",
+        {"updated_at": updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")},
+    )
+
+    response = Response()
+    payload = api_main.check_status("BTC/USDT", response=response)
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    assert payload["status"] == "fresh"
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "no-cache"
+
+    not_modified = api_main.check_status(
+        "BTC/USDT",
+        response=Response(),
+        if_none_match=etag,
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+    by_date = api_main.check_status(
+        "BTC/USDT",
+        response=Response(),
+        if_modified_since=last_modified,
+    )
+    assert by_date.status_code == 304
+
+    # If-None-Match가 있으면 If-Modified-Since보다 우선한다.
+    mismatch = api_main.check_status(
+        "BTC/USDT",
+        response=Response(),
+        if_none_match='W/"other"',
+        if_modified_since=last_modified,
+    )
+    assert mismatch["status"] == "fresh"
+
+    # health가 바뀌면 ETag도 바뀐다.
+    _write_prediction_health_file(
+        tmp_path,
+        {
+            "BTC/USDT|1h": {
+                "degraded": True,
+                "last_failure_at": updated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "consecutive_failures": 1,
+            }
+        },
+    )
+    changed = api_main.check_status("BTC/USDT", response=Response(), if_none_match=etag)
+    assert isinstance(changed, dict)
+    assert changed["degraded"] is True
+
+
+def test_check_status_last_modified_includes_stale_transition(tmp_path, monkeypatch):
+    from utils.http_cache import parse_http_date
+
+    monkeypatch.setattr(api_main, "STATIC_DIR", tmp_path)
+    monkeypatch.setattr(
+        api_main, "PREDICTION_HEALTH_FILE", tmp_path / "prediction_health.json"
+    )
+    monkeypatch.setattr(
+        api_main, "FRESHNESS_THRESHOLDS", {"1h": timedelta(minutes=10)}
+    )
+    monkeypatch.setattr(
+        api_main, "FRESHNESS_HARD_THRESHOLDS", {"1h": timedelta(minutes=60)}
+    )
+    updated_at = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(
+        minutes=30
+    )
+    _write_prediction_file(
+        tmp_path,
+        "BTC/USDT",
+        {"updated_at": updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")},
+    )
+
+    response = Response()
+    payload = api_main.check_status("BTC/USDT", response=response)
+
+    assert payload["status"] == "stale"
+    assert parse_http_date(response.headers["last-modified"]) == updated_at + (
+        timedelta(minutes=10)
+    )
@@ -0,0 +1,59 @@
+import numpy as np
+
+from utils.downsample import aggregate_ohlcv, bucket_starts, lttb_indices
+
+
+def test_bucket_starts_splits_evenly():
+    assert bucket_starts(10, 3).tolist() == [0, 3, 6]
+    assert bucket_starts(3, 5).tolist() == [0, 1, 2]
+    assert bucket_starts(0, 5).tolist() == []
+
+
+def test_lttb_indices_keeps_endpoints_and_spikes():
+    x = np.arange(100, dtype=np.float64)
+    y = np.zeros(100)
+    y[37] = 50.0
+    y[71] = -40.0
+
+    selected = lttb_indices(x, y, 10)
+
+    assert len(selected) == 10
+    assert selected[0] == 0
+    assert selected[-1] == 99
+    assert np.all(np.diff(selected) > 0)
+    assert 37 in selected
+    assert 71 in selected
+
+
+def test_lttb_indices_returns_all_points_when_under_threshold():
+    x = np.arange(5, dtype=np.float64)
+    assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+    assert lttb_indices(x, x, 2).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_lttb_indices_skips_nan_points():
+    x = np.arange(20, dtype=np.float64)
+    y = np.sin(x)
+    y[5:9] = np.nan
+
+    selected = lttb_indices(x, y, 6)
+
+    assert len(selected) == 6
+    assert not np.isnan(y[selected[1:-1]]).any()
+
+
+def test_aggregate_ohlcv_preserves_bucket_semantics():
+    open_ = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    high = np.array([1.5, 9.0, 3.5, 4.5, np.nan])
+    low = np.array([0.5, 1.5, 0.1, 3.5, 4.5])
+    close = np.array([1.2, 2.2, 3.2, 4.2, 5.2])
+    volume = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+
+    starts, columns = aggregate_ohlcv(open_, high, low, close, volume, buckets=2)
+
+    assert starts.tolist() == [0, 2]
+    assert columns["open"].tolist() == [1.0, 3.0]
+    assert columns["high"].tolist() == [9.0, 4.5]
+    assert columns["low"].tolist() == [0.5, 0.1]
+    assert columns["close"].tolist() == [2.2, 5.2]
+    assert columns["volume"].tolist() == [3.0, 9.0]
@@ -41,3 +41,303 @@ def test_atomic_write_json_cleans_temp_file_and_keeps_previous_content_on_failur
 
     assert json.loads(target.read_text()) == {"stable": True}
     assert not list(tmp_path.glob(f".{target.name}.*"))
+
+
+def test_atomic_write_json_precompress_writes_and_clears_siblings(tmp_path):
+    import gzip
+
+    target = tmp_path / "history_BTC_USDT_1h.json"
+    payload = {"symbol": "BTC/USDT", "data": [{"close": 1.5}] * 50}
+
+    atomic_write_json(target, payload, precompress=True)
+
+    gz_path = tmp_path / "history_BTC_USDT_1h.json.gz"
+    assert gzip.decompress(gz_path.read_bytes()) == target.read_bytes()
+    assert gz_path.stat().st_size < target.stat().st_size
+
+    # precompress를 끄고 다시 쓰면 원본과 어긋날 sibling을 남기지 않는다.
+    atomic_write_json(target, {"symbol": "BTC/USDT", "data": []})
+    assert not gz_path.exists()
+    assert not (tmp_path / "history_BTC_USDT_1h.json.br").exists()
+
+
+def test_precompressed_siblings_share_source_mtime(tmp_path):
+    from utils.file_io import atomic_write_chunks, precompressed_sibling_paths
+
+    # nginx gzip_static은 sibling mtime으로 Last-Modified를 보낸다.
+    for target, write in (
+        (tmp_path / "a.json", lambda path: atomic_write_json(path, {"a": 1}, precompress=True)),
+        (tmp_path / "b.json", lambda path: atomic_write_chunks(path, ["{}"], precompress=True)),
+    ):
+        write(target)
+        for sibling in precompressed_sibling_paths(target):
+            if sibling.exists():
+                assert sibling.stat().st_mtime_ns == target.stat().st_mtime_ns
+
+
+def test_file_sha256_reuses_cache_until_stat_changes(tmp_path, monkeypatch):
+    import hashlib
+
+    from utils import file_io
+    from utils.file_io import atomic_write_bytes, file_sha256
+
+    target = tmp_path / "history_BTC_USDT_1d.arrow"
+    assert file_sha256(target) is None
+
+    atomic_write_bytes(target, b"first")
+    assert file_sha256(target) == hashlib.sha256(b"first").hexdigest()
+
+    opened: list[str] = []
+    original_open = open
+    monkeypatch.setattr(
+        "builtins.open",
+        lambda path, *args, **kwargs: opened.append(str(path))
+        or original_open(path, *args, **kwargs),
+    )
+    assert file_sha256(target) == hashlib.sha256(b"first").hexdigest()
+    assert opened == []
+    monkeypatch.undo()
+
+    atomic_write_bytes(target, b"second-version")
+    assert file_sha256(target) == hashlib.sha256(b"second-version").hexdigest()
+    assert str(target) in file_io._file_digest_cache
+
+
+def test_atomic_write_json_skip_unchanged_ignores_volatile_keys(tmp_path):
+    from utils import file_io
+    from utils.file_io import consume_write_counts
+
+    target = tmp_path / "ingest_watermarks.json"
+    consume_write_counts()
+
+    first = atomic_write_json(
+        target,
+        {"updated_at": "2026-01-01T00:00:00Z", "entries": {"BTC/USDT|1h": "a"}},
+        skip_unchanged=True,
+        ignore_keys=("updated_at",),
+    )
+    mtime_ns = target.stat().st_mtime_ns
+    second = atomic_write_json(
+        target,
+        {"updated_at": "2026-01-01T00:01:00Z", "entries": {"BTC/USDT|1h": "a"}},
+        skip_unchanged=True,
+        ignore_keys=("updated_at",),
+    )
+
+    assert first.written is True
+    assert second.written is False
+    assert second.sha256 == first.sha256
+    assert second.size_bytes == target.stat().st_size
+    assert target.stat().st_mtime_ns == mtime_ns
+    assert json.loads(target.read_text())["updated_at"] == "2026-01-01T00:00:00Z"
+
+    # cold start(프로세스 재시작)에는 디스크 파일에서 fingerprint를 복원한다.
+    file_io._write_fingerprint_cache.clear()
+    third = atomic_write_json(
+        target,
+        {"updated_at": "2026-01-01T00:02:00Z", "entries": {"BTC/USDT|1h": "a"}},
+        skip_unchanged=True,
+        ignore_keys=("updated_at",),
+    )
+    fourth = atomic_write_json(
+        target,
+        {"updated_at": "2026-01-01T00:03:00Z", "entries": {"BTC/USDT|1h": "b"}},
+        skip_unchanged=True,
+        ignore_keys=("updated_at",),
+    )
+
+    assert third.written is False
+    assert fourth.written is True
+    assert json.loads(target.read_text())["entries"] == {"BTC/USDT|1h": "b"}
+    assert consume_write_counts() == {"written": 2, "skipped": 2}
+    assert consume_write_counts() == {"written": 0, "skipped": 0}
+
+
+def test_atomic_write_json_skip_unchanged_rewrites_externally_modified_file(tmp_path):
+    target = tmp_path / "manifest.json"
+    payload = {"generated_at": "2026-01-01T00:00:00Z", "entries": []}
+    atomic_write_json(
+        target, payload, skip_unchanged=True, ignore_keys=("generated_at",)
+    )
+
+    target.write_text('{"tampered": true}')
+    result = atomic_write_json(
+        target, payload, skip_unchanged=True, ignore_keys=("generated_at",)
+    )
+
+    assert result.written is True
+    assert json.loads(target.read_text()) == payload
+
+
+def test_atomic_write_chunks_streams_document_with_digest_and_siblings(tmp_path):
+    import gzip
+    import hashlib
+
+    from utils.file_io import atomic_write_chunks
+
+    target = tmp_path / "history_BTC_USDT_1d.json"
+    chunks = ['{"data": [', "1.5", ", 2.5", "]}"]
+    expected = "".join(chunks).encode("utf-8")
+
+    first = atomic_write_chunks(
+        target,
+        iter(chunks),
+        precompress=True,
+        skip_unchanged=True,
+        fingerprint_digest="fp-1",
+    )
+
+    assert first.written is True
+    assert target.read_bytes() == expected
+    assert first.size_bytes == len(expected)
+    assert first.sha256 == hashlib.sha256(expected).hexdigest()
+    gz_path = tmp_path / "history_BTC_USDT_1d.json.gz"
+    assert gzip.decompress(gz_path.read_bytes()) == expected
+    assert not list(tmp_path.glob(f".{target.name}.*"))
+
+    # 같은 fingerprint면 chunk iterator를 소비하지 않고 skip한다.
+    def fail_if_consumed():
+        raise AssertionError("skipped write must not consume chunks")
+        yield ""
+
+    second = atomic_write_chunks(
+        target,
+        fail_if_consumed(),
+        precompress=True,
+        skip_unchanged=True,
+        fingerprint_digest="fp-1",
+    )
+    assert second.written is False
+    assert second.sha256 == first.sha256
+
+
+def test_atomic_link_or_copy_links_legacy_alias_and_siblings(tmp_path):
+    from utils.file_io import atomic_link_or_copy
+
+    canonical = tmp_path / "prediction_BTC_USDT_1h.json"
+    legacy = tmp_path / "prediction_BTC_USDT.json"
+    atomic_write_json(canonical, {"version": 1}, precompress=True)
+
+    first = atomic_link_or_copy(canonical, legacy)
+
+    assert first.written is True
+    assert os.path.samefile(canonical, legacy)
+    assert os.path.samefile(
+        tmp_path / "prediction_BTC_USDT_1h.json.gz",
+        tmp_path / "prediction_BTC_USDT.json.gz",
+    )
+    assert first.size_bytes == canonical.stat().st_size
+    assert atomic_link_or_copy(canonical, legacy).written is False
+
+    # canonical이 rename으로 교체돼도 legacy는 다시 발행하기 전까지 이전 내용을 유지한다.
+    atomic_write_json(canonical, {"version": 2})
+    assert json.loads(legacy.read_text()) == {"version": 1}
+    atomic_link_or_copy(canonical, legacy)
+    assert json.loads(legacy.read_text()) == {"version": 2}
+    assert not (tmp_path / "prediction_BTC_USDT.json.gz").exists()
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_atomic_link_or_copy_falls_back_to_copy_when_link_fails(
+    tmp_path, monkeypatch
+):
+    from utils.file_io import atomic_link_or_copy
+
+    canonical = tmp_path / "model_BTC_USDT_1h.json"
+    legacy = tmp_path / "model_BTC_USDT.json"
+    atomic_write_json(canonical, {"model": "prophet"})
+
+    def fail_link(*args, **kwargs):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr("utils.file_io.os.link", fail_link)
+    result = atomic_link_or_copy(canonical, legacy)
+
+    assert result.written is True
+    assert not os.path.samefile(canonical, legacy)
+    assert legacy.read_bytes() == canonical.read_bytes()
+    assert stat.S_IMODE(legacy.stat().st_mode) == 0o644
+    assert not list(tmp_path.glob(".*"))
+    # 내용이 같으면 다시 복사하지 않는다.
+    assert atomic_link_or_copy(canonical, legacy).written is False
+
+
+def test_deferred_fsync_skips_per_file_fsync_and_syncs_once(tmp_path, monkeypatch):
+    from utils.file_io import deferred_fsync
+
+    fsync_calls: list[int] = []
+    syncfs_calls: list[str] = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(
+        "utils.file_io.os.fsync",
+        lambda fd: (fsync_calls.append(fd), real_fsync(fd))[1],
+    )
+    monkeypatch.setattr(
+        "utils.file_io.syncfs", lambda path: syncfs_calls.append(str(path))
+    )
+
+    with pytest.raises(RuntimeError):
+        with deferred_fsync(tmp_path):
+            atomic_write_json(tmp_path / "a.json", {"a": 1})
+            atomic_write_json(tmp_path / "b.json", {"b": 1}, precompress=True)
+            raise RuntimeError("cycle failed")
+
+    assert fsync_calls == []
+    # 예외로 빠져나가도 flush는 한 번 수행한다.
+    assert syncfs_calls == [str(tmp_path)]
+    assert json.loads((tmp_path / "b.json").read_text()) == {"b": 1}
+
+    atomic_write_json(tmp_path / "c.json", {"c": 1})
+    assert len(fsync_calls) == 1
+
+    with deferred_fsync(None):
+        atomic_write_json(tmp_path / "d.json", {"d": 1})
+    assert len(fsync_calls) == 2
+    assert syncfs_calls == [str(tmp_path)]
+
+
+def test_state_store_writes_stay_durable_inside_deferred_fsync(
+    tmp_path, monkeypatch
+):
+    from datetime import datetime, timezone
+
+    from scripts import pipeline_worker
+    from utils.file_io import deferred_fsync
+    from utils.ingest_state import IngestStateStore
+
+    fsynced_inodes: set[int] = set()
+    real_fsync = os.fsync
+    monkeypatch.setattr(
+        "utils.file_io.os.fsync",
+        lambda fd: (fsynced_inodes.add(os.fstat(fd).st_ino), real_fsync(fd))[1],
+    )
+    monkeypatch.setattr("utils.file_io.syncfs", lambda path: None)
+
+    with deferred_fsync(tmp_path):
+        atomic_write_json(tmp_path / "artifact.json", {"a": 1})
+        IngestStateStore(tmp_path / "ingest_state.json").upsert(
+            "BTC/USDT",
+            "1h",
+            last_closed_ts=datetime(2026, 2, 12, 10, tzinfo=timezone.utc),
+            status="ok",
+        )
+        pipeline_worker._save_watermark_entries(
+            {"BTC/USDT|1h": "2026-02-12T10:00:00Z"}, tmp_path / "watermarks.json"
+        )
+
+    # artifact는 syncfs에 맡기고, 다시 만들 수 없는 state 파일만 개별 fsync한다.
+    # rename은 inode를 유지하므로 최종 파일 inode로 fsync 대상을 확인한다.
+    def inode(name: str) -> int:
+        return (tmp_path / name).stat().st_ino
+
+    assert inode("artifact.json") not in fsynced_inodes
+    assert inode("ingest_state.json") in fsynced_inodes
+    assert inode("watermarks.json") in fsynced_inodes
+
+
+def test_syncfs_flushes_filesystem_of_path(tmp_path):
+    from utils.file_io import fsync_directory, syncfs
+
+    atomic_write_json(tmp_path / "a.json", {"a": 1})
+    syncfs(tmp_path)
+    fsync_directory(tmp_path)
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicators import (
+    compute_indicators,
+    indicator_output_columns,
+    parse_indicator_specs,
+)
+
+SPECS = parse_indicator_specs("sma_5,ema_4,rsi_3,atr_3,bb_5")
+
+
+def _frame(length: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, length))
+    return pd.DataFrame(
+        {
+            "high": close + rng.uniform(0.1, 1.0, length),
+            "low": close - rng.uniform(0.1, 1.0, length),
+            "close": close,
+        },
+        index=pd.date_range("2026-01-01", periods=length, freq="h", tz="UTC"),
+    )
+
+
+def test_parse_indicator_specs_dedupes_and_rejects_unknown():
+    specs = parse_indicator_specs(" SMA_20, ema_5,sma_20 ,,bb_20")
+
+    assert [spec.name for spec in specs] == ["sma_20", "ema_5", "bb_20"]
+    assert indicator_output_columns(specs) == [
+        "sma_20",
+        "ema_5",
+        "bb_20_upper",
+        "bb_20_middle",
+        "bb_20_lower",
+    ]
+    with pytest.raises(ValueError):
+        parse_indicator_specs("macd_12")
+    with pytest.raises(ValueError):
+        parse_indicator_specs("sma_x")
+    with pytest.raises(ValueError):
+        parse_indicator_specs("bb_1")
+
+
+def test_compute_indicators_matches_reference_formulas():
+    frame = _frame(40)
+    state, computed = compute_indicators(frame, SPECS)
+    close = frame["close"]
+
+    assert computed == 40
+    np.testing.assert_allclose(
+        state.columns["sma_5"], close.rolling(5).mean().to_numpy()
+    )
+    np.testing.assert_allclose(
+        state.columns["ema_4"], close.ewm(span=4, adjust=False).mean().to_numpy()
+    )
+    middle = close.rolling(5).mean()
+    band = close.rolling(5).std(ddof=0) * 2.0
+    np.testing.assert_allclose(state.columns["bb_5_upper"], (middle + band).to_numpy())
+    np.testing.assert_allclose(state.columns["bb_5_lower"], (middle - band).to_numpy())
+
+    delta = close.diff()
+    gain = delta.clip(lower=0).ewm(alpha=1 / 3, adjust=False).mean()
+    loss = (-delta).clip(lower=0).ewm(alpha=1 / 3, adjust=False).mean()
+    rsi = (100 - 100 / (1 + gain / loss)).to_numpy()
+    rsi[:3] = np.nan
+    np.testing.assert_allclose(state.columns["rsi_3"], rsi)
+
+    previous_close = close.shift()
+    true_range = pd.concat(
+        [
+            frame["high"] - frame["low"],
+            (frame["high"] - previous_close).abs(),
+            (frame["low"] - previous_close).abs(),
+        ],
+        axis=1,
+    ).max(axis=1)
+    atr = true_range.ewm(alpha=1 / 3, adjust=False).mean().to_numpy()
+    atr[:2] = np.nan
+    np.testing.assert_allclose(state.columns["atr_3"], atr)
+
+
+def test_compute_indicators_resumes_from_previous_state():
+    full = _frame(60)
+    reference, _ = compute_indicators(full, SPECS)
+
+    state, _ = compute_indicators(full.iloc[:50], SPECS)
+    resumed, computed = compute_indicators(full, SPECS, state)
+
+    assert computed == 10
+    for name in indicator_output_columns(SPECS):
+        np.testing.assert_allclose(resumed.columns[name], reference.columns[name])
+
+
+def test_compute_indicators_recomputes_from_corrected_candle():
+    full = _frame(30)
+    state, _ = compute_indicators(full, SPECS)
+
+    corrected = full.copy()
+    corrected.iloc[-1, corrected.columns.get_loc("close")] += 5.0
+    resumed, computed = compute_indicators(corrected, SPECS, state)
+    reference, _ = compute_indicators(corrected, SPECS)
+
+    assert computed == 1
+    for name in indicator_output_columns(SPECS):
+        np.testing.assert_allclose(resumed.columns[name], reference.columns[name])
+
+
+def test_compute_indicators_keeps_values_when_window_slides():
+    full = _frame(30)
+    state, _ = compute_indicators(full.iloc[:25], SPECS)
+
+    # lookback 창이 앞에서 잘려도 남은 candle 값과 warmup 판정은 유지된다.
+    resumed, computed = compute_indicators(full.iloc[5:], SPECS, state)
+    reference, _ = compute_indicators(full, SPECS)
+
+    assert computed == 5
+    assert resumed.offset == 5
+    for name in indicator_output_columns(SPECS):
+        np.testing.assert_allclose(resumed.columns[name], reference.columns[name][5:])
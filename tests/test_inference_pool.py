@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+
+from utils.inference_pool import RecyclingProcessPool
+from utils.model_cache import ModelCache
+from workers import predict as predict_ops
+
+
+def test_pool_replaces_child_after_max_tasks():
+    pool = RecyclingProcessPool(1, max_tasks_per_child=2)
+    try:
+        pids = [pool.run(os.getpid) for _ in range(3)]
+    finally:
+        pool.shutdown()
+
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[1]
+    assert os.getpid() not in pids
+
+
+def test_pool_recycles_after_rss_ceiling():
+    pool = RecyclingProcessPool(1, max_rss_bytes=1)
+    try:
+        first = pool.run(os.getpid)
+        second = pool.run(os.getpid)
+    finally:
+        pool.shutdown()
+
+    assert first != second
+    assert pool.recycle_count == 1
+
+
+def test_predict_forecast_merges_child_cache_stats(tmp_path, monkeypatch):
+    model_path = tmp_path / "model_BTC_USDT_1h.json"
+    model_path.write_text("model-json")
+
+    class FakeModel:
+        def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+            result = future.copy()
+            result["yhat"] = 1.0
+            result["yhat_lower"] = 0.5
+            result["yhat_upper"] = 1.5
+            result["trend"] = 0.0
+            return result
+
+    class InlinePool:
+        # 자식 프로세스 대신 같은 프로세스에서 task를 실행한다.
+        def run(self, fn, *args):
+            return fn(*args)
+
+    monkeypatch.setattr("workers.predict.model_from_json", lambda raw: FakeModel())
+    monkeypatch.setattr(predict_ops, "_worker_model_cache", ModelCache(1024))
+    parent_cache = ModelCache(1024)
+    ctx = SimpleNamespace(
+        inference_pool=InlinePool(),
+        model_cache=parent_cache,
+        PREDICT_ENGINE="prophet",
+        VALID_PREDICT_ENGINES={"prophet", "numpy"},
+        PREDICT_INTERVAL_METHOD="sampling",
+        VALID_PREDICT_INTERVAL_METHODS={"sampling", "analytic"},
+        PREDICT_INTERVAL_SAMPLES=0,
+    )
+    future = pd.DataFrame({"ds": pd.date_range("2026-02-13", periods=3, freq="h")})
+
+    first = predict_ops.predict_forecast(ctx, Path(model_path), future)
+    predict_ops.predict_forecast(ctx, Path(model_path), future)
+
+    assert list(first.columns) == predict_ops.FORECAST_COLUMNS
+    assert len(parent_cache) == 0
+    stats = parent_cache.consume_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
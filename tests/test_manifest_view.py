@@ -6,6 +6,7 @@ from admin.manifest_view import (
     build_status_matrix,
     filter_manifest_entries,
     flatten_manifest_entries,
+    manifest_caption,
 )
 
 
@@ -76,6 +77,16 @@ def test_flatten_manifest_entries_returns_expected_schema_and_delay():
     assert one_hour_row["threshold_hard_minutes"] == 130
 
 
+def test_flatten_manifest_entries_derives_age_from_updated_at():
+    # skip된 cycle의 v1 파일은 마지막 write 시점의 age_minutes를 그대로 담고 있다.
+    now = datetime(2026, 2, 19, 9, 30, tzinfo=timezone.utc)
+    df = flatten_manifest_entries(_sample_manifest_payload(), now=now)
+
+    one_hour_row = df.loc[df["key"] == "BTC/USDT|1h"].iloc[0]
+    assert one_hour_row["prediction_age_minutes"] == 150.0
+    assert one_hour_row["prediction_delay_minutes"] == 150.0
+
+
 def test_build_status_matrix_marks_degraded_blocked_hidden():
     now = datetime(2026, 2, 19, 8, 0, tzinfo=timezone.utc)
     df = flatten_manifest_entries(_sample_manifest_payload(), now=now)
@@ -115,3 +126,67 @@ def test_build_freshness_table_sorts_by_delay_desc():
     assert table.iloc[0]["prediction_delay_minutes"] >= table.iloc[1][
         "prediction_delay_minutes"
     ]
+
+
+def test_flatten_manifest_entries_loads_v2_shards_lazily():
+    now = datetime(2026, 2, 19, 8, 0, tzinfo=timezone.utc)
+    v1 = _sample_manifest_payload()
+    eth_entry = {
+        **v1["entries"][0],
+        "key": "ETH/USDT|1h",
+        "symbol": "ETH/USDT",
+    }
+    shards = {
+        "shards/BTC_USDT.json": {"version": 2, "entries": v1["entries"]},
+        "shards/ETH_USDT.json": {"version": 2, "entries": [eth_entry]},
+    }
+    for shard in shards.values():
+        for entry in shard["entries"]:
+            entry["prediction"] = {
+                key: value
+                for key, value in entry["prediction"].items()
+                if key != "age_minutes"
+            }
+    index = {
+        "version": 2,
+        "generated_at": v1["generated_at"],
+        "summary": v1["summary"],
+        "shards": [
+            {"symbol": "BTC/USDT", "url": "shards/BTC_USDT.json", "sha256": "a"},
+            {"symbol": "ETH/USDT", "url": "shards/ETH_USDT.json", "sha256": "b"},
+        ],
+    }
+    loaded: list[str] = []
+
+    def shard_loader(shard: dict) -> dict:
+        loaded.append(shard["url"])
+        return shards[shard["url"]]
+
+    df = flatten_manifest_entries(
+        index, now=now, shard_loader=shard_loader, symbols=["ETH/USDT"]
+    )
+
+    assert loaded == ["shards/ETH_USDT.json"]
+    assert df["key"].tolist() == ["ETH/USDT|1h"]
+    # shard에 없는 age는 updated_at 기준으로 채운다.
+    assert df.iloc[0]["prediction_age_minutes"] == 60.0
+
+    assert len(flatten_manifest_entries(index, now=now, shard_loader=shard_loader)) == 3
+    assert flatten_manifest_entries(index, now=now).empty
+
+
+def test_manifest_caption_labels_generated_at_as_last_change():
+    v1 = _sample_manifest_payload()
+    assert manifest_caption(v1) == (
+        "Manifest last changed at=2026-02-19T08:00:00Z / entry_count=2"
+    )
+
+    index = {
+        "version": 2,
+        "generated_at": v1["generated_at"],
+        "summary": v1["summary"],
+        "shards": [],
+    }
+    assert manifest_caption(index) == (
+        "Manifest v2 index last changed at=2026-02-19T08:00:00Z / entry_count=2"
+    )
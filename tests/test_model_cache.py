@@ -0,0 +1,106 @@
+import os
+
+from utils.model_cache import ModelCache
+
+
+def test_get_reuses_model_until_file_is_replaced(tmp_path):
+    cache = ModelCache(max_bytes=1024)
+    model_path = tmp_path / "model_BTC_USDT_1h.json"
+    model_path.write_text("v1")
+    loaded: list[str] = []
+
+    def loader(raw: str):
+        loaded.append(raw)
+        return {"payload": raw}
+
+    first = cache.get(model_path, loader)
+    assert cache.get(model_path, loader) is first
+    assert loaded == ["v1"]
+
+    # train_model은 temp 파일을 쓰고 rename으로 교체한다.
+    replacement = tmp_path / ".model_BTC_USDT_1h.json.tmp"
+    replacement.write_text("v2")
+    os.replace(replacement, model_path)
+
+    assert cache.get(model_path, loader) == {"payload": "v2"}
+    assert loaded == ["v1", "v2"]
+    stats = cache.consume_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 0)
+    assert cache.consume_stats()["misses"] == 0
+
+
+def test_get_keys_entry_on_the_file_actually_read(tmp_path, monkeypatch):
+    import builtins
+
+    from utils import model_cache
+
+    cache = ModelCache(max_bytes=1024)
+    model_path = tmp_path / "model_BTC_USDT_1h.json"
+    model_path.write_text("v1")
+
+    class RenameAfterRead:
+        """읽기 직후(handle이 닫히기 전) train_model이 새 artifact를 rename한다."""
+
+        def __init__(self, fin):
+            self._fin = fin
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return self._fin.__exit__(*exc)
+
+        def fileno(self):
+            return self._fin.fileno()
+
+        def read(self):
+            raw = self._fin.read()
+            replacement = tmp_path / ".model_BTC_USDT_1h.json.tmp"
+            replacement.write_text("v2")
+            os.replace(replacement, model_path)
+            return raw
+
+    def racing_open(path, mode="r"):
+        return RenameAfterRead(builtins.open(path, mode))
+
+    monkeypatch.setattr(model_cache, "open", racing_open, raising=False)
+    assert cache.get(model_path, str) == "v1"
+    monkeypatch.undo()
+
+    # 옛 모델은 옛 inode의 signature로 남으므로 새 artifact는 다시 적재한다.
+    assert cache.get(model_path, str) == "v2"
+
+
+def test_get_evicts_least_recently_used_over_budget(tmp_path):
+    cache = ModelCache(max_bytes=10)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"model_{name}.json"
+        path.write_text(name * 4)
+        paths.append(path)
+
+    cache.get(paths[0], str)
+    cache.get(paths[1], str)
+    cache.get(paths[0], str)  # a를 최근 사용으로 올린다.
+    cache.get(paths[2], str)  # 12 bytes > 10 -> b를 내보낸다.
+
+    assert len(cache) == 2
+    assert cache.total_bytes == 8
+    cache.consume_stats()
+    cache.get(paths[0], str)
+    cache.get(paths[1], str)
+    stats = cache.consume_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_disabled_cache_loads_every_time(tmp_path):
+    cache = ModelCache(max_bytes=0)
+    model_path = tmp_path / "model.json"
+    model_path.write_text("raw")
+    loaded: list[str] = []
+
+    cache.get(model_path, loaded.append)
+    cache.get(model_path, loaded.append)
+
+    assert loaded == ["raw", "raw"]
+    assert len(cache) == 0
@@ -1,8 +1,16 @@
 import json
+from datetime import datetime, timedelta, timezone
 
+import dataclasses
+import logging
+
+import numpy as np
 import pandas as pd
+from prophet import Prophet
 
 from scripts import pipeline_worker, train_model
+from utils.forecast_table import encode_forecast_table, forecast_table_from_frame
+from utils.prophet_numpy import encode_prophet_params, extract_prophet_params
 
 
 def test_fit_contract_normalizes_ds_to_timezone_naive():
@@ -112,3 +120,250 @@ def test_predict_contract_uses_canonical_model_and_writes_json_and_influx(
     assert getattr(record.index, "tz", None) is not None
     assert set(record["symbol"].unique().tolist()) == {"BTC/USDT"}
     assert set(record["timeframe"].unique().tolist()) == {"1h"}
+
+
+def test_predict_serves_precomputed_forecast_table_without_loading_model(
+    tmp_path, monkeypatch
+):
+    models_dir = tmp_path / "models"
+    static_dir = tmp_path / "static_data"
+    models_dir.mkdir(parents=True, exist_ok=True)
+    (models_dir / "model_BTC_USDT_1h.json").write_text("canonical-json")
+    (models_dir / "model_BTC_USDT_1h.meta.json").write_text(
+        json.dumps({"model_version": "abc123"})
+    )
+    start = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    ds = pd.date_range(start, periods=48, freq="h").tz_localize(None)
+    table = forecast_table_from_frame(
+        pd.DataFrame(
+            {
+                "ds": ds,
+                "yhat": range(48),
+                "yhat_lower": range(48),
+                "yhat_upper": range(48),
+            }
+        ),
+        "abc123",
+    )
+    (models_dir / "model_BTC_USDT_1h.forecast.npz").write_bytes(
+        encode_forecast_table(table)
+    )
+
+    def fail_model_from_json(raw: str):
+        raise AssertionError("table hit must not load the model")
+
+    class FakeWriteAPI:
+        def write(self, **kwargs):
+            self.record = kwargs["record"]
+
+    monkeypatch.setattr("workers.predict.model_from_json", fail_model_from_json)
+    monkeypatch.setattr(pipeline_worker, "MODELS_DIR", models_dir)
+    monkeypatch.setattr(pipeline_worker, "STATIC_DIR", static_dir)
+    monkeypatch.setattr(pipeline_worker, "PREDICTION_DISABLED_TIMEFRAMES", set())
+    monkeypatch.setattr(pipeline_worker, "MIN_SAMPLE_BY_TIMEFRAME", {})
+    monkeypatch.setattr(
+        pipeline_worker,
+        "next_timeframe_boundary",
+        lambda now, timeframe: start + timedelta(hours=3),
+    )
+
+    write_api = FakeWriteAPI()
+    result, error = pipeline_worker.run_prediction_and_save(
+        write_api=write_api, query_api=None, symbol="BTC/USDT", timeframe="1h"
+    )
+
+    assert (result, error) == ("ok", None)
+    payload = json.loads((static_dir / "prediction_BTC_USDT_1h.json").read_text())
+    assert payload["forecast"][0]["timestamp"] == "2026-02-13T15:00:00Z"
+    assert [row["price"] for row in payload["forecast"]] == list(range(3, 27))
+    assert len(write_api.record) == 24
+
+
+def test_predict_memo_skips_republish_for_same_model_and_window(
+    tmp_path, monkeypatch
+):
+    models_dir = tmp_path / "models"
+    static_dir = tmp_path / "static_data"
+    models_dir.mkdir(parents=True, exist_ok=True)
+    (models_dir / "model_ETH_USDT_4h.json").write_text("model-json")
+    (models_dir / "model_ETH_USDT_4h.meta.json").write_text(
+        json.dumps({"model_version": "v1"})
+    )
+    start = datetime(2026, 2, 13, 16, 0, tzinfo=timezone.utc)
+
+    class FakeModel:
+        def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+            result = future.copy()
+            result["yhat"] = 1.0
+            result["yhat_lower"] = 0.5
+            result["yhat_upper"] = 1.5
+            return result
+
+    class FakeWriteAPI:
+        def __init__(self):
+            self.calls = 0
+
+        def write(self, **kwargs):
+            self.calls += 1
+
+    monkeypatch.setattr("workers.predict.model_from_json", lambda raw: FakeModel())
+    monkeypatch.setattr(pipeline_worker, "MODELS_DIR", models_dir)
+    monkeypatch.setattr(pipeline_worker, "STATIC_DIR", static_dir)
+    monkeypatch.setattr(pipeline_worker, "PREDICTION_DISABLED_TIMEFRAMES", set())
+    monkeypatch.setattr(pipeline_worker, "MIN_SAMPLE_BY_TIMEFRAME", {})
+    monkeypatch.setattr(pipeline_worker, "PREDICTION_MEMO_ENABLED", True)
+    boundary = {"value": start}
+    monkeypatch.setattr(
+        pipeline_worker,
+        "next_timeframe_boundary",
+        lambda now, timeframe: boundary["value"],
+    )
+
+    write_api = FakeWriteAPI()
+
+    def run():
+        return pipeline_worker.run_prediction_and_save(
+            write_api=write_api, query_api=None, symbol="ETH/USDT", timeframe="4h"
+        )
+
+    canonical_path = static_dir / "prediction_ETH_USDT_4h.json"
+    assert run() == ("ok", None)
+    first_mtime = canonical_path.stat().st_mtime_ns
+    # registry 엔트리가 없어져도(다른 경로에서 forget) memo hit은 발행본을 다시 등록한다.
+    pipeline_worker.publish_registry.forget(canonical_path)
+    assert run() == ("memo_hit", None)
+    assert write_api.calls == 1
+    assert canonical_path.stat().st_mtime_ns == first_mtime
+    artifact = pipeline_worker.publish_registry.lookup(canonical_path)
+    assert artifact is not None
+    assert artifact.updated_at == json.loads(canonical_path.read_text())["updated_at"]
+
+    # 발행 파일이 사라지면(hidden 정책 삭제 등) 같은 key라도 다시 발행한다.
+    canonical_path.unlink()
+    assert run() == ("ok", None)
+    assert write_api.calls == 2
+
+    # 다음 구간으로 넘어가면 key가 바뀐다.
+    boundary["value"] = start + timedelta(hours=4)
+    assert run() == ("ok", None)
+    assert write_api.calls == 3
+    payload = json.loads(canonical_path.read_text())
+    assert payload["forecast"][0]["timestamp"] == "2026-02-13T20:00:00Z"
+
+
+def test_predict_memo_hits_for_every_timeframe_sharing_the_legacy_file(
+    tmp_path, monkeypatch
+):
+    import os
+
+    models_dir = tmp_path / "models"
+    static_dir = tmp_path / "static_data"
+    models_dir.mkdir(parents=True, exist_ok=True)
+    for timeframe in ("1h", "4h"):
+        (models_dir / f"model_ETH_USDT_{timeframe}.json").write_text("model-json")
+        (models_dir / f"model_ETH_USDT_{timeframe}.meta.json").write_text(
+            json.dumps({"model_version": "v1"})
+        )
+    start = datetime(2026, 2, 13, 16, 0, tzinfo=timezone.utc)
+
+    class FakeModel:
+        def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+            result = future.copy()
+            result["yhat"] = 1.0
+            result["yhat_lower"] = 0.5
+            result["yhat_upper"] = 1.5
+            return result
+
+    class FakeWriteAPI:
+        def __init__(self):
+            self.calls = 0
+
+        def write(self, **kwargs):
+            self.calls += 1
+
+    monkeypatch.setattr("workers.predict.model_from_json", lambda raw: FakeModel())
+    monkeypatch.setattr(pipeline_worker, "MODELS_DIR", models_dir)
+    monkeypatch.setattr(pipeline_worker, "STATIC_DIR", static_dir)
+    monkeypatch.setattr(pipeline_worker, "PREDICTION_DISABLED_TIMEFRAMES", set())
+    monkeypatch.setattr(pipeline_worker, "MIN_SAMPLE_BY_TIMEFRAME", {})
+    monkeypatch.setattr(pipeline_worker, "PREDICTION_MEMO_ENABLED", True)
+    monkeypatch.setattr(
+        pipeline_worker, "next_timeframe_boundary", lambda now, timeframe: start
+    )
+
+    write_api = FakeWriteAPI()
+
+    def run(timeframe: str):
+        return pipeline_worker.run_prediction_and_save(
+            write_api=write_api, query_api=None, symbol="ETH/USDT", timeframe=timeframe
+        )
+
+    legacy_path = static_dir / "prediction_ETH_USDT.json"
+    assert [run("1h"), run("4h")] == [("ok", None), ("ok", None)]
+    # 4h가 legacy를 다시 가리켜도 1h memo는 canonical만 보므로 계속 hit이다.
+    for _ in range(3):
+        assert [run("1h"), run("4h")] == [("memo_hit", None), ("memo_hit", None)]
+        # 직렬 publish 순서대로 마지막 timeframe(4h)이 legacy를 가리킨다.
+        assert os.path.samefile(legacy_path, static_dir / "prediction_ETH_USDT_4h.json")
+    assert write_api.calls == 2
+
+    legacy_artifact = pipeline_worker.publish_registry.lookup(legacy_path)
+    assert legacy_artifact is not None
+    assert legacy_artifact.updated_at == json.loads(legacy_path.read_text())[
+        "updated_at"
+    ]
+
+
+def test_predict_numpy_engine_loads_compact_artifact_instead_of_model_json(
+    tmp_path, monkeypatch
+):
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    models_dir = tmp_path / "models"
+    static_dir = tmp_path / "static_data"
+    models_dir.mkdir(parents=True, exist_ok=True)
+    ds = pd.date_range("2026-02-01", periods=240, freq="h")
+    fitted = Prophet(daily_seasonality=True, uncertainty_samples=0).fit(
+        pd.DataFrame({"ds": ds, "y": 100 + np.sin(np.arange(len(ds)) / 4)})
+    )
+    params = dataclasses.replace(extract_prophet_params(fitted), model_version="abc123")
+    (models_dir / "model_BTC_USDT_1h.json").write_text("canonical-json")
+    (models_dir / "model_BTC_USDT_1h.meta.json").write_text(
+        json.dumps({"model_version": "abc123"})
+    )
+    (models_dir / "model_BTC_USDT_1h.compact.npz").write_bytes(
+        encode_prophet_params(params)
+    )
+    loaded_payloads: list[str] = []
+
+    def fake_model_from_json(raw: str):
+        loaded_payloads.append(raw)
+        return fitted
+
+    class FakeWriteAPI:
+        def write(self, **kwargs):
+            self.record = kwargs["record"]
+
+    monkeypatch.setattr("workers.predict.model_from_json", fake_model_from_json)
+    monkeypatch.setattr(pipeline_worker, "MODELS_DIR", models_dir)
+    monkeypatch.setattr(pipeline_worker, "STATIC_DIR", static_dir)
+    monkeypatch.setattr(pipeline_worker, "PREDICTION_DISABLED_TIMEFRAMES", set())
+    monkeypatch.setattr(pipeline_worker, "MIN_SAMPLE_BY_TIMEFRAME", {})
+    monkeypatch.setattr(pipeline_worker, "PREDICTION_MEMO_ENABLED", False)
+    monkeypatch.setattr(pipeline_worker, "PREDICT_ENGINE", "numpy")
+    monkeypatch.setattr(pipeline_worker, "model_cache", pipeline_worker.ModelCache(0))
+
+    result = pipeline_worker.run_prediction_and_save(
+        write_api=FakeWriteAPI(), query_api=None, symbol="BTC/USDT", timeframe="1h"
+    )
+    assert result == ("ok", None)
+    assert loaded_payloads == []
+
+    # meta가 다른 학습 결과를 가리키면 artifact를 버리고 모델 JSON으로 되돌아간다.
+    (models_dir / "model_BTC_USDT_1h.meta.json").write_text(
+        json.dumps({"model_version": "def456"})
+    )
+    result = pipeline_worker.run_prediction_and_save(
+        write_api=FakeWriteAPI(), query_api=None, symbol="BTC/USDT", timeframe="1h"
+    )
+    assert result == ("ok", None)
+    assert loaded_payloads == ["canonical-json"]
@@ -0,0 +1,203 @@
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pandas as pd
+
+from scripts import ohlcv_snapshot
+
+
+def _make_frame(start: datetime, count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "_time": start + timedelta(hours=offset),
+                "open": 100.0 + offset,
+                "high": 101.0 + offset,
+                "low": 99.0 + offset,
+                "close": 100.5 + offset,
+                "volume": 10.0 + offset,
+            }
+            for offset in range(count)
+        ]
+    )
+
+
+def _table(records: list[dict]):
+    return SimpleNamespace(
+        records=[
+            SimpleNamespace(
+                values=values,
+                get_value=lambda values=values: values.get("_value"),
+                get_time=lambda values=values: values.get("_time"),
+            )
+            for values in records
+        ]
+    )
+
+
+class FakeQueryAPI:
+    """
+    discover(last) / first / count / chunk 쿼리를 문자열로 구분해 응답한다.
+    """
+
+    def __init__(self, series: dict[tuple[str, str], pd.DataFrame]):
+        self.series = series
+        self.written_counts: dict[tuple[str, str], int] | None = None
+
+    def _match(self, query: str) -> tuple[str, str] | None:
+        for symbol, timeframe in self.series:
+            if f'== "{symbol}"' in query and f'== "{timeframe}"' in query:
+                return symbol, timeframe
+        return None
+
+    def query(self, query: str):
+        if "|> last()" in query:
+            rows = [
+                {"symbol": symbol, "timeframe": timeframe}
+                for symbol, timeframe in self.series
+            ]
+            rows.append({"symbol": "BTC/USDT"})  # legacy row without timeframe
+            return [_table(rows)]
+
+        key = self._match(query)
+        if key is None:
+            return []
+        frame = self.series[key]
+        if "|> count()" in query:
+            count = (
+                self.written_counts.get(key, 0)
+                if self.written_counts is not None
+                else len(frame)
+            )
+            return [_table([{"_value": count}])]
+        if "first(" in query:
+            if frame.empty:
+                return []
+            return [_table([{"_time": frame["_time"].min()}])]
+        return []
+
+    def query_data_frame(self, query: str):
+        key = self._match(query)
+        if key is None:
+            return pd.DataFrame()
+        return self.series[key].copy()
+
+
+class FakeWriteAPI:
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    def write(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+class FakeClient:
+    def __init__(self, query_api, write_api=None):
+        self._query_api = query_api
+        self._write_api = write_api
+
+    def query_api(self):
+        return self._query_api
+
+    def write_api(self, write_options=None):
+        return self._write_api
+
+
+def test_discover_ohlcv_series_skips_legacy_rows_without_timeframe():
+    query_api = FakeQueryAPI(
+        {
+            ("ETH/USDT", "1h"): _make_frame(datetime(2026, 1, 1, tzinfo=timezone.utc), 1),
+            ("BTC/USDT", "1d"): _make_frame(datetime(2026, 1, 1, tzinfo=timezone.utc), 1),
+        }
+    )
+
+    assert ohlcv_snapshot.discover_ohlcv_series(query_api) == [
+        ("BTC/USDT", "1d"),
+        ("ETH/USDT", "1h"),
+    ]
+
+
+def test_run_snapshot_writes_parquet_and_verified_manifest(tmp_path, monkeypatch):
+    # 청크가 여러 번 호출되더라도 dedupe 후 row 수는 원본과 같아야 한다.
+    monkeypatch.setattr("scripts.ohlcv_snapshot.SNAPSHOT_CHUNK_DAYS", 1)
+    now = datetime(2026, 1, 3, 0, 0, tzinfo=timezone.utc)
+    frame = _make_frame(datetime(2026, 1, 1, tzinfo=timezone.utc), 24)
+    query_api = FakeQueryAPI({("BTC/USDT", "1h"): frame})
+
+    manifest = ohlcv_snapshot.run_snapshot(
+        client=FakeClient(query_api),
+        dest_dir=tmp_path,
+        workers=2,
+        now=now,
+    )
+
+    assert manifest["summary"] == {
+        "series": 1,
+        "rows": 24,
+        "verified": 1,
+        "mismatched": 0,
+        "failed": 0,
+    }
+    entry = manifest["entries"][0]
+    assert entry["file"] == "ohlcv_BTC_USDT_1h.parquet"
+    assert entry["first_at"] == "2026-01-01T00:00:00Z"
+    assert entry["last_at"] == "2026-01-01T23:00:00Z"
+
+    loaded = pd.read_parquet(tmp_path / entry["file"])
+    assert list(loaded.columns) == ohlcv_snapshot.SNAPSHOT_COLUMNS
+    assert len(loaded) == 24
+    saved_manifest = json.loads(
+        (tmp_path / ohlcv_snapshot.SNAPSHOT_MANIFEST_NAME).read_text()
+    )
+    assert saved_manifest["entries"][0]["verified"] is True
+
+
+def test_build_line_protocol_matches_ingest_contract():
+    df = pd.DataFrame(
+        [
+            {
+                "timestamp": datetime(2026, 1, 1, tzinfo=timezone.utc),
+                "open": 1.0,
+                "high": 2.5,
+                "low": 0.5,
+                "close": 1.5,
+                "volume": float("nan"),
+            }
+        ]
+    )
+
+    lines = ohlcv_snapshot.build_line_protocol(df, "BTC/USDT", "1h")
+
+    assert lines == [
+        "ohlcv,symbol=BTC/USDT,timeframe=1h "
+        "open=1.0,high=2.5,low=0.5,close=1.5 1767225600000000000"
+    ]
+
+
+def test_run_restore_batches_lines_and_flags_count_mismatch(tmp_path, monkeypatch):
+    monkeypatch.setattr("scripts.ohlcv_snapshot.RESTORE_BATCH_LINES", 10)
+    now = datetime(2026, 1, 3, 0, 0, tzinfo=timezone.utc)
+    series = {
+        ("BTC/USDT", "1h"): _make_frame(datetime(2026, 1, 1, tzinfo=timezone.utc), 24),
+        ("ETH/USDT", "1h"): _make_frame(datetime(2026, 1, 1, tzinfo=timezone.utc), 5),
+    }
+    query_api = FakeQueryAPI(series)
+    ohlcv_snapshot.run_snapshot(
+        client=FakeClient(query_api), dest_dir=tmp_path, workers=1, now=now
+    )
+
+    # 복구 후 ETH만 count가 어긋난 상황을 흉내 낸다.
+    query_api.written_counts = {("BTC/USDT", "1h"): 24, ("ETH/USDT", "1h"): 4}
+    write_api = FakeWriteAPI()
+    result = ohlcv_snapshot.run_restore(
+        client=FakeClient(query_api, write_api),
+        source_dir=tmp_path,
+        workers=2,
+    )
+
+    assert result["summary"]["verified"] == 1
+    assert result["summary"]["mismatched"] == 1
+    total_lines = sum(len(call["record"]) for call in write_api.calls)
+    assert total_lines == 29
+    assert max(len(call["record"]) for call in write_api.calls) == 10
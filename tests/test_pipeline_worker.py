@@ -1,9 +1,11 @@
 import json
+import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
 
 import pandas as pd
+import pytest
 
 from scripts.pipeline_worker import (
     _detect_gaps_from_ms_timestamps,
@@ -14,6 +16,7 @@ from scripts.pipeline_worker import (
     _record_ingest_outcome_state,
     _refill_detected_gaps,
     _run_ingest_timeframe_step,
+    _run_publish_jobs_parallel,
     _run_publish_timeframe_step,
     WorkerPersistentState,
     append_runtime_cycle_metrics,
@@ -38,6 +41,7 @@ from scripts.pipeline_worker import (
     upsert_prediction_health,
     write_runtime_manifest,
 )
+from utils.http_cache import format_http_date
 from utils.ingest_state import IngestStateStore
 from utils.pipeline_contracts import (
     IngestExecutionOutcome,
@@ -417,6 +421,158 @@ def test_write_runtime_manifest_writes_manifest_file(tmp_path):
     assert payload["entries"][0]["serve_allowed"] is False
 
 
+def test_write_runtime_manifest_skips_rewrite_when_only_age_changes(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    (tmp_path / "prediction_BTC_USDT_1h.json").write_text(
+        json.dumps({"updated_at": "2026-02-13T11:55:00Z", "forecast": []})
+    )
+
+    def write_cycle(minute: int) -> dict:
+        return write_runtime_manifest(
+            ["BTC/USDT"],
+            ["1h"],
+            now=datetime(2026, 2, 13, 12, minute, tzinfo=timezone.utc),
+            static_dir=tmp_path,
+            prediction_health_path=tmp_path / "prediction_health.json",
+            path=manifest_path,
+        )
+
+    first = write_cycle(0)
+    first_stat = manifest_path.stat()
+    second = write_cycle(5)
+
+    # generated_at/age_minutes만 다른 cycle은 파일을 다시 쓰지 않는다.
+    assert (
+        first["entries"][0]["prediction"]["age_minutes"]
+        != second["entries"][0]["prediction"]["age_minutes"]
+    )
+    assert manifest_path.stat().st_ino == first_stat.st_ino
+    assert manifest_path.stat().st_mtime_ns == first_stat.st_mtime_ns
+    assert json.loads(manifest_path.read_text())["generated_at"] == (
+        "2026-02-13T12:00:00Z"
+    )
+
+
+def test_write_predictions_bundle_includes_only_serve_allowed_series(tmp_path):
+    import gzip
+
+    from scripts.pipeline_worker import write_predictions_bundle
+
+    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    forecast = [{"timestamp": "2026-02-13T12:00:00Z", "price": 1.0}]
+    (tmp_path / "prediction_BTC_USDT_1h.json").write_text(
+        json.dumps(
+            {
+                "symbol": "BTC/USDT",
+                "timeframe": "1h",
+                "updated_at": "2026-02-13T11:55:00Z",
+                "forecast": forecast,
+            }
+        )
+    )
+    (tmp_path / "prediction_ETH_USDT_1h.json").write_text(
+        json.dumps(
+            {
+                "symbol": "ETH/USDT",
+                "timeframe": "1h",
+                "updated_at": "2026-02-13T11:55:00Z",
+                "forecast": forecast,
+            }
+        )
+    )
+    manifest = build_runtime_manifest(
+        ["BTC/USDT", "ETH/USDT", "SOL/USDT"],
+        ["1h"],
+        now=now,
+        static_dir=tmp_path,
+        prediction_health_path=tmp_path / "prediction_health.json",
+        symbol_activation_entries={
+            "ETH/USDT": {
+                "state": "backfilling",
+                "visibility": "hidden_backfilling",
+                "is_full_backfilled": False,
+            }
+        },
+    )
+    bundle_path = tmp_path / "predictions_bundle.json"
+
+    write_predictions_bundle(manifest, static_dir=tmp_path, path=bundle_path)
+
+    bundle = json.loads(bundle_path.read_text())
+    assert bundle["generated_at"] == "2026-02-13T12:00:00Z"
+    assert bundle["entry_count"] == 1
+    assert bundle["entries"] == [
+        {
+            "key": "BTC/USDT|1h",
+            "symbol": "BTC/USDT",
+            "timeframe": "1h",
+            "status": "fresh",
+            "updated_at": "2026-02-13T11:55:00Z",
+            "forecast": forecast,
+        }
+    ]
+    gz_path = tmp_path / "predictions_bundle.json.gz"
+    assert gzip.decompress(gz_path.read_bytes()) == bundle_path.read_bytes()
+
+
+def test_write_runtime_manifest_v2_rewrites_only_changed_shards(tmp_path):
+    from scripts.pipeline_worker import write_runtime_manifest_v2
+    from utils.file_io import file_sha256
+
+    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    (tmp_path / "prediction_BTC_USDT_1h.json").write_text(
+        json.dumps({"updated_at": "2026-02-13T11:55:00Z", "forecast": []})
+    )
+
+    def build(symbols, at):
+        return build_runtime_manifest(
+            symbols,
+            ["1h", "1d"],
+            now=at,
+            static_dir=tmp_path,
+            prediction_health_path=tmp_path / "prediction_health.json",
+        )
+
+    index_path = write_runtime_manifest_v2(
+        build(["BTC/USDT", "ETH/USDT", "SOL/USDT"], now), static_dir=tmp_path
+    )
+
+    assert index_path == tmp_path / "manifest_v2" / "index.json"
+    index = json.loads(index_path.read_text())
+    assert index["version"] == 2
+    assert index["summary"]["entry_count"] == 6
+    assert [shard["symbol"] for shard in index["shards"]] == [
+        "BTC/USDT",
+        "ETH/USDT",
+        "SOL/USDT",
+    ]
+    btc_ref = index["shards"][0]
+    assert btc_ref["url"] == "shards/BTC_USDT.json"
+    assert btc_ref["entry_count"] == 2
+    btc_path = index_path.parent / btc_ref["url"]
+    assert btc_ref["sha256"] == file_sha256(btc_path)
+    btc_shard = json.loads(btc_path.read_text())
+    assert [entry["key"] for entry in btc_shard["entries"]] == [
+        "BTC/USDT|1h",
+        "BTC/USDT|1d",
+    ]
+    assert "age_minutes" not in btc_shard["entries"][0]["prediction"]
+    eth_mtime = (index_path.parent / "shards" / "ETH_USDT.json").stat().st_mtime_ns
+
+    # 시간이 지나도(age만 변화) shard는 다시 쓰지 않고, 빠진 symbol shard는 지운다.
+    write_runtime_manifest_v2(
+        build(["BTC/USDT", "ETH/USDT"], now + timedelta(minutes=1)),
+        static_dir=tmp_path,
+    )
+    index = json.loads(index_path.read_text())
+    assert [shard["symbol"] for shard in index["shards"]] == ["BTC/USDT", "ETH/USDT"]
+    assert index["shards"][0]["sha256"] == btc_ref["sha256"]
+    assert (
+        index_path.parent / "shards" / "ETH_USDT.json"
+    ).stat().st_mtime_ns == eth_mtime
+    assert not (index_path.parent / "shards" / "SOL_USDT.json").exists()
+
+
 def test_append_runtime_cycle_metrics_writes_summary(tmp_path):
     metrics_path = tmp_path / "runtime_metrics.json"
     base = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
@@ -429,6 +585,8 @@ def test_append_runtime_cycle_metrics_writes_summary(tmp_path):
         cycle_result="ok",
         ingest_since_source_counts={"db_last": 5, "bootstrap_lookback": 1},
         detection_gate_run_counts={"new_closed_candle": 2},
+        static_write_counts={"written": 1, "skipped": 3},
+        model_cache_counts={"hits": 3, "misses": 1, "load_seconds": 0.42},
         path=metrics_path,
         target_cycle_seconds=60,
         window_size=10,
@@ -465,6 +623,11 @@ def test_append_runtime_cycle_metrics_writes_summary(tmp_path):
         payload["summary"]["ingest_since_source_counts"]["underfilled_rebootstrap"] == 2
     )
     assert payload["summary"]["rebootstrap_cycles"] == 1
+    assert payload["summary"]["static_write_counts"] == {"written": 1, "skipped": 3}
+    assert payload["summary"]["static_write_skip_ratio"] == 0.75
+    assert payload["summary"]["model_cache_counts"] == {"hits": 3, "misses": 1}
+    assert payload["summary"]["model_cache_hit_ratio"] == 0.75
+    assert payload["summary"]["model_load_seconds"] == 0.42
     assert payload["summary"]["rebootstrap_events"] == 2
     assert payload["summary"]["underfill_guard_retrigger_cycles"] == 1
     assert payload["summary"]["underfill_guard_retrigger_events"] == 2
@@ -1638,8 +1801,12 @@ def test_run_publish_timeframe_step_runs_export_with_ingest_watermark(
     assert cycle_export_gate_skip_counts == {}
 
 
+@pytest.mark.parametrize(
+    "prediction_result",
+    [PredictionExecutionResult.OK, PredictionExecutionResult.MEMO_HIT],
+)
 def test_run_publish_timeframe_step_runs_prediction_with_ingest_watermark(
-    monkeypatch,
+    monkeypatch, prediction_result
 ):
     symbol = "BTC/USDT"
     timeframe = "1h"
@@ -1663,16 +1830,18 @@ def test_run_publish_timeframe_step_runs_prediction_with_ingest_watermark(
         fallback_now=now,
     )
     calls = {"run": 0, "health": 0}
+    health_ok: list[bool] = []
 
     def fake_run_prediction_and_save_outcome(*args, **kwargs):
         calls["run"] += 1
         return SimpleNamespace(
-            result=PredictionExecutionResult.OK,
+            result=prediction_result,
             error=None,
         )
 
     def fake_upsert_prediction_health(*args, **kwargs):
         calls["health"] += 1
+        health_ok.append(kwargs["prediction_ok"])
         return {"degraded": False}, False, False
 
     monkeypatch.setattr(
@@ -1700,6 +1869,8 @@ def test_run_publish_timeframe_step_runs_prediction_with_ingest_watermark(
     )
 
     assert calls == {"run": 1, "health": 1}
+    # memo hit도 발행본이 유효한 성공이라 health에 성공으로 남는다.
+    assert health_ok == [True]
     assert cycle_predict_gate_skip_counts == {}
 
 
@@ -1756,6 +1927,219 @@ def test_run_publish_timeframe_step_skips_predict_without_ingest_watermark(
     assert cycle_predict_gate_skip_counts == {"no_ingest_watermark": 1}
 
 
+def test_run_publish_jobs_parallel_merges_counts_and_keeps_series_order(
+    monkeypatch,
+):
+    now = datetime(2026, 2, 24, 1, 0, tzinfo=timezone.utc)
+    series = [("BTC/USDT", "1h"), ("ETH/USDT", "1h"), ("BTC/USDT", "1d")]
+    state = WorkerPersistentState(
+        symbol_activation_entries={},
+        ingest_watermarks={
+            "BTC/USDT|1h": "2026-02-24T01:00:00Z",
+            "ETH/USDT|1h": "2026-02-24T01:00:00Z",
+        },
+    )
+    jobs = [
+        (
+            symbol,
+            timeframe,
+            SymbolActivationSnapshot.from_payload(
+                symbol=symbol,
+                payload={
+                    "symbol": symbol,
+                    "state": "ready_for_serving",
+                    "visibility": "visible",
+                    "is_full_backfilled": True,
+                    "updated_at": "2026-02-24T01:00:00Z",
+                },
+                fallback_now=now,
+            ),
+        )
+        for symbol, timeframe in series
+    ]
+    events: list[tuple[str, str, str]] = []
+
+    def fake_update_full_history_file(query_api, symbol, timeframe):
+        events.append(("export", symbol, timeframe))
+        return True
+
+    def fake_run_prediction_and_save_outcome(write_api, query_api, symbol, timeframe):
+        events.append(("predict", symbol, timeframe))
+        return SimpleNamespace(result=PredictionExecutionResult.OK, error=None)
+
+    def fake_upsert_prediction_health(symbol, timeframe, **kwargs):
+        events.append(("health", symbol, timeframe))
+        return {"degraded": False}, False, False
+
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.update_full_history_file",
+        fake_update_full_history_file,
+    )
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.run_prediction_and_save_outcome",
+        fake_run_prediction_and_save_outcome,
+    )
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.upsert_prediction_health",
+        fake_upsert_prediction_health,
+    )
+
+    cycle_export_gate_skip_counts = {"no_ingest_watermark": 2}
+    cycle_predict_gate_skip_counts: dict[str, int] = {}
+    _run_publish_jobs_parallel(
+        jobs,
+        write_api=object(),
+        query_api=object(),
+        cycle_now=now,
+        run_export_stage=True,
+        run_predict_stage=True,
+        state=state,
+        cycle_export_gate_skip_counts=cycle_export_gate_skip_counts,
+        cycle_predict_gate_skip_counts=cycle_predict_gate_skip_counts,
+        max_workers=3,
+    )
+
+    assert cycle_export_gate_skip_counts == {"no_ingest_watermark": 3}
+    assert cycle_predict_gate_skip_counts == {"no_ingest_watermark": 1}
+    for symbol, timeframe in series[:2]:
+        stages = [stage for stage, s, tf in events if (s, tf) == (symbol, timeframe)]
+        assert stages == ["export", "predict", "health"]
+    assert not [event for event in events if event[1:] == ("BTC/USDT", "1d")]
+
+
+def test_run_publish_jobs_parallel_keeps_timeframes_of_a_symbol_serial(monkeypatch):
+    import threading
+    import time
+
+    now = datetime(2026, 2, 24, 1, 0, tzinfo=timezone.utc)
+    series = [
+        ("BTC/USDT", "1h"),
+        ("ETH/USDT", "1h"),
+        ("BTC/USDT", "4h"),
+        ("ETH/USDT", "4h"),
+        ("BTC/USDT", "1d"),
+    ]
+    state = WorkerPersistentState(
+        symbol_activation_entries={},
+        ingest_watermarks={
+            f"{symbol}|{timeframe}": "2026-02-24T01:00:00Z"
+            for symbol, timeframe in series
+        },
+    )
+    jobs = [
+        (
+            symbol,
+            timeframe,
+            SymbolActivationSnapshot.from_payload(
+                symbol=symbol,
+                payload={
+                    "symbol": symbol,
+                    "state": "ready_for_serving",
+                    "visibility": "visible",
+                    "is_full_backfilled": True,
+                    "updated_at": "2026-02-24T01:00:00Z",
+                },
+                fallback_now=now,
+            ),
+        )
+        for symbol, timeframe in series
+    ]
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    overlaps: list[str] = []
+    exported: dict[str, list[str]] = {}
+
+    def fake_update_full_history_file(query_api, symbol, timeframe):
+        with lock:
+            active[symbol] = active.get(symbol, 0) + 1
+            if active[symbol] > 1:
+                overlaps.append(symbol)
+        # 같은 symbol job이 겹친다면 이 구간에서 겹치도록 잠깐 머문다.
+        time.sleep(0.01)
+        with lock:
+            active[symbol] -= 1
+            exported.setdefault(symbol, []).append(timeframe)
+        return True
+
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.update_full_history_file",
+        fake_update_full_history_file,
+    )
+
+    _run_publish_jobs_parallel(
+        jobs,
+        write_api=object(),
+        query_api=object(),
+        cycle_now=now,
+        run_export_stage=True,
+        run_predict_stage=False,
+        state=state,
+        cycle_export_gate_skip_counts={},
+        cycle_predict_gate_skip_counts={},
+        max_workers=5,
+    )
+
+    assert overlaps == []
+    # legacy 경로의 최종 내용은 직렬 경로처럼 symbol의 마지막 timeframe이 정한다.
+    assert exported == {"BTC/USDT": ["1h", "4h", "1d"], "ETH/USDT": ["1h", "4h"]}
+
+
+def test_run_publish_jobs_parallel_reraises_after_all_jobs_finish(monkeypatch):
+    now = datetime(2026, 2, 24, 1, 0, tzinfo=timezone.utc)
+    state = WorkerPersistentState(
+        symbol_activation_entries={},
+        ingest_watermarks={
+            "BTC/USDT|1h": "2026-02-24T01:00:00Z",
+            "ETH/USDT|1h": "2026-02-24T01:00:00Z",
+        },
+    )
+    jobs = [
+        (
+            symbol,
+            "1h",
+            SymbolActivationSnapshot.from_payload(
+                symbol=symbol,
+                payload={
+                    "symbol": symbol,
+                    "state": "ready_for_serving",
+                    "visibility": "visible",
+                    "is_full_backfilled": True,
+                    "updated_at": "2026-02-24T01:00:00Z",
+                },
+                fallback_now=now,
+            ),
+        )
+        for symbol in ("BTC/USDT", "ETH/USDT")
+    ]
+    exported: list[str] = []
+
+    def fake_update_full_history_file(query_api, symbol, timeframe):
+        if symbol == "BTC/USDT":
+            raise RuntimeError("influx down")
+        exported.append(symbol)
+        return True
+
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.update_full_history_file",
+        fake_update_full_history_file,
+    )
+
+    with pytest.raises(RuntimeError, match="influx down"):
+        _run_publish_jobs_parallel(
+            jobs,
+            write_api=object(),
+            query_api=object(),
+            cycle_now=now,
+            run_export_stage=True,
+            run_predict_stage=False,
+            state=state,
+            cycle_export_gate_skip_counts={},
+            cycle_predict_gate_skip_counts={},
+            max_workers=2,
+        )
+    assert exported == ["ETH/USDT"]
+
+
 def test_update_full_history_file_uses_full_range_for_long_timeframes(monkeypatch):
     captured_queries: list[str] = []
     sample_df = pd.DataFrame(
@@ -1814,3 +2198,690 @@ def test_update_full_history_file_keeps_lookback_range_for_1h(monkeypatch):
     query_api = FakeQueryAPI()
     assert update_full_history_file(query_api, "BTC/USDT", "1h") is True
     assert "|> range(start: -30d)" in captured_queries[0]
+
+
+def _history_source_frame(start: datetime, count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "_time": start + timedelta(hours=offset),
+                "open": 1.0 + offset,
+                "high": 2.0 + offset,
+                "low": 0.5 + offset,
+                "close": 1.5 + offset,
+                "volume": 10.0 + offset,
+            }
+            for offset in range(count)
+        ]
+    )
+
+
+def test_save_history_to_json_matches_json_dump_layout(tmp_path, monkeypatch):
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    # 스트리밍 write가 chunk 경계를 여러 번 넘도록 chunk를 1 candle로 줄인다.
+    monkeypatch.setattr("workers.export.HISTORY_ENCODE_CHUNK_ROWS", 1)
+    export_ops.reset_history_export_cache()
+
+    df = _history_source_frame(datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc), 2)
+    df.loc[1, "volume"] = float("nan")
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    raw = (tmp_path / "history_BTC_USDT_1h.json").read_text()
+    payload = json.loads(raw)
+    assert raw == json.dumps(payload)
+    assert payload["data"][1]["timestamp"] == "2026-02-12T01:00:00Z"
+    assert list(payload) == ["symbol", "data", "updated_at", "timeframe", "type"]
+
+
+def test_save_history_to_json_full_mode_streams_rows_without_row_list(
+    tmp_path, monkeypatch
+):
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_EXPORT_MODE", "full")
+    monkeypatch.setattr("workers.export.HISTORY_ENCODE_CHUNK_ROWS", 2)
+    export_ops.reset_history_export_cache()
+
+    def fail_encode_all(*args, **kwargs):
+        raise AssertionError("full export must not build the whole row list")
+
+    monkeypatch.setattr("workers.export._encode_history_rows", fail_encode_all)
+    streamed_chunks: list[int] = []
+    original_chunks = export_ops._iter_history_row_chunks
+
+    def record_chunks(frame, chunk_rows=None):
+        for chunk in original_chunks(frame, chunk_rows or 2):
+            streamed_chunks.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr("workers.export._iter_history_row_chunks", record_chunks)
+
+    df = _history_source_frame(datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc), 5)
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    history_path = tmp_path / "history_BTC_USDT_1h.json"
+    raw = history_path.read_text()
+    payload = json.loads(raw)
+    assert raw == json.dumps(payload)
+    assert [row["close"] for row in payload["data"]] == [1.5, 2.5, 3.5, 4.5, 5.5]
+    assert streamed_chunks[:3] == [2, 2, 1]
+
+    # 같은 내용이면 본문을 다시 인코딩/기록하지 않는다.
+    first_mtime = history_path.stat().st_mtime_ns
+    streamed_chunks.clear()
+    save_history_to_json(df, "BTC/USDT", "1h")
+    assert history_path.stat().st_mtime_ns == first_mtime
+    assert streamed_chunks == []
+
+
+def test_encode_history_rows_matches_json_dumps_across_chunks():
+    from workers.export import _encode_history_rows, _normalize_history_frame
+
+    df = _history_source_frame(datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc), 5)
+    df.loc[1, "close"] = float("nan")
+    df.loc[2, "high"] = float("inf")
+    df["volume"] = [10, 11, 12, 13, 14]
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    frame = _normalize_history_frame(df)
+
+    expected_df = frame.copy()
+    expected_df["timestamp"] = expected_df.index.strftime("%Y-%m-%dT%H:%M:%SZ")
+    expected = [
+        json.dumps(record)
+        for record in expected_df[
+            ["timestamp", "open", "high", "low", "close", "volume"]
+        ].to_dict(orient="records")
+    ]
+
+    assert _encode_history_rows(frame, chunk_rows=2) == expected
+    assert _encode_history_rows(frame) == expected
+
+
+def test_save_history_to_json_full_mode_keeps_no_export_cache(tmp_path, monkeypatch):
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_EXPORT_MODE", "full")
+    export_ops.reset_history_export_cache()
+
+    df = _history_source_frame(datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc), 3)
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    assert (tmp_path / "history_BTC_USDT_1h.json").exists()
+    assert export_ops._history_export_cache == {}
+
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_EXPORT_MODE", "incremental")
+    save_history_to_json(df, "BTC/USDT", "1h")
+    assert list(export_ops._history_export_cache) == ["BTC/USDT|1h"]
+
+
+def test_update_full_history_file_incremental_appends_new_candles(
+    tmp_path, monkeypatch
+):
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_EXPORT_MODE", "incremental")
+    export_ops.reset_history_export_cache()
+
+    start = datetime.now(timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(hours=5)
+    source = _history_source_frame(start, 4)
+    captured_queries: list[str] = []
+
+    class FakeQueryAPI:
+        def query_data_frame(self, query: str):
+            captured_queries.append(query)
+            if "range(start: -30d)" in query:
+                return source.iloc[:3].copy()
+            # 증분 조회는 마지막 export candle(inclusive)부터 돌려준다.
+            return source.iloc[2:].copy()
+
+    query_api = FakeQueryAPI()
+    assert update_full_history_file(query_api, "BTC/USDT", "1h") is True
+    assert update_full_history_file(query_api, "BTC/USDT", "1h") is True
+
+    last_exported = int((start + timedelta(hours=2)).timestamp())
+    assert f"|> range(start: {last_exported})" in captured_queries[1]
+
+    expected_path = tmp_path / "history_BTC_USDT_1h.json"
+    payload = json.loads(expected_path.read_text())
+    timestamps = [row["timestamp"] for row in payload["data"]]
+    assert timestamps == [
+        (start + timedelta(hours=offset)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for offset in range(4)
+    ]
+    assert json.loads((tmp_path / "history_BTC_USDT.json").read_text()) == payload
+
+
+def test_update_full_history_file_incremental_reconciles_when_due(
+    tmp_path, monkeypatch
+):
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_EXPORT_MODE", "incremental")
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.HISTORY_EXPORT_FULL_RECONCILE_SECONDS", 0
+    )
+    export_ops.reset_history_export_cache()
+
+    source = _history_source_frame(datetime(2026, 2, 1, 0, 0, tzinfo=timezone.utc), 2)
+    captured_queries: list[str] = []
+
+    class FakeQueryAPI:
+        def query_data_frame(self, query: str):
+            captured_queries.append(query)
+            return source.copy()
+
+    query_api = FakeQueryAPI()
+    assert update_full_history_file(query_api, "BTC/USDT", "1d") is True
+    assert update_full_history_file(query_api, "BTC/USDT", "1d") is True
+
+    assert len(captured_queries) == 2
+    assert all("|> range(start: 0)" in query for query in captured_queries)
+
+
+def test_prefetch_history_frames_splits_one_query_per_timeframe(
+    tmp_path, monkeypatch
+):
+    from scripts.pipeline_worker import prefetch_history_frames
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    export_ops.reset_history_export_cache()
+
+    start = datetime.now(timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(hours=5)
+    hourly = _history_source_frame(start, 3).assign(timeframe="1h")
+    daily = _history_source_frame(start, 2).assign(timeframe="1d")
+    captured_queries: list[str] = []
+
+    class FakeQueryAPI:
+        def query_data_frame(self, query: str):
+            captured_queries.append(query)
+            if "group(" not in query:
+                return hourly.drop(columns="timeframe")
+            # timeframe group별 table이 list로 올 수 있다.
+            return [daily.copy(), hourly.copy()]
+
+    query_api = FakeQueryAPI()
+    assert prefetch_history_frames(query_api, "BTC/USDT", ["1h", "1d"]) == 2
+    assert len(captured_queries) == 1
+    # timeframe마다 자기 range로 읽는다. 1d(전체 기간) 때문에 1h까지 전체를 읽지 않는다.
+    query = captured_queries[0]
+    assert query.count("|> range(") == 2
+    assert re.search(r"\|> range\(start: \d{4}-\d{2}-\d{2}T", query)
+    assert "|> range(start: 0)" in query
+    assert query.index('r["timeframe"] == "1h"') < query.index("range(start: 0)")
+    assert "union(tables: [tf_0, tf_1])" in query
+    assert "_time\"] >=" not in query
+    assert '|> group(columns: ["timeframe"])' in query
+
+    assert update_full_history_file(query_api, "BTC/USDT", "1h") is True
+    assert update_full_history_file(query_api, "BTC/USDT", "1d") is True
+    assert len(captured_queries) == 1
+
+    hourly_payload = json.loads((tmp_path / "history_BTC_USDT_1h.json").read_text())
+    daily_payload = json.loads((tmp_path / "history_BTC_USDT_1d.json").read_text())
+    assert [row["close"] for row in hourly_payload["data"]] == [1.5, 2.5, 3.5]
+    assert [row["close"] for row in daily_payload["data"]] == [1.5, 2.5]
+
+    # 꺼내 쓴 결과는 버려지므로 다음 export는 단건 조회로 돌아간다.
+    assert update_full_history_file(query_api, "BTC/USDT", "1h") is True
+    assert len(captured_queries) == 2
+    assert "|> range(start: -30d)" in captured_queries[1]
+
+
+def test_write_history_segments_splits_closed_periods_and_tail(
+    tmp_path, monkeypatch
+):
+    import hashlib
+
+    from scripts import pipeline_worker
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    now = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+    df = pd.DataFrame(
+        [
+            {
+                "timestamp": datetime(2025, month, 1, tzinfo=timezone.utc),
+                "open": 1.0,
+                "high": 2.0,
+                "low": 0.5,
+                "close": 1.5,
+                "volume": 10.0,
+            }
+            for month in (11, 12)
+        ]
+        + [
+            {
+                "timestamp": datetime(2026, 3, day, tzinfo=timezone.utc),
+                "open": 1.0,
+                "high": 2.0,
+                "low": 0.5,
+                "close": 1.5,
+                "volume": 10.0,
+            }
+            for day in (1, 2)
+        ]
+    ).set_index("timestamp")
+    frame = export_ops._normalize_history_frame(df)
+    rows = export_ops._encode_history_rows(frame)
+
+    written: list[str] = []
+    original_write_text = pipeline_worker.atomic_write_text
+
+    def recording_write_text(path, text, **kwargs):
+        result = original_write_text(path, text, **kwargs)
+        if result.written:
+            written.append(Path(path).name)
+        return result
+
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.atomic_write_text", recording_write_text
+    )
+
+    index_path = export_ops.write_history_segments(
+        pipeline_worker, "BTC/USDT", "1d", frame, rows, "2026-03-02T12:00:00Z", now=now
+    )
+
+    # 1d는 year 단위: 2025는 닫힌 segment, 2026은 tail.
+    index = json.loads(index_path.read_text())
+    assert index_path == tmp_path / "history_v2" / "BTC_USDT_1d" / "index.json"
+    assert index["period"] == "year"
+    assert [entry["id"] for entry in index["segments"]] == ["2025"]
+    segment = index["segments"][0]
+    assert segment["url"] == "history_v2/BTC_USDT_1d/2025.json"
+    assert segment["rows"] == 2
+    segment_bytes = (tmp_path / segment["url"]).read_bytes()
+    assert hashlib.sha256(segment_bytes).hexdigest() == segment["sha256"]
+    assert index["tail"]["rows"] == 2
+    assert index["tail"]["last_at"] == "2026-03-02T00:00:00Z"
+    assert sorted(written) == ["2025.json", "tail.json"]
+
+    # 내용이 같으면 tail/index도 다시 쓰지 않는다.
+    # 행 범위가 같은 closed segment는 다시 렌더링/hash하지 않고 tail만 렌더링한다.
+    rendered: list[int] = []
+    original_fragment = export_ops._history_data_fragment
+
+    def recording_fragment(ctx, frame_slice, row_slice):
+        rendered.append(frame_slice.index[0].year)
+        return original_fragment(ctx, frame_slice, row_slice)
+
+    monkeypatch.setattr(export_ops, "_history_data_fragment", recording_fragment)
+    written.clear()
+    export_ops.write_history_segments(
+        pipeline_worker, "BTC/USDT", "1d", frame, rows, "2026-03-02T12:05:00Z", now=now
+    )
+    assert written == []
+    assert rendered == [2026]
+    assert json.loads(index_path.read_text())["segments"][0]["sha256"] == (
+        segment["sha256"]
+    )
+    assert json.loads(index_path.read_text())["updated_at"] == "2026-03-02T12:00:00Z"
+
+    # closed segment가 그대로면 바뀐 tail만 다시 쓴다.
+    frame.loc[frame.index[-1], "close"] = 9.5
+    rows = export_ops._encode_history_rows(frame)
+    written.clear()
+    export_ops.write_history_segments(
+        pipeline_worker, "BTC/USDT", "1d", frame, rows, "2026-03-02T12:10:00Z", now=now
+    )
+    assert written == ["tail.json"]
+    index = json.loads(index_path.read_text())
+    assert index["updated_at"] == "2026-03-02T12:10:00Z"
+    tail_bytes = (tmp_path / index["tail"]["url"]).read_bytes()
+    assert hashlib.sha256(tail_bytes).hexdigest() == index["tail"]["sha256"]
+
+
+def test_remove_static_exports_for_symbol_removes_history_segments(
+    tmp_path, monkeypatch
+):
+    from scripts.pipeline_worker import (
+        _history_segment_dir,
+        _remove_static_exports_for_symbol,
+    )
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    segment_dir = _history_segment_dir("BTC/USDT", "1h", static_dir=tmp_path)
+    segment_dir.mkdir(parents=True)
+    (segment_dir / "index.json").write_text("{}")
+    history_gz = tmp_path / "history_BTC_USDT_1h.json.gz"
+    history_gz.write_bytes(b"stale")
+
+    _remove_static_exports_for_symbol("BTC/USDT", ["1h"], static_dir=tmp_path)
+
+    assert not segment_dir.exists()
+    assert not history_gz.exists()
+
+
+def test_save_history_to_json_columnar_format_uses_numpy_columns(
+    tmp_path, monkeypatch
+):
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_EXPORT_FORMAT", "columnar")
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_EXPORT_FLOAT_DECIMALS", 2)
+    export_ops.reset_history_export_cache()
+
+    start = datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc)
+    df = _history_source_frame(start, 4)
+    df["close"] = [1.23456, 2.34567, 3.45678, 4.56789]
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    payload = json.loads((tmp_path / "history_BTC_USDT_1h.json").read_text())
+    assert payload["format"] == "columnar"
+    assert payload["type"] == "history_1h"
+    assert "data" not in payload
+    assert payload["start"] == int(start.timestamp())
+    assert payload["step"] == 3600
+    assert payload["close"] == [1.23, 2.35, 3.46, 4.57]
+    assert payload["volume"] == [10.0, 11.0, 12.0, 13.0]
+
+    # 간격이 불규칙하면 epoch 배열로 내보낸다.
+    irregular = df.drop(df.index[1])
+    save_history_to_json(irregular, "BTC/USDT", "1h")
+    payload = json.loads((tmp_path / "history_BTC_USDT_1h.json").read_text())
+    assert payload["time"] == [
+        int((start + timedelta(hours=offset)).timestamp()) for offset in (0, 2, 3)
+    ]
+    assert "start" not in payload
+
+
+def test_save_history_to_json_publishes_tail_with_sequence(tmp_path, monkeypatch):
+    from scripts.pipeline_worker import _remove_static_exports_for_symbol
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_TAIL_CANDLES", 2)
+    export_ops.reset_history_export_cache()
+
+    start = datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc)
+    df = _history_source_frame(start, 3)
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    tail_path = tmp_path / "history_tail_BTC_USDT_1h.json"
+    # 새 산출물이라 timeframe 없는 legacy alias는 두지 않는다.
+    assert not (tmp_path / "history_tail_BTC_USDT.json").exists()
+    tail = json.loads(tail_path.read_text())
+    assert tail["type"] == "history_tail_1h"
+    assert tail["sequence"] == 1
+    assert tail["candles"] == 2
+    assert [row["close"] for row in tail["data"]] == [2.5, 3.5]
+
+    # 같은 내용이면 sequence를 올리지 않는다.
+    save_history_to_json(df, "BTC/USDT", "1h")
+    assert json.loads(tail_path.read_text())["sequence"] == 1
+
+    grown = _history_source_frame(start, 4)
+    grown = grown.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    save_history_to_json(grown, "BTC/USDT", "1h")
+    tail = json.loads(tail_path.read_text())
+    assert tail["sequence"] == 2
+    assert [row["close"] for row in tail["data"]] == [3.5, 4.5]
+
+    # 재시작(cache 초기화) 후에도 파일의 sequence를 이어받는다.
+    export_ops.reset_history_export_cache()
+    save_history_to_json(df, "BTC/USDT", "1h")
+    assert json.loads(tail_path.read_text())["sequence"] == 3
+
+    manifest = build_runtime_manifest(
+        ["BTC/USDT"],
+        ["1h"],
+        now=start + timedelta(hours=4),
+        static_dir=tmp_path,
+        prediction_health_path=tmp_path / "prediction_health.json",
+    )
+    assert manifest["entries"][0]["history"]["tail_file"] == tail_path.name
+
+    _remove_static_exports_for_symbol("BTC/USDT", ["1h"], static_dir=tmp_path)
+    assert not tail_path.exists()
+    assert not (tmp_path / "history_tail_BTC_USDT.json").exists()
+
+
+def test_save_history_to_json_writes_pyramid_levels_listed_in_manifest(
+    tmp_path, monkeypatch
+):
+    from scripts.pipeline_worker import _remove_static_exports_for_symbol
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_PYRAMID_ENABLED", True)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_PYRAMID_LEVELS", [50, 5])
+    export_ops.reset_history_export_cache()
+
+    start = datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc)
+    df = _history_source_frame(start, 20)
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    pyramid_dir = tmp_path / "history_pyramid" / "BTC_USDT_1h"
+    # candle 수(20)보다 큰 budget(50)은 만들지 않는다.
+    assert sorted(path.name for path in pyramid_dir.glob("*.json")) == ["5.json"]
+    level = json.loads((pyramid_dir / "5.json").read_text())
+    assert level["points"] == 5
+    assert level["source_rows"] == 20
+    assert len(level["data"]) == 5
+    assert level["data"][0] == {
+        "timestamp": "2026-02-12T00:00:00Z",
+        "open": 1.0,
+        "high": 5.0,
+        "low": 0.5,
+        "close": 4.5,
+        "volume": 46.0,
+    }
+    assert len(level["lttb"]) == 5
+    assert level["lttb"][0] == {"timestamp": "2026-02-12T00:00:00Z", "close": 1.5}
+    assert level["lttb"][-1]["close"] == 20.5
+
+    manifest = build_runtime_manifest(
+        ["BTC/USDT"],
+        ["1h"],
+        now=start + timedelta(hours=20),
+        static_dir=tmp_path,
+        prediction_health_path=tmp_path / "prediction_health.json",
+    )
+    assert manifest["entries"][0]["history"]["pyramid"] == [
+        {
+            "points": 5,
+            "url": "history_pyramid/BTC_USDT_1h/5.json",
+            "last_modified": format_http_date(
+                datetime.fromtimestamp(
+                    (pyramid_dir / "5.json").stat().st_mtime, tz=timezone.utc
+                )
+            ),
+        }
+    ]
+
+    _remove_static_exports_for_symbol("BTC/USDT", ["1h"], static_dir=tmp_path)
+    assert not pyramid_dir.exists()
+
+
+def test_save_history_to_json_writes_indicator_sidecar_listed_in_manifest(
+    tmp_path, monkeypatch
+):
+    from scripts.pipeline_worker import _remove_static_exports_for_symbol
+    from utils.indicators import parse_indicator_specs
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_INDICATORS_ENABLED", True)
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.HISTORY_INDICATORS",
+        parse_indicator_specs("sma_2,ema_3"),
+    )
+    export_ops.reset_history_export_cache()
+
+    start = datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc)
+    df = _history_source_frame(start, 3)
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    indicators_path = tmp_path / "history_indicators_BTC_USDT_1h.json"
+    # 새 sidecar라 timeframe 없는 legacy alias는 두지 않는다.
+    assert not (tmp_path / "history_indicators_BTC_USDT.json").exists()
+    document = json.loads(indicators_path.read_text())
+    assert document["type"] == "history_indicators_1h"
+    assert document["indicators"] == ["sma_2", "ema_3"]
+    assert document["candles"] == 3
+    assert document["start"] == int(start.timestamp())
+    assert document["step"] == 3600
+    assert document["sma_2"] == [None, 2.0, 3.0]
+    assert document["ema_3"] == [1.5, 2.0, 2.75]
+
+    # 새 candle은 이전 state에서 이어 계산한다(전체 재계산과 같은 값).
+    grown = _history_source_frame(start, 4)
+    grown = grown.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    save_history_to_json(grown, "BTC/USDT", "1h")
+    document = json.loads(indicators_path.read_text())
+    assert document["sma_2"] == [None, 2.0, 3.0, 4.0]
+    assert document["ema_3"] == [1.5, 2.0, 2.75, 3.625]
+
+    manifest = build_runtime_manifest(
+        ["BTC/USDT"],
+        ["1h"],
+        now=start + timedelta(hours=4),
+        static_dir=tmp_path,
+        prediction_health_path=tmp_path / "prediction_health.json",
+    )
+    assert manifest["entries"][0]["history"]["indicators_file"] == (
+        indicators_path.name
+    )
+
+    _remove_static_exports_for_symbol("BTC/USDT", ["1h"], static_dir=tmp_path)
+    assert not indicators_path.exists()
+    assert not (tmp_path / "history_indicators_BTC_USDT.json").exists()
+
+
+def test_save_history_to_json_writes_arrow_export_listed_in_manifest(
+    tmp_path, monkeypatch
+):
+    import hashlib
+
+    import pyarrow as pa
+
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    monkeypatch.setattr("scripts.pipeline_worker.HISTORY_ARROW_EXPORT_ENABLED", True)
+    export_ops.reset_history_export_cache()
+
+    start = datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc)
+    df = _history_source_frame(start, 3)
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    arrow_path = tmp_path / "history_BTC_USDT_1h.arrow"
+    assert (tmp_path / "history_BTC_USDT.arrow").exists()
+    table = pa.ipc.open_stream(arrow_path.read_bytes()).read_all()
+    assert table.column_names == ["timestamp", "open", "high", "low", "close", "volume"]
+    assert table.column("close").to_pylist() == [1.5, 2.5, 3.5]
+    assert table.column("timestamp").to_pylist()[0] == start
+    assert table.schema.metadata[b"timeframe"] == b"1h"
+
+    manifest = build_runtime_manifest(
+        ["BTC/USDT"],
+        ["1h"],
+        now=start + timedelta(hours=3),
+        static_dir=tmp_path,
+        prediction_health_path=tmp_path / "prediction_health.json",
+    )
+    binary = manifest["entries"][0]["history"]["binary"]
+    assert binary["source_file"] == "history_BTC_USDT_1h.arrow"
+    assert binary["size_bytes"] == arrow_path.stat().st_size
+    assert binary["sha256"] == hashlib.sha256(arrow_path.read_bytes()).hexdigest()
+    assert binary["last_modified"].endswith(" GMT")
+
+
+def test_build_runtime_manifest_skips_missing_arrow_candidates(tmp_path, monkeypatch):
+    from scripts import pipeline_worker
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    errors: list[str] = []
+    monkeypatch.setattr(pipeline_worker.logger, "error", errors.append)
+
+    def build():
+        return build_runtime_manifest(
+            ["BTC/USDT", "ETH/USDT"],
+            ["1h"],
+            now=datetime(2026, 2, 12, 3, 0, tzinfo=timezone.utc),
+            static_dir=tmp_path,
+            prediction_health_path=tmp_path / "prediction_health.json",
+        )
+
+    # Arrow export가 꺼져 있으면 어느 후보도 없다.
+    manifest = build()
+    assert [entry["history"]["binary"] for entry in manifest["entries"]] == [
+        None,
+        None,
+    ]
+    assert errors == []
+
+    # canonical이 없으면 legacy 후보로 넘어간다.
+    legacy_path = tmp_path / "history_BTC_USDT.arrow"
+    legacy_path.write_bytes(b"arrow")
+    binary = build()["entries"][0]["history"]["binary"]
+    assert binary["source_file"] == "history_BTC_USDT.arrow"
+    assert binary["size_bytes"] == 5
+    assert errors == []
+
+
+def test_build_runtime_manifest_uses_publish_registry_for_history(
+    tmp_path, monkeypatch
+):
+    from scripts import pipeline_worker
+    from workers import export as export_ops
+
+    monkeypatch.setattr("scripts.pipeline_worker.STATIC_DIR", tmp_path)
+    export_ops.reset_history_export_cache()
+    df = _history_source_frame(datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc), 2)
+    df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    save_history_to_json(df, "BTC/USDT", "1h")
+
+    history_path = tmp_path / "history_BTC_USDT_1h.json"
+    artifact = pipeline_worker.publish_registry.lookup(history_path)
+    assert artifact is not None
+    assert artifact.sha256 is not None
+
+    def fail_scan(ctx, candidates):
+        raise AssertionError("manifest must not re-read registered history files")
+
+    monkeypatch.setattr(
+        "scripts.pipeline_worker.export_ops.extract_updated_at_from_files", fail_scan
+    )
+    manifest = build_runtime_manifest(
+        ["BTC/USDT"],
+        ["1h"],
+        now=datetime(2026, 2, 12, 3, 0, tzinfo=timezone.utc),
+        static_dir=tmp_path,
+        prediction_health_path=tmp_path / "prediction_health.json",
+    )
+
+    history = manifest["entries"][0]["history"]
+    assert history["updated_at"] == artifact.updated_at
+    assert history["source_file"] == "history_BTC_USDT_1h.json"
+    # HTTP validator: nginx가 보내는 값과 같은 파일 mtime 기반 Last-Modified.
+    # nginx ETag는 표현마다 달라 manifest에 싣지 않는다.
+    assert "etag" not in history
+    assert history["last_modified"] == format_http_date(
+        datetime.fromtimestamp(history_path.stat().st_mtime, tz=timezone.utc)
+    )
+    assert history["tail_last_modified"].endswith(" GMT")
+    assert manifest["entries"][0]["prediction"]["last_modified"] is None
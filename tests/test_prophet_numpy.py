@@ -0,0 +1,109 @@
+import dataclasses
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+from prophet import Prophet
+from prophet.serialize import model_from_json, model_to_json
+
+from utils.prophet_numpy import (
+    UnsupportedProphetModel,
+    decode_prophet_params,
+    encode_prophet_params,
+    evaluate_forecast,
+    extract_prophet_params,
+)
+
+logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+
+def _train_frame() -> pd.DataFrame:
+    rng = np.random.RandomState(1)
+    ds = pd.date_range("2026-01-01", periods=400, freq="h")
+    hours = np.arange(len(ds))
+    y = 100 + np.cumsum(rng.normal(0, 1, len(ds))) + 5 * np.sin(hours * 2 * np.pi / 24)
+    return pd.DataFrame({"ds": ds, "y": y})
+
+
+def _future(train: pd.DataFrame) -> pd.DataFrame:
+    start = train["ds"].iloc[-1] + pd.Timedelta(hours=1)
+    return pd.DataFrame({"ds": pd.date_range(start, periods=24, freq="h")})
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"daily_seasonality": True},
+        {"seasonality_mode": "multiplicative", "scaling": "minmax"},
+    ],
+)
+def test_evaluate_forecast_matches_prophet_predict(options):
+    train = _train_frame()
+    fitted = Prophet(**options).fit(train)
+    # worker와 같이 직렬화된 모델을 다시 읽어 평가한다.
+    model = model_from_json(model_to_json(fitted))
+    future = _future(train)
+
+    np.random.seed(7)
+    expected = model.predict(future)
+    np.random.seed(7)
+    actual = evaluate_forecast(extract_prophet_params(model), future["ds"].to_numpy())
+
+    for column in ("trend", "yhat", "yhat_lower", "yhat_upper"):
+        np.testing.assert_allclose(
+            actual[column], expected[column].to_numpy(), rtol=1e-9, atol=1e-9
+        )
+
+
+def test_analytic_interval_tracks_sampled_width():
+    train = _train_frame()
+    model = Prophet(daily_seasonality=True).fit(train)
+    future = _future(train)
+    params = extract_prophet_params(model)
+
+    sampled = evaluate_forecast(
+        params,
+        future["ds"].to_numpy(),
+        interval_samples=20000,
+        rng=np.random.RandomState(0),
+    )
+    analytic = evaluate_forecast(
+        params, future["ds"].to_numpy(), interval_method="analytic"
+    )
+
+    np.testing.assert_allclose(analytic["yhat"], sampled["yhat"])
+    sampled_width = sampled["yhat_upper"] - sampled["yhat_lower"]
+    analytic_width = analytic["yhat_upper"] - analytic["yhat_lower"]
+    np.testing.assert_allclose(analytic_width, sampled_width, rtol=0.1)
+
+
+def test_extract_rejects_models_with_extra_regressors():
+    train = _train_frame()
+    train["volume"] = np.arange(len(train), dtype=float)
+    model = Prophet()
+    model.add_regressor("volume")
+    model.fit(train)
+
+    with pytest.raises(UnsupportedProphetModel):
+        extract_prophet_params(model)
+
+
+def test_compact_artifact_round_trips_and_is_much_smaller_than_model_json():
+    train = _train_frame()
+    model = Prophet(daily_seasonality=True).fit(train)
+    params = dataclasses.replace(extract_prophet_params(model), model_version="abc123")
+
+    raw = encode_prophet_params(params)
+    restored = decode_prophet_params(raw)
+
+    assert restored.model_version == "abc123"
+    assert restored.seasonalities == params.seasonalities
+    assert len(raw) * 10 < len(model_to_json(model).encode("utf-8"))
+    future = _future(train)["ds"].to_numpy()
+    np.random.seed(3)
+    expected = evaluate_forecast(params, future)
+    np.random.seed(3)
+    actual = evaluate_forecast(restored, future)
+    for column, values in expected.items():
+        np.testing.assert_array_equal(actual[column], values)
@@ -0,0 +1,64 @@
+import json
+import os
+
+from utils.publish_registry import PublishRegistry
+
+
+def test_record_and_lookup_invalidate_on_external_change(tmp_path):
+    registry = PublishRegistry()
+    target = tmp_path / "prediction_BTC_USDT_1h.json"
+    target.write_text('{"updated_at": "2026-02-13T11:00:00Z"}')
+
+    artifact = registry.record(
+        target, updated_at="2026-02-13T11:00:00Z", sha256="abc"
+    )
+    assert artifact is not None
+    assert registry.lookup(target) == artifact
+
+    target.write_text('{"updated_at": "2026-02-13T12:00:00Z", "changed": true}')
+    assert registry.lookup(target) is None
+
+    target.unlink()
+    assert registry.record(target, updated_at="2026-02-13T12:00:00Z") is None
+
+
+def test_resolve_scans_once_then_serves_from_registry(tmp_path, monkeypatch):
+    registry = PublishRegistry()
+    target = tmp_path / "history_BTC_USDT_1d.json"
+    target.write_text(json.dumps({"updated_at": "2026-02-13T11:15:00Z", "data": []}))
+
+    first = registry.resolve(target)
+    assert first is not None
+    assert first.updated_at == "2026-02-13T11:15:00Z"
+    assert first.sha256 is None
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("registry hit must not reopen the file")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    assert registry.resolve(target) == first
+
+
+def test_resolve_returns_none_for_invalid_files(tmp_path):
+    registry = PublishRegistry()
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not-json")
+    missing_updated_at = tmp_path / "missing.json"
+    missing_updated_at.write_text("{}")
+
+    assert registry.resolve(broken) is None
+    assert registry.resolve(missing_updated_at) is None
+    assert registry.resolve(tmp_path / "absent.json") is None
+
+
+def test_cached_payload_requires_matching_stat(tmp_path):
+    registry = PublishRegistry()
+    target = tmp_path / "prediction_health.json"
+    target.write_text('{"entries": {}}')
+    registry.record_payload(target, {"BTC/USDT|1h": {"degraded": False}})
+
+    assert registry.cached_payload(target) == {"BTC/USDT|1h": {"degraded": False}}
+
+    stat_result = target.stat()
+    os.utime(target, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+    assert registry.cached_payload(target) is None
@@ -0,0 +1,115 @@
+import os
+
+from utils.file_io import atomic_write_json
+from utils.static_release import (
+    activate_release,
+    collect_release_sources,
+    prune_releases,
+    resolve_current_release,
+    retire_releases,
+    stage_release,
+)
+
+
+def _collect(static_dir):
+    return collect_release_sources(
+        static_dir,
+        file_prefixes=("history_", "prediction_"),
+        file_names=("manifest.json",),
+        directories=("history_v2",),
+        exclude_names=("prediction_health.json",),
+    )
+
+
+def _populate(static_dir, version: int) -> None:
+    atomic_write_json(static_dir / "manifest.json", {"version": version})
+    atomic_write_json(
+        static_dir / "prediction_BTC_USDT_1h.json",
+        {"version": version},
+        precompress=True,
+    )
+    atomic_write_json(static_dir / "history_v2" / "BTC_USDT_1h" / "index.json", {})
+    atomic_write_json(static_dir / "prediction_health.json", {})
+    atomic_write_json(static_dir / "ingest_state.json", {})
+    (static_dir / ".manifest.json.tmp").write_text("partial")
+
+
+def test_collect_release_sources_keeps_public_artifacts_only(tmp_path):
+    _populate(tmp_path, 1)
+
+    assert [path.as_posix() for path in _collect(tmp_path)] == [
+        "manifest.json",
+        "prediction_BTC_USDT_1h.json",
+        "prediction_BTC_USDT_1h.json.gz",
+        "history_v2/BTC_USDT_1h/index.json",
+    ]
+
+
+def test_stage_and_activate_release_swaps_consistent_snapshot(tmp_path):
+    releases_dir = tmp_path / "releases"
+    current_link = tmp_path / "current"
+    _populate(tmp_path, 1)
+
+    first = stage_release(
+        tmp_path, releases_dir, _collect(tmp_path), "20260301T000000Z"
+    )
+    activate_release(first, current_link)
+
+    assert first.name == "20260301T000000Z"
+    assert os.path.samefile(first / "manifest.json", tmp_path / "manifest.json")
+    assert (current_link / "manifest.json").read_text() == '{"version": 1}'
+    assert not os.path.isabs(os.readlink(current_link))
+
+    # 작업 디렉터리가 바뀌어도 활성 release는 link 시점의 내용을 유지한다.
+    _populate(tmp_path, 2)
+    assert (current_link / "manifest.json").read_text() == '{"version": 1}'
+
+    second = stage_release(
+        tmp_path, releases_dir, _collect(tmp_path), "20260301T000000Z"
+    )
+    assert second.name == "20260301T000000Z-1"
+    activate_release(second, current_link)
+    assert resolve_current_release(current_link) == second.resolve()
+    assert (current_link / "manifest.json").read_text() == '{"version": 2}'
+    assert (current_link / "history_v2" / "BTC_USDT_1h" / "index.json").exists()
+    assert not list(tmp_path.glob(".current*"))
+
+
+def test_prune_releases_keeps_latest_and_current(tmp_path):
+    releases_dir = tmp_path / "releases"
+    current_link = tmp_path / "current"
+    _populate(tmp_path, 1)
+    releases = [
+        stage_release(tmp_path, releases_dir, _collect(tmp_path), release_id)
+        for release_id in ("20260301T000000Z", "20260301T010000Z", "20260301T020000Z")
+    ]
+    (releases_dir / "20260301T030000Z.staging").mkdir()
+    activate_release(releases[0], current_link)
+
+    removed = prune_releases(releases_dir, 1, current_link)
+
+    assert sorted(path.name for path in removed) == [
+        "20260301T010000Z",
+        "20260301T030000Z.staging",
+    ]
+    assert sorted(path.name for path in releases_dir.iterdir()) == [
+        "20260301T000000Z",
+        "20260301T020000Z",
+    ]
+
+
+def test_retire_releases_removes_current_link_so_workdir_is_served(tmp_path):
+    releases_dir = tmp_path / "releases"
+    current_link = tmp_path / "current"
+    _populate(tmp_path, 1)
+    activate_release(
+        stage_release(tmp_path, releases_dir, _collect(tmp_path), "20260301T000000Z"),
+        current_link,
+    )
+
+    assert retire_releases(releases_dir, current_link) is True
+
+    assert not current_link.is_symlink()
+    assert not releases_dir.exists()
+    assert (tmp_path / "manifest.json").read_text() == '{"version": 1}'
+    assert retire_releases(releases_dir, current_link) is False
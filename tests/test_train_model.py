@@ -1,10 +1,12 @@
 import json
 import pytest
 import pandas as pd
+from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
 
 from scripts import train_model
+from utils.forecast_table import decode_forecast_table
 
 
 def test_parse_csv_uses_default_when_empty_or_none():
@@ -76,10 +78,13 @@ def test_main_returns_error_code_for_invalid_limit():
 def test_main_builds_training_plan_and_runs_job(monkeypatch):
     captured = {}
 
-    def fake_run_training_job(*, symbols, timeframes, lookback_limit):
+    def fake_run_training_job(
+        *, symbols, timeframes, lookback_limit, forecast_horizon_days
+    ):
         captured["symbols"] = symbols
         captured["timeframes"] = timeframes
         captured["lookback_limit"] = lookback_limit
+        captured["forecast_horizon_days"] = forecast_horizon_days
         return {"failed": 0}
 
     monkeypatch.setattr(train_model, "run_training_job", fake_run_training_job)
@@ -92,6 +97,8 @@ def test_main_builds_training_plan_and_runs_job(monkeypatch):
             "1h,1d",
             "--lookback-limit",
             "123",
+            "--forecast-horizon-days",
+            "30",
         ]
     )
 
@@ -100,6 +107,7 @@ def test_main_builds_training_plan_and_runs_job(monkeypatch):
         "symbols": ["BTC/USDT", "ETH/USDT"],
         "timeframes": ["1h", "1d"],
         "lookback_limit": 123,
+        "forecast_horizon_days": 30,
     }
 
 
@@ -212,6 +220,13 @@ def test_train_and_save_persists_model_metadata_schema(tmp_path, monkeypatch):
             self.fitted = True
             self.fit_input = df.copy()
 
+        def predict(self, future):
+            result = future.copy()
+            result["yhat"] = 101.0
+            result["yhat_lower"] = 100.0
+            result["yhat_upper"] = 102.0
+            return result
+
     monkeypatch.setattr(train_model, "Prophet", DummyProphet)
     monkeypatch.setattr(
         train_model,
@@ -271,3 +286,16 @@ def test_train_and_save_persists_model_metadata_schema(tmp_path, monkeypatch):
     assert payload["status"] == "ok"
     assert payload["trained_at"].endswith("Z")
     assert payload["model_version"] == result["model_version"]
+    # 학습 파라미터를 꺼낼 수 없는 모델은 compact artifact 없이 JSON만 발행한다.
+    assert payload["compact_model"] is None
+    assert not (models_dir / "model_BTC_USDT_1h.compact.npz").exists()
+
+    table = decode_forecast_table(
+        (models_dir / "model_BTC_USDT_1h.forecast.npz").read_bytes()
+    )
+    assert table.model_version == result["model_version"]
+    # 마지막 candle(01:00) 다음 경계부터 90일 + publish 24 step.
+    assert len(table.ds_ns) == 90 * 24 + 24
+    window = table.window(datetime(2026, 2, 26, 2, 0, tzinfo=timezone.utc))
+    assert window is not None
+    assert window["yhat"].tolist() == [101.0] * 24
@@ -0,0 +1,112 @@
+"""
+History downsampling.
+
+Why this module exists:
+- 장기 차트(1d/1w/1M 전체 구간, 긴 1h 창)는 화면 폭보다 훨씬 많은 candle을 받는다.
+  export 단계가 point budget별 축소본(pyramid level)을 미리 만들어 두면 클라이언트는
+  viewport에 맞는 level만 받으면 된다.
+- 두 가지 방식을 제공한다.
+  - LTTB(largest-triangle-three-buckets): 선 차트(close)의 시각적 모양을 보존하는 점 선택.
+  - OHLCV bucket 집계: 캔들 차트용. bucket의 open/high/low/close/volume 의미를 보존한다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def bucket_starts(length: int, buckets: int) -> np.ndarray:
+    """
+    길이 `length` 배열을 연속 구간 `buckets`개로 나눈 시작 index를 반환한다.
+
+    구간 크기는 최대 1 차이로 균등하다. `buckets >= length`면 모든 index.
+    """
+    if length <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if buckets >= length:
+        return np.arange(length, dtype=np.int64)
+    return (np.arange(buckets, dtype=np.int64) * length) // buckets
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    LTTB로 남길 점의 index(오름차순)를 반환한다.
+
+    - 첫/마지막 점은 항상 포함한다.
+    - `threshold < 3`이거나 점 수가 threshold 이하이면 전체 index를 반환한다.
+    - bucket 평균은 누적합으로 한 번에 계산하고, 직전 선택점에 의존하는
+      삼각형 면적 비교만 bucket 단위로 순회한다.
+    - y가 NaN인 점은 선택하지 않는다(bucket 전체가 NaN이면 첫 점).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    length = len(x)
+    if threshold < 3 or length <= threshold:
+        return np.arange(length, dtype=np.int64)
+
+    # 가운데 threshold-2개 bucket: [starts[i], starts[i + 1])
+    every = (length - 2) / (threshold - 2)
+    starts = (np.floor(np.arange(threshold - 1) * every) + 1).astype(np.int64)
+    starts[-1] = length - 1
+    lows, highs = starts[:-1], starts[1:]
+
+    finite_y = np.where(np.isnan(y), 0.0, y)
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(finite_y)))
+    sizes = highs - lows
+    avg_x = (cum_x[highs] - cum_x[lows]) / sizes
+    avg_y = (cum_y[highs] - cum_y[lows]) / sizes
+    # bucket i의 세 번째 꼭짓점은 다음 bucket 평균(마지막 bucket은 마지막 점).
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], finite_y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = length - 1
+    anchor = 0
+    for bucket, (low, high) in enumerate(zip(lows.tolist(), highs.tolist())):
+        area = np.abs(
+            (x[anchor] - next_x[bucket]) * (y[low:high] - y[anchor])
+            - (x[anchor] - x[low:high]) * (next_y[bucket] - y[anchor])
+        )
+        area[np.isnan(area)] = -1.0
+        anchor = low + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def aggregate_ohlcv(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    buckets: int,
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    연속 candle을 `buckets`개 구간으로 묶어 OHLCV를 집계한다.
+
+    Returns:
+      - starts: 각 bucket의 첫 candle index(bucket timestamp로 쓴다)
+      - columns: open(첫 값), high(max), low(min), close(마지막 값), volume(합)
+        high/low/volume은 NaN을 무시한다.
+    """
+    starts = bucket_starts(len(close), buckets)
+    if len(starts) == 0:
+        empty = np.zeros(0, dtype=np.float64)
+        return starts, {
+            "open": empty,
+            "high": empty,
+            "low": empty,
+            "close": empty,
+            "volume": empty,
+        }
+    ends = np.append(starts[1:], len(close)) - 1
+    volume = np.asarray(volume, dtype=np.float64)
+    return starts, {
+        "open": np.asarray(open_, dtype=np.float64)[starts],
+        "high": np.fmax.reduceat(np.asarray(high, dtype=np.float64), starts),
+        "low": np.fmin.reduceat(np.asarray(low, dtype=np.float64), starts),
+        "close": np.asarray(close, dtype=np.float64)[ends],
+        "volume": np.add.reduceat(np.where(np.isnan(volume), 0.0, volume), starts),
+    }
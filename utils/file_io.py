@@ -1,30 +1,734 @@
+import ctypes
+import gzip
+import hashlib
 import json
 import os
+import shutil
 import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, Iterable, Iterator
 
+# nginx `gzip_static`/`brotli_static`이 찾는 사전 압축 sibling 확장자.
+PRECOMPRESSED_SUFFIXES = (".gz", ".br")
+# 스트리밍 압축/해시에서 한 번에 읽는 블록 크기.
+_STREAM_BLOCK_BYTES = 1024 * 1024
 
-def atomic_write_json(
-    path: str | Path, payload: Any, indent: int | None = None
+# `deferred_fsync()` 중첩 깊이. 0보다 크면 temp 파일 fsync를 건너뛴다.
+_deferred_fsync_depth = 0
+_deferred_fsync_lock = threading.Lock()
+
+# path -> ((st_mtime_ns, st_size), sha256). stat이 같으면 파일을 다시 읽지 않는다.
+_file_digest_cache: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _load_brotli_module() -> Any | None:
+    """
+    brotli는 선택 의존성이다. 없으면 `.br` sibling만 건너뛴다.
+    """
+    try:
+        import brotli  # type: ignore
+    except ModuleNotFoundError:
+        return None
+    return brotli
+
+
+def _atomic_replace(
+    path: str | Path,
+    write: Callable[[IO[Any]], None],
+    *,
+    binary: bool = False,
+    durable: bool = False,
 ) -> None:
     """
-    JSON을 저장하다가 죽어도 파일이 깨지지 않게 만듦(안전 장치)
-    json.dump() 대신 사용
+    temp 파일에 write 콜백으로 기록 -> fsync -> rename 순서를 강제한다.
+    `deferred_fsync()` 구간에서는 fsync를 건너뛰고 구간 끝의 syncfs 1회에 맡긴다.
+    durable=True(worker state 파일)면 구간 안에서도 항상 fsync한다.
+
+    Called from:
+    - `atomic_write_json`
+    - `atomic_write_text`
+    - `atomic_write_chunks`
+    - `write_precompressed_siblings` / `stream_precompressed_siblings`
     """
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     fd, temp_path = tempfile.mkstemp(
-        dir=str(file_path.parent), prefix=f".{file_path.name}.", text=True
+        dir=str(file_path.parent), prefix=f".{file_path.name}.", text=not binary
     )
     try:
-        with os.fdopen(fd, "w") as temp_file:
-            json.dump(payload, temp_file, indent=indent)
+        with os.fdopen(fd, "wb" if binary else "w") as temp_file:
+            write(temp_file)
             temp_file.flush()
-            os.fsync(temp_file.fileno())
+            if durable or not _deferred_fsync_depth:
+                os.fsync(temp_file.fileno())
         os.replace(temp_path, file_path)
         os.chmod(file_path, 0o644)
     finally:
         if os.path.exists(temp_path):
             os.remove(temp_path)
+
+
+def _load_libc() -> Any | None:
+    """syncfs 호출용 libc. 찾을 수 없는 플랫폼이면 None."""
+    try:
+        return ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+
+def syncfs(path: str | Path) -> None:
+    """
+    path가 속한 filesystem의 dirty data/metadata를 한 번에 flush한다.
+
+    Linux `syncfs(2)`를 ctypes로 부르고, 없는 플랫폼에서는 `os.sync()`로 대신한다.
+    """
+    libc = _load_libc()
+    if libc is None or not hasattr(libc, "syncfs"):
+        os.sync()
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if libc.syncfs(fd) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(path: str | Path) -> None:
+    """rename/symlink 교체 같은 directory entry 변경을 디스크에 반영한다."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def deferred_fsync(flush_path: str | Path | None) -> Iterator[None]:
+    """
+    구간 안의 atomic write가 파일별 fsync를 건너뛰고, 구간을 나갈 때
+    `flush_path` filesystem에 syncfs를 한 번 호출한다.
+
+    Called from:
+    - `scripts.pipeline_worker.run_worker` (release publish cycle)
+
+    Why:
+    - cycle마다 파일 수만큼 내던 fsync stall을 cycle당 1회로 줄인다.
+    - rename 원자성은 그대로라 독자는 항상 완결된 파일을 본다. 구간 중 crash면
+      마지막 cycle의 write만 유실될 수 있고, 다음 cycle이 다시 만든다.
+    - 다음 cycle이 다시 만들 수 없는 worker state(ingest_state, watermark,
+      symbol_activation, prediction_health)는 `durable=True`로 기록해 구간과
+      무관하게 파일별 fsync를 유지한다.
+    - 예외로 빠져나가도 syncfs는 호출한다.
+
+    `flush_path`가 None이면 아무것도 바꾸지 않는다.
+    """
+    global _deferred_fsync_depth
+    if flush_path is None:
+        yield
+        return
+    with _deferred_fsync_lock:
+        _deferred_fsync_depth += 1
+    try:
+        yield
+    finally:
+        with _deferred_fsync_lock:
+            _deferred_fsync_depth -= 1
+        syncfs(flush_path)
+
+
+def precompressed_sibling_paths(path: str | Path) -> list[Path]:
+    """`{path}.gz`, `{path}.br` 경로를 반환한다."""
+    file_path = Path(path)
+    return [
+        file_path.with_name(file_path.name + suffix)
+        for suffix in PRECOMPRESSED_SUFFIXES
+    ]
+
+
+def remove_precompressed_siblings(path: str | Path) -> None:
+    """
+    사전 압축 sibling을 제거한다.
+
+    Why:
+    - 원본만 갱신되고 sibling이 남으면 nginx가 오래된 압축본을 계속 서빙한다.
+    """
+    for sibling in precompressed_sibling_paths(path):
+        sibling.unlink(missing_ok=True)
+
+
+def _match_source_mtime(path: Path, siblings: list[Path]) -> None:
+    """
+    압축 sibling의 mtime을 원본과 같게 맞춘다.
+
+    Why:
+    - nginx `gzip_static`은 sibling 파일의 mtime으로 Last-Modified를 보낸다.
+      원본과 같게 두면 manifest의 `last_modified` 하나가 어떤 표현에도 그대로 맞는다.
+    """
+    source_mtime_ns = path.stat().st_mtime_ns
+    for sibling in siblings:
+        os.utime(sibling, ns=(source_mtime_ns, source_mtime_ns))
+
+
+def write_precompressed_siblings(path: str | Path, data: bytes) -> list[Path]:
+    """
+    원본 bytes로 `.gz`(+brotli 설치 시 `.br`) sibling을 atomic write한다.
+
+    Called from:
+    - `atomic_write_json` / `atomic_write_text` (`precompress=True`)
+
+    Why:
+    - 요청마다 nginx가 동적 압축하는 CPU 비용을 publish 시점 1회로 옮긴다.
+    - gzip mtime을 0으로 고정해 같은 내용이면 같은 bytes가 나오게 한다.
+    """
+    gz_path, br_path = precompressed_sibling_paths(path)
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    _atomic_replace(gz_path, lambda f: f.write(compressed), binary=True)
+    written = [gz_path]
+
+    brotli = _load_brotli_module()
+    if brotli is None:
+        # 모듈이 빠진 이미지로 교체된 경우 이전 `.br`이 stale로 남지 않게 한다.
+        br_path.unlink(missing_ok=True)
+    else:
+        br_compressed = brotli.compress(data, quality=9)
+        _atomic_replace(br_path, lambda f: f.write(br_compressed), binary=True)
+        written.append(br_path)
+    _match_source_mtime(Path(path), written)
+    return written
+
+
+def stream_precompressed_siblings(path: str | Path) -> list[Path]:
+    """
+    디스크의 원본 파일을 블록 단위로 읽어 `.gz`(+`.br`) sibling을 atomic write한다.
+
+    Called from:
+    - `atomic_write_chunks` (원본 bytes를 메모리에 두지 않는 경로)
+    - skip된 write에서 sibling만 빠진 경우
+
+    출력은 `write_precompressed_siblings`와 같은 설정(gzip level 9, mtime=0)이다.
+    """
+    file_path = Path(path)
+    gz_path, br_path = precompressed_sibling_paths(file_path)
+
+    def write_gzip(temp_file: IO[Any]) -> None:
+        with open(file_path, "rb") as source, gzip.GzipFile(
+            filename="", mode="wb", fileobj=temp_file, compresslevel=9, mtime=0
+        ) as compressed:
+            shutil.copyfileobj(source, compressed, _STREAM_BLOCK_BYTES)
+
+    _atomic_replace(gz_path, write_gzip, binary=True)
+    written = [gz_path]
+
+    brotli = _load_brotli_module()
+    if brotli is None:
+        br_path.unlink(missing_ok=True)
+        _match_source_mtime(file_path, written)
+        return written
+
+    def write_brotli(temp_file: IO[Any]) -> None:
+        compressor = brotli.Compressor(quality=9)
+        with open(file_path, "rb") as source:
+            for block in iter(lambda: source.read(_STREAM_BLOCK_BYTES), b""):
+                temp_file.write(compressor.process(block))
+        temp_file.write(compressor.finish())
+
+    _atomic_replace(br_path, write_brotli, binary=True)
+    written.append(br_path)
+    _match_source_mtime(file_path, written)
+    return written
+
+
+@dataclass(frozen=True)
+class AtomicWriteResult:
+    """
+    atomic write 결과.
+
+    - sha256/size_bytes: 디스크에 있는 파일 기준(skip이면 기존 파일 값)
+    - written: False면 내용이 같아 rename/fsync를 건너뛰었다.
+    """
+
+    path: Path
+    size_bytes: int
+    sha256: str
+    written: bool
+
+
+# path -> ((st_mtime_ns, st_size), fingerprint digest, file sha256, size)
+# fingerprint는 "바뀌었는지" 판단에 쓰는 내용(ignore_keys 제거본 등)의 hash다.
+_write_fingerprint_cache: dict[str, tuple[tuple[int, int], str, str, int]] = {}
+_write_counts: dict[str, int] = {"written": 0, "skipped": 0}
+# publish 단계가 thread pool로 병렬 실행될 수 있어 카운터 갱신은 lock으로 보호한다.
+_write_counts_lock = threading.Lock()
+
+
+def _count_write(key: str) -> None:
+    with _write_counts_lock:
+        _write_counts[key] += 1
+
+
+def consume_write_counts() -> dict[str, int]:
+    """
+    마지막 호출 이후 skip_unchanged 대상 write의 written/skipped 횟수를 반환하고 초기화한다.
+
+    Called from:
+    - `scripts.pipeline_worker` cycle runtime metrics
+    """
+    with _write_counts_lock:
+        counts = dict(_write_counts)
+        for key in _write_counts:
+            _write_counts[key] = 0
+    return counts
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _probe_existing_file(
+    path: Path,
+    signature: tuple[int, int],
+    cold_fingerprint: Callable[[bytes], bytes | None] | None,
+) -> tuple[tuple[int, int], str, str, int] | None:
+    """
+    캐시가 없거나 stat이 달라졌을 때 디스크 파일로 fingerprint를 복원한다.
+
+    cold_fingerprint가 None이면 파일 bytes 자체가 fingerprint다.
+    """
+    try:
+        existing = path.read_bytes()
+    except OSError:
+        return None
+    file_digest = hashlib.sha256(existing).hexdigest()
+    if cold_fingerprint is None:
+        fingerprint_digest = file_digest
+    else:
+        fingerprint = cold_fingerprint(existing)
+        if fingerprint is None:
+            return None
+        fingerprint_digest = hashlib.sha256(fingerprint).hexdigest()
+    entry = (signature, fingerprint_digest, file_digest, len(existing))
+    _write_fingerprint_cache[str(path)] = entry
+    return entry
+
+
+def _skip_unchanged_write(
+    file_path: Path,
+    fingerprint_digest: str,
+    *,
+    precompress: bool,
+    cold_fingerprint: Callable[[bytes], bytes | None] | None,
+) -> AtomicWriteResult | None:
+    """
+    디스크 파일의 fingerprint가 같으면 skip 결과를, 아니면 None을 반환한다.
+
+    skip하더라도 precompress 설정에 맞게 sibling 상태는 맞춘다.
+    """
+    signature = _stat_signature(file_path)
+    if signature is None:
+        return None
+    cached = _write_fingerprint_cache.get(str(file_path))
+    if cached is None or cached[0] != signature:
+        cached = _probe_existing_file(file_path, signature, cold_fingerprint)
+    if cached is None or cached[1] != fingerprint_digest:
+        return None
+    if precompress:
+        if not precompressed_sibling_paths(file_path)[0].exists():
+            stream_precompressed_siblings(file_path)
+    else:
+        remove_precompressed_siblings(file_path)
+    _count_write("skipped")
+    return AtomicWriteResult(
+        path=file_path,
+        size_bytes=cached[3],
+        sha256=cached[2],
+        written=False,
+    )
+
+
+def _record_written(
+    file_path: Path,
+    *,
+    fingerprint_digest: str,
+    file_digest: str,
+    size_bytes: int,
+    skip_unchanged: bool,
+) -> AtomicWriteResult:
+    """
+    방금 쓴 파일의 digest/fingerprint 캐시를 채우고 write 결과를 만든다.
+    """
+    signature = _stat_signature(file_path)
+    if signature is not None:
+        # 방금 쓴 파일의 hash는 알고 있으므로 manifest용 digest 캐시도 채운다.
+        _file_digest_cache[str(file_path)] = (signature, file_digest)
+        if skip_unchanged:
+            _write_fingerprint_cache[str(file_path)] = (
+                signature,
+                fingerprint_digest,
+                file_digest,
+                size_bytes,
+            )
+    if skip_unchanged:
+        _count_write("written")
+    return AtomicWriteResult(
+        path=file_path,
+        size_bytes=size_bytes,
+        sha256=file_digest,
+        written=True,
+    )
+
+
+def _write_document(
+    path: str | Path,
+    data: bytes,
+    *,
+    precompress: bool,
+    skip_unchanged: bool,
+    fingerprint: bytes | None = None,
+    cold_fingerprint: Callable[[bytes], bytes | None] | None = None,
+    durable: bool = False,
+) -> AtomicWriteResult:
+    """
+    bytes를 atomic write하고, skip_unchanged면 fingerprint가 같을 때 write를 건너뛴다.
+
+    Called from:
+    - `atomic_write_json` / `atomic_write_text` / `atomic_write_bytes`
+
+    Why:
+    - idle cycle에서 같은 내용을 다시 쓰는 temp+fsync+rename 비용(디스크 쓰기,
+      fsync stall, flash 마모)을 없애고 mtime/ETag를 안정적으로 유지한다.
+    - 비교 기준은 메모리 캐시이며 (mtime_ns, size)로 검증한다. 캐시가 없거나
+      외부에서 파일이 바뀌었으면 디스크 파일을 한 번 읽어 복원한다.
+    """
+    file_path = Path(path)
+    fingerprint_digest = hashlib.sha256(
+        fingerprint if fingerprint is not None else data
+    ).hexdigest()
+
+    if skip_unchanged:
+        skipped = _skip_unchanged_write(
+            file_path,
+            fingerprint_digest,
+            precompress=precompress,
+            cold_fingerprint=cold_fingerprint if fingerprint is not None else None,
+        )
+        if skipped is not None:
+            return skipped
+
+    _atomic_replace(
+        file_path,
+        lambda temp_file: temp_file.write(data),
+        binary=True,
+        durable=durable,
+    )
+    if precompress:
+        write_precompressed_siblings(file_path, data)
+    else:
+        remove_precompressed_siblings(file_path)
+
+    return _record_written(
+        file_path,
+        fingerprint_digest=fingerprint_digest,
+        file_digest=(
+            fingerprint_digest
+            if fingerprint is None
+            else hashlib.sha256(data).hexdigest()
+        ),
+        size_bytes=len(data),
+        skip_unchanged=skip_unchanged,
+    )
+
+
+def atomic_write_chunks(
+    path: str | Path,
+    chunks: Iterable[str],
+    *,
+    precompress: bool = False,
+    skip_unchanged: bool = False,
+    fingerprint_digest: str | None = None,
+) -> AtomicWriteResult:
+    """
+    문자열 조각을 temp 파일에 순서대로 흘려 쓰고 atomic rename한다.
+
+    Called from:
+    - `workers.export` history 파일 기록
+
+    Why:
+    - 큰 문서를 한 문자열/bytes로 조립하지 않아 peak memory가 조각 크기로 제한된다.
+    - sha256/size는 쓰는 동안 계산하고, 압축 sibling은 기록된 파일을 블록 단위로
+      다시 읽어 만든다. atomic/fsync 보장은 `_atomic_replace`와 같다.
+
+    skip_unchanged는 호출자가 계산한 fingerprint_digest(sha256 hex)로만 비교한다.
+    디스크 파일에서 복원할 수 없으므로 cold start 첫 write는 항상 쓴다.
+    """
+    file_path = Path(path)
+    if skip_unchanged and fingerprint_digest is not None:
+        skipped = _skip_unchanged_write(
+            file_path,
+            fingerprint_digest,
+            precompress=precompress,
+            cold_fingerprint=lambda existing: None,
+        )
+        if skipped is not None:
+            return skipped
+
+    file_hash = hashlib.sha256()
+    size_bytes = 0
+
+    def write(temp_file: IO[Any]) -> None:
+        nonlocal size_bytes
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            temp_file.write(data)
+            file_hash.update(data)
+            size_bytes += len(data)
+
+    _atomic_replace(file_path, write, binary=True)
+    if precompress:
+        stream_precompressed_siblings(file_path)
+    else:
+        remove_precompressed_siblings(file_path)
+
+    file_digest = file_hash.hexdigest()
+    return _record_written(
+        file_path,
+        fingerprint_digest=fingerprint_digest or file_digest,
+        file_digest=file_digest,
+        size_bytes=size_bytes,
+        skip_unchanged=skip_unchanged and fingerprint_digest is not None,
+    )
+
+
+def _json_fingerprint(
+    payload: Any,
+    indent: int | None,
+    ignore_keys: tuple[str, ...],
+    normalize: Callable[[Any], Any] | None = None,
+) -> bytes:
+    if isinstance(payload, dict):
+        payload = {
+            key: value for key, value in payload.items() if key not in ignore_keys
+        }
+    if normalize is not None:
+        payload = normalize(payload)
+    return json.dumps(payload, indent=indent).encode("utf-8")
+
+
+def atomic_write_json(
+    path: str | Path,
+    payload: Any,
+    indent: int | None = None,
+    *,
+    precompress: bool = False,
+    skip_unchanged: bool = False,
+    ignore_keys: tuple[str, ...] = (),
+    normalize: Callable[[Any], Any] | None = None,
+    durable: bool = False,
+) -> AtomicWriteResult:
+    """
+    JSON을 저장하다가 죽어도 파일이 깨지지 않게 만듦(안전 장치)
+    json.dump() 대신 사용
+
+    precompress=True면 원본 기록 후 `.gz`/`.br` sibling도 같은 내용으로 갱신한다.
+    False면 남아 있는 sibling을 지워 원본과 어긋난 압축본이 서빙되지 않게 한다.
+
+    skip_unchanged=True면 내용이 같을 때 쓰지 않는다. ignore_keys(top-level)는
+    비교에서 제외한다(`updated_at`처럼 매번 바뀌는 필드). 이 경우 skip되면 파일의
+    해당 필드는 마지막으로 내용이 바뀐 시점 값으로 남는다.
+    normalize는 중첩된 volatile 값을 비교에서 빼는 함수다(top-level ignore_keys 적용 후 호출,
+    payload를 수정하지 말고 새 값을 돌려줘야 한다).
+
+    durable=True면 `deferred_fsync()` 구간 안에서도 fsync한다(worker state 파일).
+    """
+    text = json.dumps(payload, indent=indent)
+    fingerprint = None
+    cold_fingerprint = None
+    if skip_unchanged and (ignore_keys or normalize is not None):
+        fingerprint = _json_fingerprint(payload, indent, ignore_keys, normalize)
+
+        def cold_fingerprint(existing: bytes) -> bytes | None:
+            try:
+                return _json_fingerprint(
+                    json.loads(existing), indent, ignore_keys, normalize
+                )
+            except (ValueError, TypeError, KeyError, AttributeError):
+                return None
+
+    return _write_document(
+        path,
+        text.encode("utf-8"),
+        precompress=precompress,
+        skip_unchanged=skip_unchanged,
+        fingerprint=fingerprint,
+        cold_fingerprint=cold_fingerprint,
+        durable=durable,
+    )
+
+
+def atomic_write_text(
+    path: str | Path,
+    text: str,
+    *,
+    precompress: bool = False,
+    skip_unchanged: bool = False,
+    fingerprint: str | None = None,
+) -> AtomicWriteResult:
+    """
+    이미 직렬화된 문자열을 atomic write한다.
+
+    Why:
+    - 증분 export처럼 JSON 조각을 재사용하는 경로도 동일한 atomic 보장을 받게 한다.
+
+    fingerprint를 주면 skip 비교에 text 대신 사용한다(`updated_at`을 뺀 본문 등).
+    디스크 파일에서 fingerprint를 복원할 수 없으므로 cold start 첫 write는 항상 쓴다.
+    """
+    return _write_document(
+        path,
+        text.encode("utf-8"),
+        precompress=precompress,
+        skip_unchanged=skip_unchanged,
+        fingerprint=fingerprint.encode("utf-8") if fingerprint is not None else None,
+        cold_fingerprint=lambda existing: None,
+    )
+
+
+def atomic_write_bytes(
+    path: str | Path,
+    data: bytes,
+    *,
+    skip_unchanged: bool = False,
+    fingerprint: str | None = None,
+) -> AtomicWriteResult:
+    """
+    binary 산출물(Arrow IPC 등)을 atomic write한다.
+    """
+    return _write_document(
+        path,
+        data,
+        precompress=False,
+        skip_unchanged=skip_unchanged,
+        fingerprint=fingerprint.encode("utf-8") if fingerprint is not None else None,
+        cold_fingerprint=lambda existing: None,
+    )
+
+
+def _already_published(source: Path, target: Path) -> bool:
+    """
+    target이 source와 같은 inode거나(link) 같은 내용이면(copy fallback) True.
+    """
+    try:
+        if os.path.samefile(source, target):
+            return True
+    except OSError:
+        return False
+    return file_sha256(target) == file_sha256(source)
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """
+    source를 target 이름으로 atomic 발행한다. hard link를 우선 쓰고 불가하면 copy한다.
+
+    - link: temp 이름으로 link 후 `os.replace` -> 독자는 이전/새 파일 중 하나만 본다.
+    - copy: 다른 파일시스템(EXDEV)/link 미지원 FS에서 `_atomic_replace`로 스트리밍 복사.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # 병렬 publish에서 같은 target을 동시에 발행할 수 있어 thread별 temp 이름을 쓴다.
+    temp_path = target.with_name(
+        f".{target.name}.{os.getpid()}.{threading.get_ident()}.link"
+    )
+    try:
+        temp_path.unlink(missing_ok=True)
+        os.link(source, temp_path)
+        os.replace(temp_path, target)
+        return
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+
+    def copy(temp_file: IO[Any]) -> None:
+        with open(source, "rb") as source_file:
+            shutil.copyfileobj(source_file, temp_file, _STREAM_BLOCK_BYTES)
+
+    _atomic_replace(target, copy, binary=True)
+
+
+def atomic_link_or_copy(
+    source: str | Path, target: str | Path
+) -> AtomicWriteResult:
+    """
+    이미 기록된 source 파일(+압축 sibling)을 target 이름으로도 발행한다.
+
+    Called from:
+    - canonical + legacy dual-write 경로(history/tail/arrow/prediction/model)
+
+    Why:
+    - 같은 payload를 두 번 직렬화/fsync하지 않는다. canonical을 한 번 쓰고 legacy는
+      같은 inode를 가리키는 hard link로 바꿔 끼운다.
+    - canonical이 다음 write에서 rename으로 교체돼도 legacy는 이전 inode를 그대로 가리키므로,
+      다시 발행하기 전까지 두 이름의 내용이 섞이지 않는다.
+    - target이 이미 source와 같은 inode거나 같은 내용이면 아무것도 하지 않는다
+      (written=False).
+    """
+    source_path = Path(source)
+    target_path = Path(target)
+    written = not _already_published(source_path, target_path)
+    if written:
+        _link_or_copy(source_path, target_path)
+    for source_sibling, target_sibling in zip(
+        precompressed_sibling_paths(source_path),
+        precompressed_sibling_paths(target_path),
+    ):
+        if not source_sibling.exists():
+            target_sibling.unlink(missing_ok=True)
+        elif not _already_published(source_sibling, target_sibling):
+            _link_or_copy(source_sibling, target_sibling)
+
+    digest = file_sha256(source_path)
+    signature = _stat_signature(target_path)
+    # target은 더 이상 자체 write fingerprint를 갖지 않는다.
+    _write_fingerprint_cache.pop(str(target_path), None)
+    if signature is not None and digest is not None:
+        _file_digest_cache[str(target_path)] = (signature, digest)
+    return AtomicWriteResult(
+        path=target_path,
+        size_bytes=signature[1] if signature is not None else 0,
+        sha256=digest or "",
+        written=written,
+    )
+
+
+def file_sha256(path: str | Path) -> str | None:
+    """
+    파일 sha256을 반환한다. 파일이 없으면 None.
+
+    Why:
+    - manifest처럼 매 cycle 같은 파일의 hash를 묻는 경로에서 재읽기를 피한다.
+    - (mtime_ns, size)가 같으면 캐시 값을 쓴다. atomic write는 rename으로
+      새 inode를 만들므로 내용이 바뀌면 stat도 바뀐다.
+    """
+    file_path = Path(path)
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
+        return None
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cache_key = str(file_path)
+    cached = _file_digest_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_STREAM_BLOCK_BYTES), b""):
+            digest.update(chunk)
+    hexdigest = digest.hexdigest()
+    _file_digest_cache[cache_key] = (signature, hexdigest)
+    return hexdigest
@@ -0,0 +1,126 @@
+"""
+Precomputed forecast tables.
+
+Why this module exists:
+- 학습된 Prophet 모델의 미래 시점 예측은 모델이 바뀌기 전까지 결정적이다.
+  publish 단계가 매번 24 step을 다시 계산하지 않도록 학습 시점에 horizon 전체를
+  미리 계산해 모델 옆에 columnar 배열(`.forecast.npz`)로 둔다.
+- publish는 `next_timeframe_boundary`부터 24행을 잘라 쓰고, horizon을 벗어나거나
+  모델 버전이 맞지 않으면 실시간 예측으로 되돌아간다.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# publish 1회에 발행하는 예측 step 수.
+FORECAST_STEPS = 24
+FORECAST_TABLE_SUFFIX = ".forecast.npz"
+FORECAST_TABLE_FORMAT_VERSION = 1
+_VALUE_COLUMNS = ("yhat", "yhat_lower", "yhat_upper")
+
+
+@dataclass(frozen=True)
+class ForecastTable:
+    """
+    모델 1개의 미래 예측 표.
+
+    - ds_ns: tz-naive UTC timestamp(ns), 오름차순
+    - model_version: 표를 만든 모델의 `.meta.json` model_version
+    """
+
+    model_version: str | None
+    ds_ns: np.ndarray
+    yhat: np.ndarray
+    yhat_lower: np.ndarray
+    yhat_upper: np.ndarray
+
+    def window(
+        self, start: datetime, steps: int = FORECAST_STEPS
+    ) -> pd.DataFrame | None:
+        """
+        `start`(UTC)부터 `steps`행을 Prophet forecast와 같은 column으로 잘라낸다.
+
+        start가 표의 grid에 없거나 남은 행이 부족하면 None.
+        """
+        start_ts = pd.Timestamp(start)
+        if start_ts.tzinfo is not None:
+            start_ts = start_ts.tz_convert("UTC").tz_localize(None)
+        start_ns = start_ts.value
+        position = int(np.searchsorted(self.ds_ns, start_ns))
+        if position + steps > len(self.ds_ns) or self.ds_ns[position] != start_ns:
+            return None
+        rows = slice(position, position + steps)
+        return pd.DataFrame(
+            {
+                "ds": self.ds_ns[rows].astype("datetime64[ns]"),
+                "yhat": self.yhat[rows],
+                "yhat_lower": self.yhat_lower[rows],
+                "yhat_upper": self.yhat_upper[rows],
+            }
+        )
+
+
+def forecast_table_path(model_path: Path) -> Path:
+    """`model_X_1h.json` -> `model_X_1h.forecast.npz`."""
+    return model_path.with_name(f"{model_path.stem}{FORECAST_TABLE_SUFFIX}")
+
+
+def model_meta_path(model_path: Path) -> Path:
+    """`model_X_1h.json` -> `model_X_1h.meta.json`."""
+    return model_path.with_name(f"{model_path.stem}.meta.json")
+
+
+def forecast_table_from_frame(
+    forecast: pd.DataFrame, model_version: str | None
+) -> ForecastTable:
+    """Prophet forecast DataFrame(ds/yhat/yhat_lower/yhat_upper)에서 표를 만든다."""
+    ordered = forecast.sort_values("ds")
+    ds = pd.to_datetime(ordered["ds"])
+    if ds.dt.tz is not None:
+        ds = ds.dt.tz_convert("UTC").dt.tz_localize(None)
+    return ForecastTable(
+        model_version=model_version,
+        ds_ns=ds.to_numpy(dtype="datetime64[ns]").astype(np.int64),
+        **{
+            column: ordered[column].to_numpy(dtype=np.float64)
+            for column in _VALUE_COLUMNS
+        },
+    )
+
+
+def encode_forecast_table(table: ForecastTable) -> bytes:
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        format_version=np.int64(FORECAST_TABLE_FORMAT_VERSION),
+        model_version=np.str_(table.model_version or ""),
+        ds_ns=table.ds_ns,
+        yhat=table.yhat,
+        yhat_lower=table.yhat_lower,
+        yhat_upper=table.yhat_upper,
+    )
+    return buffer.getvalue()
+
+
+def decode_forecast_table(raw: bytes) -> ForecastTable:
+    """
+    Raises:
+      - ValueError: 지원하지 않는 format version 또는 깨진 archive
+    """
+    with np.load(io.BytesIO(raw), allow_pickle=False) as archive:
+        version = int(archive["format_version"])
+        if version != FORECAST_TABLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported forecast table version: {version}")
+        model_version = str(archive["model_version"]) or None
+        return ForecastTable(
+            model_version=model_version,
+            ds_ns=archive["ds_ns"].astype(np.int64),
+            **{column: archive[column] for column in _VALUE_COLUMNS},
+        )
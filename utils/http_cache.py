@@ -0,0 +1,87 @@
+"""
+HTTP caching validators.
+
+Why this module exists:
+- worker(manifest `last_modified`)와 API(`/status`)가 같은 HTTP-date 규칙을 쓰고,
+  API는 조건부 요청(If-None-Match/If-Modified-Since)을 판정한다.
+- 반복 polling이 본문 없는 304 교환으로 끝나도록 하는 것이 목적이다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+
+def format_http_date(value: datetime) -> str:
+    """datetime을 HTTP-date(`Sun, 06 Nov 1994 08:49:37 GMT`)로 만든다."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def parse_http_date(value: str | None) -> datetime | None:
+    """HTTP-date를 UTC datetime으로 읽는다. 형식이 틀리면 None."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    응답의 의미를 결정하는 값들로 weak ETag를 만든다.
+
+    `/status`처럼 age 같은 파생 값이 매 요청 바뀌어도, 판정에 쓰는 값이 같으면
+    같은 표현으로 본다.
+    """
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return f'W/"{hashlib.sha256(encoded).hexdigest()[:32]}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 목록 중 하나라도 weak 비교로 일치하면 True(`*` 포함)."""
+    if not if_none_match:
+        return False
+    target = _opaque_tag(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _opaque_tag(candidate) == target:
+            return True
+    return False
+
+
+def is_not_modified(
+    *,
+    etag: str,
+    last_modified: datetime | None,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+) -> bool:
+    """
+    조건부 GET이 304로 끝나도 되는지 판정한다.
+
+    RFC 9110 순서를 따른다. If-None-Match가 있으면 그것만 보고,
+    없을 때만 If-Modified-Since를 초 단위로 비교한다.
+    """
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if if_modified_since is None or last_modified is None:
+        return False
+    since = parse_http_date(if_modified_since)
+    if since is None:
+        return False
+    return last_modified.replace(microsecond=0) <= since
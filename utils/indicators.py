@@ -0,0 +1,255 @@
+"""
+Technical indicator kernels.
+
+Why this module exists:
+- 클라이언트마다 history candle로 이동평균/RSI/ATR/Bollinger를 다시 계산하지 않도록
+  export 단계가 한 번 계산해 sidecar로 발행한다.
+- 이전 export의 결과(state)를 이어받아, 바뀌지 않은 앞부분은 재사용하고
+  새로 붙었거나 정정된 candle부터만 계산한다.
+
+Spec 문자열: `"{kind}_{period}"`(예: `sma_20`, `rsi_14`, `bb_20`).
+- sma: close 단순이동평균
+- ema: close 지수이동평균(alpha=2/(period+1), 첫 값 seed)
+- rsi: Wilder RSI(alpha=1/period)
+- atr: Wilder ATR(true range 기준)
+- bb: Bollinger band(period SMA ± 2 * 모표준편차) -> `_upper/_middle/_lower`
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+SUPPORTED_INDICATORS = ("sma", "ema", "rsi", "atr", "bb")
+BOLLINGER_STDDEV = 2.0
+_INPUT_COLUMNS = ["high", "low", "close"]
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    kind: str
+    period: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}_{self.period}"
+
+    def output_columns(self) -> list[str]:
+        if self.kind == "bb":
+            return [f"{self.name}_upper", f"{self.name}_middle", f"{self.name}_lower"]
+        return [self.name]
+
+
+@dataclass
+class IndicatorState:
+    """
+    직전 계산 결과.
+
+    - index/inputs: 계산에 쓴 candle(UTC index, high/low/close)
+    - columns: 출력 column + 재귀 지표의 내부 상태 column(`_` prefix)
+    - offset: 첫 계산 이후 앞에서 잘려 나간 candle 수(warmup 판정용 절대 위치)
+    """
+
+    index: pd.DatetimeIndex
+    inputs: np.ndarray
+    columns: dict[str, np.ndarray]
+    offset: int = 0
+
+
+def parse_indicator_specs(raw: str) -> list[IndicatorSpec]:
+    """
+    쉼표 구분 spec 문자열을 파싱한다. 중복은 한 번만 남긴다.
+
+    Raises:
+      - ValueError: 지원하지 않는 kind 또는 잘못된 period
+    """
+    specs: list[IndicatorSpec] = []
+    for token in raw.split(","):
+        token = token.strip().lower()
+        if not token:
+            continue
+        kind, _, period = token.partition("_")
+        minimum_period = 2 if kind == "bb" else 1
+        if (
+            kind not in SUPPORTED_INDICATORS
+            or not period.isdigit()
+            or int(period) < minimum_period
+        ):
+            raise ValueError(
+                f"Unsupported indicator spec: {token!r}. Expected like 'sma_20', "
+                f"kinds={', '.join(SUPPORTED_INDICATORS)}."
+            )
+        spec = IndicatorSpec(kind=kind, period=int(period))
+        if spec not in specs:
+            specs.append(spec)
+    return specs
+
+
+def indicator_output_columns(specs: list[IndicatorSpec]) -> list[str]:
+    return [column for spec in specs for column in spec.output_columns()]
+
+
+def _state_columns(specs: list[IndicatorSpec]) -> set[str]:
+    names = set(indicator_output_columns(specs))
+    for spec in specs:
+        if spec.kind == "rsi":
+            names.update({f"_{spec.name}_gain", f"_{spec.name}_loss"})
+        elif spec.kind == "atr":
+            names.add(f"_{spec.name}")
+    return names
+
+
+def _resume_position(
+    state: IndicatorState | None,
+    specs: list[IndicatorSpec],
+    index: pd.DatetimeIndex,
+    inputs: np.ndarray,
+) -> tuple[int, int, dict[str, np.ndarray]]:
+    """
+    이전 state에서 재사용할 수 있는 앞부분 길이를 찾는다.
+
+    Returns:
+      - (start, offset, prior): 새 frame의 [0, start) 행은 prior 값을 그대로 쓴다.
+    """
+    if (
+        state is None
+        or len(state.index) == 0
+        or len(index) == 0
+        or not _state_columns(specs) <= set(state.columns)
+    ):
+        return 0, 0, {}
+    shift = int(state.index.searchsorted(index[0]))
+    if shift >= len(state.index) or state.index[shift] != index[0]:
+        # 새 frame이 더 과거부터 시작(backfill)하거나 정렬이 맞지 않으면 전체 재계산.
+        return 0, 0, {}
+
+    overlap = min(len(state.index) - shift, len(index))
+    same_time = state.index[shift : shift + overlap] == index[:overlap]
+    old_inputs = state.inputs[shift : shift + overlap]
+    new_inputs = inputs[:overlap]
+    same_value = (
+        (old_inputs == new_inputs) | (np.isnan(old_inputs) & np.isnan(new_inputs))
+    ).all(axis=1)
+    mismatch = np.flatnonzero(~(same_time & same_value))
+    start = int(mismatch[0]) if len(mismatch) else overlap
+    prior = {
+        name: values[shift : shift + start] for name, values in state.columns.items()
+    }
+    return start, state.offset + shift, prior
+
+
+def _rolling(values: np.ndarray, start: int, period: int, reducer) -> np.ndarray:
+    """values[start:] 각 행에서 끝나는 길이 period window에 reducer를 적용한다."""
+    result = np.full(len(values) - start, np.nan)
+    low = max(0, start - period + 1)
+    segment = values[low:]
+    if len(segment) < period:
+        return result
+    reduced = reducer(sliding_window_view(segment, period), axis=1)
+    first_row = low + period - 1
+    take_from = max(start, first_row)
+    result[take_from - start :] = reduced[take_from - first_row :]
+    return result
+
+
+def _ewm(values: np.ndarray, alpha: float, seed: float | None) -> np.ndarray:
+    """
+    `y_t = (1 - alpha) * y_{t-1} + alpha * x_t`. seed가 있으면 그 값에서 이어 계산한다.
+    """
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.float64)
+    if seed is None or np.isnan(seed):
+        series = pd.Series(values)
+        return series.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    series = pd.Series(np.concatenate(([seed], values)))
+    return series.ewm(alpha=alpha, adjust=False).mean().to_numpy()[1:]
+
+
+def _seed(prior: dict[str, np.ndarray], name: str) -> float | None:
+    values = prior.get(name)
+    if values is None or len(values) == 0:
+        return None
+    return float(values[-1])
+
+
+def compute_indicators(
+    frame: pd.DataFrame,
+    specs: list[IndicatorSpec],
+    state: IndicatorState | None = None,
+) -> tuple[IndicatorState, int]:
+    """
+    frame(UTC index, high/low/close)의 지표를 계산한다.
+
+    Returns:
+      - (state, computed_rows): 새 state와 실제로 계산한 행 수.
+        state.columns의 출력 column은 frame 행과 1:1로 정렬된다(warmup 구간은 NaN).
+    """
+    index = pd.DatetimeIndex(frame.index)
+    inputs = frame[_INPUT_COLUMNS].to_numpy(dtype=np.float64)
+    start, offset, prior = _resume_position(state, specs, index, inputs)
+    high, low, close = inputs[:, 0], inputs[:, 1], inputs[:, 2]
+    positions = offset + np.arange(start, len(index))
+    columns: dict[str, np.ndarray] = {}
+
+    def store(name: str, computed: np.ndarray) -> None:
+        previous = prior.get(name, np.zeros(0, dtype=np.float64))
+        columns[name] = np.concatenate((previous[:start], computed))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for spec in specs:
+            period = spec.period
+            if spec.kind == "sma":
+                store(spec.name, _rolling(close, start, period, np.mean))
+            elif spec.kind == "ema":
+                store(
+                    spec.name,
+                    _ewm(close[start:], 2.0 / (period + 1), _seed(prior, spec.name)),
+                )
+            elif spec.kind == "bb":
+                middle = _rolling(close, start, period, np.mean)
+                deviation = _rolling(close, start, period, np.std) * BOLLINGER_STDDEV
+                store(f"{spec.name}_upper", middle + deviation)
+                store(f"{spec.name}_middle", middle)
+                store(f"{spec.name}_lower", middle - deviation)
+            elif spec.kind == "rsi":
+                previous_close = np.concatenate(([np.nan], close[:-1]))[start:]
+                delta = close[start:] - previous_close
+                gain = _ewm(
+                    np.where(np.isnan(delta), np.nan, np.maximum(delta, 0.0)),
+                    1.0 / period,
+                    _seed(prior, f"_{spec.name}_gain"),
+                )
+                loss = _ewm(
+                    np.where(np.isnan(delta), np.nan, np.maximum(-delta, 0.0)),
+                    1.0 / period,
+                    _seed(prior, f"_{spec.name}_loss"),
+                )
+                rsi = np.where(
+                    loss == 0.0,
+                    np.where(gain == 0.0, 50.0, 100.0),
+                    100.0 - 100.0 / (1.0 + gain / loss),
+                )
+                rsi[np.isnan(gain) | np.isnan(loss) | (positions < period)] = np.nan
+                store(f"_{spec.name}_gain", gain)
+                store(f"_{spec.name}_loss", loss)
+                store(spec.name, rsi)
+            elif spec.kind == "atr":
+                previous_close = np.concatenate(([np.nan], close[:-1]))[start:]
+                true_range = np.fmax(
+                    high[start:] - low[start:],
+                    np.fmax(
+                        np.abs(high[start:] - previous_close),
+                        np.abs(low[start:] - previous_close),
+                    ),
+                )
+                atr = _ewm(true_range, 1.0 / period, _seed(prior, f"_{spec.name}"))
+                store(f"_{spec.name}", atr)
+                store(spec.name, np.where(positions < period - 1, np.nan, atr))
+
+    return (
+        IndicatorState(index=index, inputs=inputs, columns=columns, offset=offset),
+        len(index) - start,
+    )
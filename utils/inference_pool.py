@@ -0,0 +1,126 @@
+"""
+Recycling process pool.
+
+Why this module exists:
+- Prophet predict는 CPU-bound라 worker 프로세스 안에서 돌면 GIL 때문에 publish 병렬화가
+  predict 구간에서 직렬이 되고, 장기 실행 시 worker RSS가 조금씩 늘어난다.
+- CPU 구간만 작은 상주 process pool로 보내고, 자식 프로세스는 task 수(N) 또는
+  RSS 상한을 넘으면 교체해 메모리 증가를 자식 수명 안에 가둔다.
+- 자식은 spawn으로 띄운다. InfluxDB client/thread를 가진 부모를 fork하지 않기 위해서다.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import resource
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+
+def current_rss_bytes() -> int:
+    """현재 프로세스 RSS(bytes). /proc가 없으면 peak RSS로 대신한다."""
+    try:
+        with open("/proc/self/statm", "r") as fin:
+            resident_pages = int(fin.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Linux ru_maxrss 단위는 KiB.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _call_with_rss(fn: Callable[..., Any], args: tuple) -> tuple[Any, int]:
+    """자식 프로세스에서 fn을 실행하고 끝난 직후 RSS를 함께 돌려준다."""
+    return fn(*args), current_rss_bytes()
+
+
+class RecyclingProcessPool:
+    """
+    task 수/RSS 상한으로 자식을 교체하는 ProcessPoolExecutor 래퍼(thread-safe).
+
+    - max_tasks_per_child: 자식 1개가 처리할 task 수. 넘으면 executor가 자식을 새로 띄운다.
+    - max_rss_bytes: task 직후 자식 RSS가 이를 넘으면, 진행 중 task가 모두 끝난 시점에
+      pool 전체를 새로 만든다(0이면 검사하지 않음).
+    - 자식이 비정상 종료(BrokenProcessPool)하면 pool을 다시 만들고 예외를 그대로 올린다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        max_tasks_per_child: int | None = None,
+        max_rss_bytes: int = 0,
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple = (),
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_tasks_per_child = (
+            max_tasks_per_child if max_tasks_per_child and max_tasks_per_child > 0 else None
+        )
+        self.max_rss_bytes = max(0, max_rss_bytes)
+        self._initializer = initializer
+        self._initargs = initargs
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._inflight = 0
+        self._recycle_pending = False
+        self.recycle_count = 0
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=self._initializer,
+            initargs=self._initargs,
+            max_tasks_per_child=self.max_tasks_per_child,
+        )
+
+    def _acquire_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._recycle_pending and self._inflight == 0:
+                self._discard_executor_locked()
+                self.recycle_count += 1
+            if self._executor is None:
+                self._executor = self._new_executor()
+            self._inflight += 1
+            return self._executor
+
+    def _discard_executor_locked(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._recycle_pending = False
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        `fn(*args)`를 자식 프로세스에서 실행하고 결과를 기다린다.
+
+        fn/args/결과는 pickle 가능해야 한다(module 수준 함수).
+        """
+        executor = self._acquire_executor()
+        try:
+            result, rss_bytes = executor.submit(_call_with_rss, fn, args).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+                    self.recycle_count += 1
+            raise
+        finally:
+            with self._lock:
+                self._inflight -= 1
+        if self.max_rss_bytes and rss_bytes > self.max_rss_bytes:
+            with self._lock:
+                if self._executor is executor:
+                    self._recycle_pending = True
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._recycle_pending = False
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
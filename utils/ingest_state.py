@@ -110,7 +110,15 @@ class IngestStateStore:
             "updated_at": _format_utc(datetime.now(timezone.utc)),
             "entries": self._entries,
         }
-        atomic_write_json(self._path, payload, indent=2)
+        # top-level updated_at만 바뀐 경우는 다시 쓰지 않는다.
+        atomic_write_json(
+            self._path,
+            payload,
+            indent=2,
+            skip_unchanged=True,
+            ignore_keys=("updated_at",),
+            durable=True,
+        )
 
     def get(self, symbol: str, timeframe: str) -> IngestStateEntry | None:
         """
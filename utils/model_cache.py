@@ -0,0 +1,175 @@
+"""
+Per-process model cache.
+
+Why this module exists:
+- publish 단계는 매 cycle 모든 series마다 Prophet 모델 JSON을 다시 역직렬화했다.
+  역직렬화가 predict 경로에서 가장 비싼 단계라 steady-state cycle에서는 이를 없앤다.
+- 엔트리는 적재 당시 파일의 (inode, mtime_ns, size)로 검증한다. `train_model.py`는
+  별도 프로세스에서 atomic rename으로 새 artifact를 쓰므로 signature가 바뀌고,
+  다음 조회에서 자동으로 다시 적재된다(명시적 invalidate 호출 불필요).
+- 메모리 예산은 모델 JSON 크기 합으로 근사한다. 예산을 넘으면 LRU 순서로 내보낸다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class CachedModel:
+    """
+    cache에 적재된 모델 1건.
+
+    - signature: 적재 당시 (st_ino, st_mtime_ns, st_size)
+    - size_bytes: 메모리 예산 계산에 쓰는 직렬화 크기
+    """
+
+    model: Any
+    signature: tuple[int, int, int]
+    size_bytes: int
+
+
+def _signature(stat_result: os.stat_result) -> tuple[int, int, int]:
+    return stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return None
+    return _signature(stat_result)
+
+
+def _empty_stats() -> dict[str, int | float]:
+    return {"hits": 0, "misses": 0, "evictions": 0, "load_seconds": 0.0}
+
+
+class ModelCache:
+    """
+    모델 파일 경로별 역직렬화 결과 LRU 저장소(thread-safe).
+
+    max_bytes <= 0이면 cache를 끄고 매번 적재한다(기존 동작).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedModel] = OrderedDict()
+        self._total_bytes = 0
+        self._stats = _empty_stats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def get(
+        self, path: Path, loader: Callable[[Any], Any], *, binary: bool = False
+    ) -> Any:
+        """
+        `path`의 모델을 돌려준다. 없거나 파일이 바뀌었으면 `loader(raw)`로 적재한다.
+
+        raw는 기본적으로 str이고, binary=True면 bytes(forecast table 등)다.
+
+        Called from:
+        - `workers.predict._load_model` (모델 JSON / compact artifact)
+        - `workers.predict.lookup_forecast_table` (forecast table/meta)
+
+        Raises:
+          - FileNotFoundError: 모델 파일이 없을 때(기존 open 경로와 동일)
+          - loader가 던지는 예외는 그대로 전파하고 엔트리를 남기지 않는다.
+        """
+        model_path = Path(path)
+        key = str(model_path)
+        signature = _stat_signature(model_path)
+        if signature is not None and self.enabled:
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached is not None and cached.signature == signature:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return cached.model
+
+        started = time.perf_counter()
+        with open(model_path, "rb" if binary else "r") as fin:
+            raw = fin.read()
+            # 실제로 읽은 handle의 inode로 signature를 잡는다. 경로로 다시 stat하면
+            # 그 사이 rename된 새 artifact의 signature에 옛 모델이 묶일 수 있다.
+            signature = _signature(os.fstat(fin.fileno()))
+        model = loader(raw)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._stats["misses"] += 1
+            self._stats["load_seconds"] += elapsed
+            if not self.enabled or signature is None:
+                return model
+            size_bytes = len(raw) if binary else len(raw.encode("utf-8"))
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size_bytes
+            if size_bytes > self.max_bytes:
+                # 예산보다 큰 단일 모델은 담지 않는다(다른 엔트리를 모두 밀어내지 않도록).
+                return model
+            self._entries[key] = CachedModel(
+                model=model, signature=signature, size_bytes=size_bytes
+            )
+            self._total_bytes += size_bytes
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.size_bytes
+                self._stats["evictions"] += 1
+        return model
+
+    def invalidate(self, path: Path) -> bool:
+        """`path` 엔트리를 버린다. 엔트리가 있었으면 True."""
+        with self._lock:
+            previous = self._entries.pop(str(Path(path)), None)
+            if previous is None:
+                return False
+            self._total_bytes -= previous.size_bytes
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def merge_stats(self, stats: dict[str, int | float]) -> None:
+        """
+        다른 프로세스(inference pool 자식)의 cache 통계를 합산한다.
+
+        Called from:
+        - `workers.predict.predict_forecast`
+        """
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] += stats.get(key, 0)
+
+    def consume_stats(self) -> dict[str, int | float]:
+        """
+        마지막 호출 이후의 hit/miss/eviction 수와 적재 시간(초)을 돌려주고 0으로 되돌린다.
+
+        Called from:
+        - `scripts.pipeline_worker._append_cycle_runtime_metrics_if_enabled`
+        """
+        with self._lock:
+            stats = self._stats
+            self._stats = _empty_stats()
+        stats["load_seconds"] = round(float(stats["load_seconds"]), 3)
+        return stats
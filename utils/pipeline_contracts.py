@@ -110,6 +110,8 @@ class PredictionExecutionResult(str, Enum):
     """
 
     OK = "ok"
+    # 같은 모델/구간의 forecast가 이미 발행돼 있어 다시 쓰지 않았다(성공으로 취급).
+    MEMO_HIT = "memo_hit"
     SKIPPED = "skipped"
     FAILED = "failed"
 
@@ -107,4 +107,12 @@ class SymbolActivationStore:
             "updated_at": format_utc_datetime(resolved_now) or "",
             "entries": payload_entries,
         }
-        atomic_write_json(self._path, payload, indent=2)
+        # top-level updated_at만 바뀐 경우는 다시 쓰지 않는다.
+        atomic_write_json(
+            self._path,
+            payload,
+            indent=2,
+            skip_unchanged=True,
+            ignore_keys=("updated_at",),
+            durable=True,
+        )
@@ -0,0 +1,100 @@
+"""
+Prediction memo.
+
+Why this module exists:
+- poll_loop 모드나 self-heal 경로에서는 같은 candle 구간 안에서 publish가 여러 번
+  돌 수 있다. 모델과 예측 시작 경계가 같으면 결과 forecast도 같으므로
+  추론/정적 파일 write/Influx write를 다시 할 이유가 없다.
+- key는 (model_version, prediction_start)다. prediction_start는 다음 닫힌 candle
+  경계라서 구간이 바뀌면 key가 바뀌고, 재학습하면 model_version이 바뀐다.
+  따라서 memo hit인 파일의 `updated_at`은 항상 현재 구간 안에서 기록된 값이라
+  freshness(soft limit = timeframe + 여유)를 벗어나지 않는다.
+- 발행한 파일의 (mtime_ns, size)를 함께 남겨, hidden 정책 삭제나 외부 변경으로
+  파일이 달라졌으면 memo를 무시하고 다시 발행한다.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class PredictionMemoEntry:
+    model_version: str
+    prediction_start: str
+    files: tuple[tuple[Path, int, int], ...]
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+class PredictionMemo:
+    """series별 마지막 발행 forecast key 저장소(thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], PredictionMemoEntry] = {}
+
+    def matches(
+        self,
+        symbol: str,
+        timeframe: str,
+        *,
+        model_version: str,
+        prediction_start: str,
+        paths: list[Path],
+    ) -> bool:
+        """
+        마지막 발행 key와 같고, 이번에 발행할 `paths`가 그때 기록한 파일 그대로면 True.
+
+        Called from:
+        - `workers.predict.run_prediction_and_save`
+        """
+        with self._lock:
+            entry = self._entries.get((symbol, timeframe))
+        if (
+            entry is None
+            or entry.model_version != model_version
+            or entry.prediction_start != prediction_start
+            or [path for path, _, _ in entry.files] != [Path(path) for path in paths]
+        ):
+            return False
+        return all(
+            _stat_signature(path) == (mtime_ns, size)
+            for path, mtime_ns, size in entry.files
+        )
+
+    def remember(
+        self,
+        symbol: str,
+        timeframe: str,
+        *,
+        model_version: str,
+        prediction_start: str,
+        paths: list[Path],
+    ) -> None:
+        """방금 발행을 마친 forecast의 key와 파일 signature를 남긴다."""
+        files = []
+        for path in paths:
+            signature = _stat_signature(Path(path))
+            if signature is None:
+                self.forget(symbol, timeframe)
+                return
+            files.append((Path(path), *signature))
+        with self._lock:
+            self._entries[(symbol, timeframe)] = PredictionMemoEntry(
+                model_version=model_version,
+                prediction_start=prediction_start,
+                files=tuple(files),
+            )
+
+    def forget(self, symbol: str, timeframe: str) -> None:
+        with self._lock:
+            self._entries.pop((symbol, timeframe), None)
@@ -55,19 +55,61 @@ def _resolve_thresholds(
     return soft_limit, hard_limit
 
 
-def evaluate_prediction_status(
+def snapshot_from_updated_at(
     symbol: str,
     timeframe: str,
+    file_name: str,
+    updated_at_str: str | None,
     now: datetime | None,
-    static_dir: Path,
     soft_thresholds: dict[str, timedelta] | None = None,
     hard_thresholds: dict[str, timedelta] | None = None,
 ) -> PredictionStatusSnapshot:
+    """
+    이미 알고 있는 `updated_at`으로 freshness snapshot을 만든다.
+
+    파일을 다시 읽지 않는 호출자(publish registry 기반 manifest)와
+    `evaluate_prediction_status`가 같은 판정 규칙을 공유하기 위한 분리다.
+    """
     resolved_now = now or datetime.now(timezone.utc)
     soft_limit, hard_limit = _resolve_thresholds(
         timeframe, soft_thresholds, hard_thresholds
     )
+    updated_at = parse_utc_timestamp(updated_at_str)
+    if updated_at is None:
+        return PredictionStatusSnapshot(
+            symbol=symbol,
+            timeframe=timeframe,
+            status="corrupt",
+            detail=f"Invalid updated_at format: {file_name}",
+            error_code="invalid_updated_at",
+        )
+
+    freshness = classify_freshness(
+        updated_at=updated_at,
+        now=resolved_now,
+        soft_limit=soft_limit,
+        hard_limit=hard_limit,
+    )
+    return PredictionStatusSnapshot(
+        symbol=symbol,
+        timeframe=timeframe,
+        status=freshness.status,
+        detail=f"checked={file_name}",
+        updated_at=updated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        age_minutes=round(freshness.age.total_seconds() / 60, 2),
+        soft_limit_minutes=int(freshness.soft_limit.total_seconds() // 60),
+        hard_limit_minutes=int(freshness.hard_limit.total_seconds() // 60),
+    )
+
 
+def evaluate_prediction_status(
+    symbol: str,
+    timeframe: str,
+    now: datetime | None,
+    static_dir: Path,
+    soft_thresholds: dict[str, timedelta] | None = None,
+    hard_thresholds: dict[str, timedelta] | None = None,
+) -> PredictionStatusSnapshot:
     for file_path in prediction_file_candidates(symbol, timeframe, static_dir):
         if not file_path.exists():
             continue
@@ -92,32 +134,14 @@ def evaluate_prediction_status(
                 error_code="read_error",
             )
 
-        updated_at_str = payload.get("updated_at")
-        updated_at = parse_utc_timestamp(updated_at_str)
-        if updated_at is None:
-            return PredictionStatusSnapshot(
-                symbol=symbol,
-                timeframe=timeframe,
-                status="corrupt",
-                detail=f"Invalid updated_at format: {file_path.name}",
-                error_code="invalid_updated_at",
-            )
-
-        freshness = classify_freshness(
-            updated_at=updated_at,
-            now=resolved_now,
-            soft_limit=soft_limit,
-            hard_limit=hard_limit,
-        )
-        return PredictionStatusSnapshot(
-            symbol=symbol,
-            timeframe=timeframe,
-            status=freshness.status,
-            detail=f"checked={file_path.name}",
-            updated_at=updated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            age_minutes=round(freshness.age.total_seconds() / 60, 2),
-            soft_limit_minutes=int(freshness.soft_limit.total_seconds() // 60),
-            hard_limit_minutes=int(freshness.hard_limit.total_seconds() // 60),
+        return snapshot_from_updated_at(
+            symbol,
+            timeframe,
+            file_path.name,
+            payload.get("updated_at"),
+            now,
+            soft_thresholds,
+            hard_thresholds,
         )
 
     return PredictionStatusSnapshot(
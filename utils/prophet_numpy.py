@@ -0,0 +1,410 @@
+"""
+NumPy Prophet forecast evaluator.
+
+Why this module exists:
+- publish 단계의 예측은 학습이 끝난 모델로 미래 24행을 계산하는 것뿐인데,
+  `Prophet.predict`는 pandas 전처리와 기본 1000개 샘플 시뮬레이션을 매번 거친다.
+- 학습된 파라미터(k, m, delta, beta, sigma_obs)와 scaling/seasonality 설정만 꺼내
+  piecewise-linear trend와 Fourier seasonality를 벡터 연산으로 직접 평가한다.
+- 구간(yhat_lower/upper)은 Prophet vectorized 경로와 같은 순서로 난수를 뽑는
+  sampling 방식(같은 seed면 같은 결과)과, 정규 근사로 닫힌 식을 쓰는 analytic 방식을 둔다.
+- 학습 시 파라미터만 `.compact.npz`로 따로 저장해 두면, publish는 history까지 담긴
+  모델 JSON을 역직렬화하지 않고 이 artifact만 적재한다.
+
+지원 범위: linear/flat growth, 조건 없는 seasonality(additive/multiplicative).
+holiday/extra regressor/conditional seasonality/logistic growth 모델은
+`UnsupportedProphetModel`을 올리며, 호출자는 `Prophet.predict`로 되돌아간다.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any
+
+import numpy as np
+
+VALID_INTERVAL_METHODS = {"sampling", "analytic"}
+# 학습 이력 없이 예측 파라미터만 담은 compact 모델 artifact.
+COMPACT_MODEL_SUFFIX = ".compact.npz"
+COMPACT_MODEL_FORMAT_VERSION = 1
+_SECONDS_PER_DAY = 24 * 60 * 60
+_NS_PER_SECOND = 1_000_000_000
+
+
+class UnsupportedProphetModel(ValueError):
+    """NumPy evaluator가 재현하지 않는 기능을 쓰는 모델."""
+
+
+@dataclass(frozen=True)
+class SeasonalityTerm:
+    name: str
+    period: float
+    fourier_order: int
+    mode: str
+
+
+@dataclass(frozen=True)
+class ProphetParams:
+    """
+    예측에 필요한 학습 결과만 담은 모델 표현.
+
+    - k/m/sigma_obs: (n_iterations,), delta: (n_iterations, n_changepoints),
+      beta: (n_iterations, n_features). MAP 학습이면 n_iterations=1.
+    - start_ns/t_scale_ns: `t = (ds - start) / t_scale` 정규화 기준(ns)
+    - floor: absmax scaling이면 0, minmax면 y_min
+    - history_t_step: 학습 데이터의 평균 t 간격(미래가 1행일 때 trend 불확실성 폭 계산용)
+    - model_version: compact artifact로 저장할 때 원본 모델 JSON의 model_version
+    """
+
+    growth: str
+    start_ns: int
+    t_scale_ns: float
+    y_scale: float
+    floor: float
+    changepoints_t: np.ndarray
+    k: np.ndarray
+    m: np.ndarray
+    delta: np.ndarray
+    beta: np.ndarray
+    sigma_obs: np.ndarray
+    seasonalities: tuple[SeasonalityTerm, ...]
+    interval_width: float
+    uncertainty_samples: int
+    history_t_step: float
+    model_version: str | None = None
+
+    def _mode_mask(self, mode: str) -> np.ndarray:
+        mask = np.zeros(self.beta.shape[1], dtype=np.float64)
+        column = 0
+        for term in self.seasonalities:
+            width = 2 * term.fourier_order
+            if term.mode == mode:
+                mask[column : column + width] = 1.0
+            column += width
+        return mask
+
+    @property
+    def additive_mask(self) -> np.ndarray:
+        return self._mode_mask("additive")
+
+    @property
+    def multiplicative_mask(self) -> np.ndarray:
+        return self._mode_mask("multiplicative")
+
+
+def extract_prophet_params(model: Any) -> ProphetParams:
+    """
+    학습된 `Prophet` 객체에서 `ProphetParams`를 만든다.
+
+    Raises:
+      - UnsupportedProphetModel: 지원 범위 밖의 모델
+    """
+    if getattr(model, "history", None) is None or not getattr(model, "params", None):
+        raise UnsupportedProphetModel("model has not been fit")
+    if model.growth not in {"linear", "flat"}:
+        raise UnsupportedProphetModel(f"growth={model.growth!r} is not supported")
+    if model.extra_regressors:
+        raise UnsupportedProphetModel("extra regressors are not supported")
+    if model.holidays is not None or getattr(model, "country_holidays", None):
+        raise UnsupportedProphetModel("holidays are not supported")
+
+    seasonalities: list[SeasonalityTerm] = []
+    for name, props in model.seasonalities.items():
+        if props.get("condition_name") is not None:
+            raise UnsupportedProphetModel(
+                f"conditional seasonality {name!r} is not supported"
+            )
+        seasonalities.append(
+            SeasonalityTerm(
+                name=name,
+                period=float(props["period"]),
+                fourier_order=int(props["fourier_order"]),
+                mode=props["mode"],
+            )
+        )
+
+    beta = np.atleast_2d(np.asarray(model.params["beta"], dtype=np.float64))
+    expected_columns = sum(2 * term.fourier_order for term in seasonalities) or 1
+    if beta.shape[1] != expected_columns:
+        raise UnsupportedProphetModel(
+            f"beta has {beta.shape[1]} columns, expected {expected_columns}"
+        )
+
+    history_t = np.asarray(model.history["t"], dtype=np.float64)
+    return ProphetParams(
+        growth=model.growth,
+        start_ns=int(model.start.value),
+        t_scale_ns=float(model.t_scale.value),
+        y_scale=float(model.y_scale),
+        floor=float(model.y_min) if model.scaling == "minmax" else 0.0,
+        changepoints_t=np.asarray(model.changepoints_t, dtype=np.float64),
+        k=np.asarray(model.params["k"], dtype=np.float64).reshape(-1),
+        m=np.asarray(model.params["m"], dtype=np.float64).reshape(-1),
+        delta=np.atleast_2d(np.asarray(model.params["delta"], dtype=np.float64)),
+        beta=beta,
+        sigma_obs=np.asarray(model.params["sigma_obs"], dtype=np.float64).reshape(-1),
+        seasonalities=tuple(seasonalities),
+        interval_width=float(model.interval_width),
+        uncertainty_samples=int(model.uncertainty_samples or 0),
+        history_t_step=(float(np.diff(history_t).mean()) if len(history_t) > 1 else 0.0),
+    )
+
+
+def compact_model_path(model_path: Path) -> Path:
+    """`model_X_1h.json` -> `model_X_1h.compact.npz`."""
+    return model_path.with_name(f"{model_path.stem}{COMPACT_MODEL_SUFFIX}")
+
+
+def encode_prophet_params(params: ProphetParams) -> bytes:
+    """`ProphetParams`를 compact artifact(npz, pickle 없음)로 직렬화한다."""
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        format_version=np.int64(COMPACT_MODEL_FORMAT_VERSION),
+        model_version=np.str_(params.model_version or ""),
+        growth=np.str_(params.growth),
+        start_ns=np.int64(params.start_ns),
+        scalars=np.array(
+            [
+                params.t_scale_ns,
+                params.y_scale,
+                params.floor,
+                params.interval_width,
+                params.history_t_step,
+            ],
+            dtype=np.float64,
+        ),
+        uncertainty_samples=np.int64(params.uncertainty_samples),
+        changepoints_t=params.changepoints_t,
+        k=params.k,
+        m=params.m,
+        delta=params.delta,
+        beta=params.beta,
+        sigma_obs=params.sigma_obs,
+        seasonality_names=np.array([term.name for term in params.seasonalities], dtype=str),
+        seasonality_periods=np.array(
+            [term.period for term in params.seasonalities], dtype=np.float64
+        ),
+        seasonality_orders=np.array(
+            [term.fourier_order for term in params.seasonalities], dtype=np.int64
+        ),
+        seasonality_modes=np.array([term.mode for term in params.seasonalities], dtype=str),
+    )
+    return buffer.getvalue()
+
+
+def decode_prophet_params(raw: bytes) -> ProphetParams:
+    """
+    Raises:
+      - ValueError: 지원하지 않는 format version
+    """
+    with np.load(io.BytesIO(raw), allow_pickle=False) as archive:
+        version = int(archive["format_version"])
+        if version != COMPACT_MODEL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact model version: {version}")
+        t_scale_ns, y_scale, floor, interval_width, history_t_step = (
+            float(value) for value in archive["scalars"]
+        )
+        seasonalities = tuple(
+            SeasonalityTerm(
+                name=str(name), period=float(period), fourier_order=int(order), mode=str(mode)
+            )
+            for name, period, order, mode in zip(
+                archive["seasonality_names"],
+                archive["seasonality_periods"],
+                archive["seasonality_orders"],
+                archive["seasonality_modes"],
+            )
+        )
+        return ProphetParams(
+            growth=str(archive["growth"]),
+            start_ns=int(archive["start_ns"]),
+            t_scale_ns=t_scale_ns,
+            y_scale=y_scale,
+            floor=floor,
+            changepoints_t=archive["changepoints_t"],
+            k=archive["k"],
+            m=archive["m"],
+            delta=archive["delta"],
+            beta=archive["beta"],
+            sigma_obs=archive["sigma_obs"],
+            seasonalities=seasonalities,
+            interval_width=interval_width,
+            uncertainty_samples=int(archive["uncertainty_samples"]),
+            history_t_step=history_t_step,
+            model_version=str(archive["model_version"]) or None,
+        )
+
+
+def _piecewise_linear(
+    t: np.ndarray, deltas: np.ndarray, k: float, m: float, changepoints_t: np.ndarray
+) -> np.ndarray:
+    deltas_t = (changepoints_t[None, :] <= t[:, None]) * deltas
+    k_t = deltas_t.sum(axis=1) + k
+    m_t = (deltas_t * -changepoints_t).sum(axis=1) + m
+    return k_t * t + m_t
+
+
+def _expected_trend(
+    params: ProphetParams, t: np.ndarray, deltas: np.ndarray, k: float, m: float
+) -> np.ndarray:
+    """scale 전(0~1 구간) trend."""
+    if params.growth == "flat":
+        return np.full_like(t, m)
+    return _piecewise_linear(t, deltas, k, m, params.changepoints_t)
+
+
+def seasonal_features(params: ProphetParams, ds_ns: np.ndarray) -> np.ndarray:
+    """Prophet `make_all_seasonality_features`와 같은 column 순서의 Fourier feature 행렬."""
+    days = ds_ns.astype(np.float64) / _NS_PER_SECOND / _SECONDS_PER_DAY
+    if not params.seasonalities:
+        return np.zeros((len(ds_ns), 1))
+    blocks = []
+    for term in params.seasonalities:
+        orders = np.arange(1, term.fourier_order + 1, dtype=np.float64)
+        angles = (2.0 * np.pi * days)[:, None] * (orders / term.period)[None, :]
+        block = np.empty((len(ds_ns), 2 * term.fourier_order))
+        block[:, 0::2] = np.sin(angles)
+        block[:, 1::2] = np.cos(angles)
+        blocks.append(block)
+    return np.hstack(blocks)
+
+
+def _future_step(params: ProphetParams, t: np.ndarray) -> tuple[np.ndarray, float]:
+    """미래(t > 1) 구간 mask와 한 step의 t 간격."""
+    future = t > 1
+    future_t = t[future]
+    if len(future_t) > 1:
+        return future, float(np.diff(future_t).mean())
+    return future, params.history_t_step
+
+
+def _sample_trend_shifts(
+    params: ProphetParams,
+    t: np.ndarray,
+    deltas: np.ndarray,
+    n_samples: int,
+    rng,
+) -> np.ndarray:
+    """
+    Prophet `_sample_uncertainty`(linear/flat)와 같은 순서로 미래 trend 변화량을 뽑는다.
+    """
+    shifts = np.zeros((n_samples, len(t)))
+    if t.max() <= 1 or params.growth == "flat":
+        return shifts
+    future, single_diff = _future_step(params, t)
+    n_length = int(future.sum())
+    likelihood = len(params.changepoints_t) * single_diff
+    mean_delta = np.mean(np.abs(deltas)) + 1e-8
+    changes = rng.uniform(size=(n_samples, n_length)) < likelihood
+    values = rng.laplace(0, mean_delta, size=changes.shape) * changes
+    shifted = np.hstack([np.zeros((n_samples, 1)), values])[:, :-1]
+    slopes = (shifted + values) / 2
+    shifts[:, future] = slopes.cumsum(axis=1).cumsum(axis=1) * single_diff
+    return shifts
+
+
+def _analytic_trend_variance(
+    params: ProphetParams, t: np.ndarray, deltas: np.ndarray
+) -> np.ndarray:
+    """
+    sampling 경로의 trend 변화량 분산(scale 전)을 닫힌 식으로 계산한다.
+
+    step h의 변화량은 `single_diff/2 * sum_j x_j (w_j + w_{j+1})`(w_j = h - j + 1)이고
+    x_j는 확률 p로 Laplace(0, b)를 따르므로 Var(x_j) = 2 p b^2 이다.
+    """
+    variance = np.zeros(len(t))
+    if t.max() <= 1 or params.growth == "flat":
+        return variance
+    future, single_diff = _future_step(params, t)
+    n_length = int(future.sum())
+    likelihood = min(1.0, len(params.changepoints_t) * single_diff)
+    mean_delta = np.mean(np.abs(deltas)) + 1e-8
+    shift_variance = 2.0 * likelihood * mean_delta**2
+    steps = np.arange(1, n_length + 1)
+    # weights[h, j] = (h - j + 1) + (h - j), j <= h (0-based: h, j < n_length)
+    lag = steps[:, None] - steps[None, :]
+    weights = np.where(lag >= 0, 2 * lag + 1, 0).astype(np.float64)
+    variance[future] = (single_diff / 2) ** 2 * shift_variance * (weights**2).sum(axis=1)
+    return variance
+
+
+def evaluate_forecast(
+    params: ProphetParams,
+    ds: np.ndarray,
+    *,
+    interval_method: str = "sampling",
+    interval_samples: int | None = None,
+    rng=None,
+) -> dict[str, np.ndarray]:
+    """
+    tz-naive `ds`(datetime64) 시점의 yhat/yhat_lower/yhat_upper/trend를 계산한다.
+
+    Args:
+      - interval_method: `sampling`(Prophet과 같은 시뮬레이션) 또는 `analytic`(정규 근사)
+      - interval_samples: sampling 샘플 수. None/0이면 모델의 uncertainty_samples.
+        둘 다 0이면 analytic으로 계산한다.
+      - rng: `uniform/laplace/normal`을 가진 난수원. 기본은 전역 `np.random`
+        (Prophet과 같은 seed를 쓰면 같은 구간이 나온다).
+    """
+    if interval_method not in VALID_INTERVAL_METHODS:
+        raise ValueError(f"Unsupported interval method: {interval_method!r}")
+    ds_ns = np.asarray(ds, dtype="datetime64[ns]").astype(np.int64)
+    t = (ds_ns - params.start_ns) / params.t_scale_ns
+    features = seasonal_features(params, ds_ns)
+    additive_mask = params.additive_mask
+    multiplicative_mask = params.multiplicative_mask
+
+    k = float(np.nanmean(params.k))
+    m = float(np.nanmean(params.m))
+    deltas = np.nanmean(params.delta, axis=0)
+    beta = np.nanmean(params.beta, axis=0)
+    trend = _expected_trend(params, t, deltas, k, m) * params.y_scale + params.floor
+    additive = features @ (beta * additive_mask) * params.y_scale
+    multiplicative = features @ (beta * multiplicative_mask)
+    yhat = trend * (1 + multiplicative) + additive
+
+    n_samples = interval_samples or params.uncertainty_samples
+    if interval_method == "analytic" or n_samples <= 0:
+        trend_std = np.sqrt(_analytic_trend_variance(params, t, deltas)) * params.y_scale
+        noise_std = float(np.nanmean(params.sigma_obs)) * params.y_scale
+        spread = np.sqrt((trend_std * (1 + multiplicative)) ** 2 + noise_std**2)
+        z = NormalDist().inv_cdf((1.0 + params.interval_width) / 2)
+        return {
+            "trend": trend,
+            "yhat": yhat,
+            "yhat_lower": yhat - z * spread,
+            "yhat_upper": yhat + z * spread,
+        }
+
+    rng = np.random if rng is None else rng
+    n_iterations = len(params.k)
+    per_iteration = max(1, int(np.ceil(n_samples / float(n_iterations))))
+    samples = []
+    for iteration in range(n_iterations):
+        iteration_beta = params.beta[iteration]
+        iteration_deltas = params.delta[iteration]
+        sample_additive = features @ (iteration_beta * additive_mask) * params.y_scale
+        sample_multiplicative = features @ (iteration_beta * multiplicative_mask)
+        expected = _expected_trend(
+            params, t, iteration_deltas, params.k[iteration], params.m[iteration]
+        )
+        shifts = _sample_trend_shifts(params, t, iteration_deltas, per_iteration, rng)
+        trends = (expected[None, :] + shifts) * params.y_scale + params.floor
+        noise = (
+            rng.normal(0, params.sigma_obs[iteration], trends.shape) * params.y_scale
+        )
+        samples.append(trends * (1 + sample_multiplicative) + sample_additive + noise)
+    simulated = np.vstack(samples)
+    lower_p = 100 * (1.0 - params.interval_width) / 2
+    upper_p = 100 * (1.0 + params.interval_width) / 2
+    percentile = np.nanpercentile if np.isnan(simulated).any() else np.percentile
+    return {
+        "trend": trend,
+        "yhat": yhat,
+        "yhat_lower": percentile(simulated, lower_p, axis=0),
+        "yhat_upper": percentile(simulated, upper_p, axis=0),
+    }
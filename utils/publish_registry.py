@@ -0,0 +1,165 @@
+"""
+Publish registry.
+
+Why this module exists:
+- manifest 생성이 매 cycle 모든 history/prediction 파일을 다시 열어 `updated_at`만
+  읽는 비용을 없앤다. export/predict가 쓰는 시점에 알고 있는 메타데이터
+  (updated_at, size, sha256)를 메모리에 남기고 manifest는 이를 읽는다.
+- 엔트리는 기록 당시 (mtime_ns, size)로 검증한다. 외부에서 파일이 바뀌거나
+  지워졌으면 엔트리를 버리고 파일 scan으로 되돌아간다(cold start와 동일 경로).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PublishedArtifact:
+    """
+    registry에 남긴 산출물 1건.
+
+    - sha256: write 시점에 알면 채운다. cold start scan으로 복원한 엔트리는 None.
+    """
+
+    path: Path
+    updated_at: str | None
+    size_bytes: int
+    sha256: str | None
+    mtime_ns: int
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+class PublishRegistry:
+    """
+    산출물 경로별 마지막 publish 메타데이터 저장소(thread-safe).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._artifacts: dict[str, PublishedArtifact] = {}
+        self._payloads: dict[str, tuple[tuple[int, int], Any]] = {}
+
+    def record(
+        self,
+        path: Path,
+        *,
+        updated_at: str | None,
+        size_bytes: int | None = None,
+        sha256: str | None = None,
+    ) -> PublishedArtifact | None:
+        """
+        방금 기록한(또는 scan한) 산출물을 등록한다. 파일이 없으면 등록하지 않는다.
+
+        Called from:
+        - `workers.export` history write
+        - `workers.predict` prediction write
+        """
+        file_path = Path(path)
+        signature = _stat_signature(file_path)
+        if signature is None:
+            return None
+        artifact = PublishedArtifact(
+            path=file_path,
+            updated_at=updated_at,
+            size_bytes=size_bytes if size_bytes is not None else signature[1],
+            sha256=sha256,
+            mtime_ns=signature[0],
+        )
+        with self._lock:
+            self._artifacts[str(file_path)] = artifact
+        return artifact
+
+    def lookup(self, path: Path) -> PublishedArtifact | None:
+        """
+        stat이 기록 당시와 같을 때만 엔트리를 반환한다.
+        """
+        file_path = Path(path)
+        with self._lock:
+            artifact = self._artifacts.get(str(file_path))
+        if artifact is None:
+            return None
+        if _stat_signature(file_path) != (artifact.mtime_ns, artifact.size_bytes):
+            self.forget(file_path)
+            return None
+        return artifact
+
+    def resolve(self, path: Path) -> PublishedArtifact | None:
+        """
+        registry hit이면 그대로, 아니면 파일을 한 번 읽어 `updated_at`을 등록한다.
+
+        Returns:
+          - None: 파일이 없거나, 읽기/파싱 실패, 또는 `updated_at`이 문자열이 아님.
+            호출자는 기존 파일 기반 경로로 되돌아가 원래의 에러 의미를 유지한다.
+        """
+        file_path = Path(path)
+        artifact = self.lookup(file_path)
+        if artifact is not None:
+            return artifact
+        signature = _stat_signature(file_path)
+        if signature is None:
+            return None
+        try:
+            with open(file_path, "r") as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        updated_at = payload.get("updated_at") if isinstance(payload, dict) else None
+        if not isinstance(updated_at, str) or not updated_at:
+            return None
+        if _stat_signature(file_path) != signature:
+            # 읽는 도중 교체됐다. 다음 cycle에 다시 scan한다.
+            return None
+        artifact = PublishedArtifact(
+            path=file_path,
+            updated_at=updated_at,
+            size_bytes=signature[1],
+            sha256=None,
+            mtime_ns=signature[0],
+        )
+        with self._lock:
+            self._artifacts[str(file_path)] = artifact
+        return artifact
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            self._artifacts.pop(str(Path(path)), None)
+            self._payloads.pop(str(Path(path)), None)
+
+    def record_payload(self, path: Path, payload: Any) -> None:
+        """
+        작은 상태 파일(prediction health 등)의 파싱 결과를 파일 stat과 함께 캐시한다.
+        """
+        file_path = Path(path)
+        signature = _stat_signature(file_path)
+        if signature is None:
+            return
+        with self._lock:
+            self._payloads[str(file_path)] = (signature, payload)
+
+    def cached_payload(self, path: Path) -> Any | None:
+        """
+        stat이 같을 때만 캐시된 payload를 반환한다. 호출자는 결과를 수정하지 않는다.
+        """
+        file_path = Path(path)
+        with self._lock:
+            cached = self._payloads.get(str(file_path))
+        if cached is None or _stat_signature(file_path) != cached[0]:
+            return None
+        return cached[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._artifacts.clear()
+            self._payloads.clear()
@@ -0,0 +1,179 @@
+"""
+Versioned static release publish.
+
+Why this module exists:
+- 산출물을 파일마다 따로 교체하면 cycle 도중 클라이언트가 새 manifest와 이전 prediction을
+  섞어 볼 수 있다.
+- release 모드에서는 cycle이 끝난 뒤 공개 산출물을 `releases/<id>/`에 hard link로 모으고,
+  `current` symlink를 한 번에 바꿔 끼운다. nginx는 `current`가 있으면 그 안의 파일을
+  우선 서빙하므로(`nginx/default.conf` try_files) 독자는 항상 한 cycle의 완결된 묶음만 본다.
+- release 모드를 끄면 `current`를 치워 nginx가 작업 디렉터리 파일로 되돌아가게 한다.
+- 작업 디렉터리의 파일은 항상 rename으로 교체되므로(in-place 수정 없음) hard link는
+  link 시점의 내용을 그대로 고정한다. 바뀌지 않은 파일은 release 간에 inode를 공유한다.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+from utils.file_io import fsync_directory
+
+# 작성 중인 release 디렉터리 suffix. 완성 후 rename으로 release id 이름을 얻는다.
+STAGING_SUFFIX = ".staging"
+
+
+def collect_release_sources(
+    static_dir: Path,
+    *,
+    file_prefixes: Iterable[str],
+    file_names: Iterable[str],
+    directories: Iterable[str],
+    exclude_names: Iterable[str] = (),
+) -> list[Path]:
+    """
+    release에 담을 공개 산출물(static_dir 기준 상대 경로)을 모은다.
+
+    - top-level 파일: 이름이 `file_names`에 있거나 `file_prefixes`로 시작하는 것
+      (압축 sibling은 같은 prefix라 함께 담긴다)
+    - `directories`: 하위 파일 전체
+    - `.`으로 시작하는 이름(atomic write temp)과 `exclude_names`는 제외한다.
+    """
+    prefixes = tuple(file_prefixes)
+    names = set(file_names)
+    excluded = set(exclude_names)
+    sources: list[Path] = []
+    for entry in sorted(static_dir.iterdir()):
+        if entry.name.startswith(".") or entry.name in excluded:
+            continue
+        if entry.is_file() and not entry.is_symlink():
+            base_name = entry.name
+            for suffix in (".gz", ".br"):
+                base_name = base_name.removesuffix(suffix)
+            if base_name in excluded:
+                continue
+            if entry.name.startswith(prefixes) or base_name in names:
+                sources.append(Path(entry.name))
+    for directory in directories:
+        root = static_dir / directory
+        if not root.is_dir():
+            continue
+        for current_root, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+            for filename in sorted(filenames):
+                if filename.startswith("."):
+                    continue
+                sources.append(
+                    (Path(current_root) / filename).relative_to(static_dir)
+                )
+    return sources
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def stage_release(
+    static_dir: Path,
+    releases_dir: Path,
+    sources: Iterable[Path],
+    release_id: str,
+) -> Path:
+    """
+    `sources`를 hard link(불가하면 copy)로 모아 `releases_dir/<release_id>`를 만든다.
+
+    Returns:
+      - 완성된 release 디렉터리. 같은 id가 이미 있으면 `-1`, `-2`... suffix를 붙인다.
+
+    사라진 파일(작업 중 hidden 정책 삭제 등)은 건너뛴다. 디스크 flush는 호출자가
+    syncfs로 한 번에 처리한다.
+    """
+    releases_dir.mkdir(parents=True, exist_ok=True)
+    staging_dir = releases_dir / f"{release_id}{STAGING_SUFFIX}"
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir()
+    for relative_path in sources:
+        target = staging_dir / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            _link_or_copy(static_dir / relative_path, target)
+        except FileNotFoundError:
+            continue
+
+    release_dir = releases_dir / release_id
+    attempt = 0
+    while release_dir.exists():
+        attempt += 1
+        release_dir = releases_dir / f"{release_id}-{attempt}"
+    os.rename(staging_dir, release_dir)
+    return release_dir
+
+
+def activate_release(release_dir: Path, current_link: Path) -> None:
+    """
+    `current_link` symlink가 `release_dir`를 가리키게 atomic 교체한다.
+
+    symlink는 상대 경로로 만들어 컨테이너마다 mount 위치가 달라도 유효하다.
+    """
+    target = os.path.relpath(release_dir, current_link.parent)
+    temp_link = current_link.with_name(f".{current_link.name}.{os.getpid()}.swap")
+    temp_link.unlink(missing_ok=True)
+    os.symlink(target, temp_link)
+    os.replace(temp_link, current_link)
+    fsync_directory(current_link.parent)
+
+
+def resolve_current_release(current_link: Path) -> Path | None:
+    """`current_link`가 가리키는 release 디렉터리. 없으면 None."""
+    if not current_link.is_symlink():
+        return None
+    return (current_link.parent / os.readlink(current_link)).resolve()
+
+
+def retire_releases(releases_dir: Path, current_link: Path) -> bool:
+    """
+    `current` symlink와 release 디렉터리를 모두 지운다. 지운 것이 있으면 True.
+
+    `current`가 남아 있으면 nginx가 더 이상 갱신되지 않는 snapshot을 계속 서빙하므로
+    release 모드를 끈 worker가 시작할 때 호출한다.
+    """
+    retired = False
+    if current_link.is_symlink():
+        current_link.unlink()
+        fsync_directory(current_link.parent)
+        retired = True
+    if releases_dir.is_dir():
+        shutil.rmtree(releases_dir, ignore_errors=True)
+        retired = True
+    return retired
+
+
+def prune_releases(releases_dir: Path, keep: int, current_link: Path) -> list[Path]:
+    """
+    최신 `keep`개와 `current`가 가리키는 release만 남기고 지운다.
+
+    이름(release id = UTC 시각) 순으로 최신을 판단한다. 남은 staging 디렉터리
+    (crash 잔여물)도 함께 지운다.
+    """
+    if not releases_dir.is_dir():
+        return []
+    current = resolve_current_release(current_link)
+    releases = sorted(
+        (path for path in releases_dir.iterdir() if path.is_dir()),
+        key=lambda path: path.name,
+    )
+    finished = [path for path in releases if not path.name.endswith(STAGING_SUFFIX)]
+    retained = set(finished[-keep:]) if keep > 0 else set()
+    removed: list[Path] = []
+    for path in releases:
+        if path in retained or (current is not None and path.resolve() == current):
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed.append(path)
+    return removed
@@ -8,9 +8,76 @@ Why this module exists:
 
 from __future__ import annotations
 
+import hashlib
 import json
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from utils.downsample import aggregate_ohlcv, lttb_indices
+from utils.http_cache import format_http_date
+from utils.indicators import IndicatorState, compute_indicators, indicator_output_columns
+
+HISTORY_EXPORT_COLUMNS = ["open", "high", "low", "close", "volume"]
+# history 직렬화/스트리밍 write에서 한 번에 다루는 candle 수.
+HISTORY_ENCODE_CHUNK_ROWS = 2048
+
+
+@dataclass
+class HistoryExportCache:
+    """
+    series별로 마지막 export 산출물이 담고 있는 내용.
+
+    - frame: export된 OHLCV(UTC index)
+    - rows: frame과 같은 순서의 JSON record 조각(`data` 배열 원소)
+    - last_full_at: 마지막 full 재조회 시각
+    """
+
+    frame: pd.DataFrame
+    rows: list[str]
+    last_full_at: datetime
+
+
+# 프로세스 수명 동안 유지되는 export 캐시.
+# 재시작 직후(cold start)에는 비어 있으므로 첫 export는 항상 full 경로를 탄다.
+_history_export_cache: dict[str, HistoryExportCache] = {}
+
+
+@dataclass
+class HistoryPrefetch:
+    """
+    batch 조회로 미리 받아 둔 series 1개의 history.
+
+    - incremental: 증분 범위(마지막 export candle부터)로 받았는지 여부
+    - frame: `timestamp` index로 정리된 조회 결과(없으면 빈 DataFrame)
+    """
+
+    incremental: bool
+    frame: pd.DataFrame
+
+
+# publish 직전 symbol 단위 batch 조회 결과. series export가 한 번 꺼내 쓰고 버린다.
+_history_prefetch: dict[str, HistoryPrefetch] = {}
+
+
+# series별 마지막 tail sequence. cold start에는 기존 tail 파일 값을 이어받는다.
+_history_tail_sequences: dict[str, int] = {}
+
+
+# series별 마지막 지표 계산 state. 다음 export는 바뀐 candle부터만 계산한다.
+_history_indicator_states: dict[str, IndicatorState] = {}
+
+
+def reset_history_export_cache() -> None:
+    """테스트/운영 도구에서 export 캐시를 비운다."""
+    _history_export_cache.clear()
+    _history_tail_sequences.clear()
+    _history_indicator_states.clear()
+    _history_prefetch.clear()
 
 
 def static_export_candidates(
@@ -19,6 +86,7 @@ def static_export_candidates(
     symbol: str,
     timeframe: str,
     static_dir: Path | None = None,
+    suffix: str = ".json",
 ) -> list[Path]:
     """
     canonical/legacy 정적 파일 후보 경로를 우선순위 순으로 반환한다.
@@ -31,7 +99,7 @@ def static_export_candidates(
     - 전환기 dual-write 환경에서 읽기 경로 단절 없이 최신 파일을 찾기 위함이다.
     """
     canonical, legacy = ctx._static_export_paths(
-        kind, symbol, timeframe, static_dir=static_dir
+        kind, symbol, timeframe, static_dir=static_dir, suffix=suffix
     )
     candidates = [canonical]
     if legacy is not None:
@@ -47,7 +115,7 @@ def extract_updated_at_from_files(
     후보 파일 중 첫 번째 유효한 `updated_at`과 source filename을 반환한다.
 
     Called from:
-    - `build_runtime_manifest`
+    - `resolve_updated_at` (registry가 답하지 못한 파일)
 
     Why:
     - manifest가 "어떤 파일에서 읽었는지"를 함께 남겨 디버깅 경로를 보존한다.
@@ -77,6 +145,136 @@ def extract_updated_at_from_files(
     return None, None
 
 
+def resolve_updated_at(
+    ctx,
+    candidates: list[Path],
+) -> tuple[str | None, str | None]:
+    """
+    publish registry 기준으로 첫 번째 유효 후보의 `updated_at`과 filename을 반환한다.
+
+    Called from:
+    - `build_runtime_manifest`
+
+    Why:
+    - export가 쓸 때 남긴 메타데이터를 쓰므로 multi-MB history를 매 cycle 다시
+      파싱하지 않는다. registry miss(cold start/외부 변경)는 파일을 한 번 읽어 채운다.
+    - 파싱 실패처럼 registry가 답하지 못하는 경우는 기존 파일 경로로 넘겨
+      에러 로그/반환 의미를 그대로 유지한다.
+    """
+    for path in candidates:
+        artifact = ctx.publish_registry.resolve(path)
+        if artifact is not None:
+            return artifact.updated_at, path.name
+        if path.exists():
+            return extract_updated_at_from_files(ctx, [path])
+    return None, None
+
+
+def resolve_prediction_status(
+    ctx,
+    symbol: str,
+    timeframe: str,
+    *,
+    now: datetime,
+    static_dir: Path,
+):
+    """
+    publish registry 기준 prediction freshness snapshot.
+
+    Called from:
+    - `build_runtime_manifest`
+
+    Why:
+    - predict가 쓴 `updated_at`을 재사용해 prediction 파일 재읽기를 피한다.
+    - registry가 답하지 못하면(corrupt 등) `evaluate_prediction_status`로 판정한다.
+    """
+    for path in ctx.prediction_file_candidates(symbol, timeframe, static_dir):
+        artifact = ctx.publish_registry.resolve(path)
+        if artifact is not None:
+            return ctx.snapshot_from_updated_at(
+                symbol, timeframe, path.name, artifact.updated_at, now
+            )
+        if path.exists():
+            break
+    return ctx.evaluate_prediction_status(
+        symbol=symbol,
+        timeframe=timeframe,
+        now=now,
+        static_dir=static_dir,
+    )
+
+
+def http_last_modified(path: Path | None) -> str | None:
+    """
+    nginx가 `path`에 보낼 Last-Modified(HTTP-date). 파일이 없으면 None.
+
+    Called from:
+    - `describe_http_validators` / `describe_history_pyramid` / `describe_binary_export`
+    - `write_history_segments` (segment index), `write_runtime_manifest_v2` (shard 목록)
+
+    Why:
+    - 클라이언트가 manifest의 값을 그대로 `If-Modified-Since`로 보내면 nginx
+      (`if_modified_since exact`)가 304로 답한다. 압축 sibling은 원본과 mtime을
+      맞춰 두므로 gzip/brotli 응답에도 같은 값이 맞는다.
+    - nginx ETag(`"mtime-size"`)는 표현(원본/압축)마다 size가 달라 manifest에 싣지 않는다.
+    """
+    if path is None:
+        return None
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    return format_http_date(datetime.fromtimestamp(mtime, tz=timezone.utc))
+
+
+def describe_http_validators(ctx, path: Path | None) -> dict:
+    """
+    산출물의 HTTP validator(`last_modified`)를 반환한다. 파일이 없으면 None 값.
+
+    Called from:
+    - `build_runtime_manifest`
+
+    Why:
+    - 클라이언트가 manifest만 보고 파일 재요청 여부를 판단하고, 재요청 시에도
+      조건부 요청으로 본문 전송을 생략할 수 있게 한다.
+    """
+    return {"last_modified": http_last_modified(path)}
+
+
+def describe_binary_export(ctx, candidates: list[Path]) -> dict | None:
+    """
+    첫 번째로 존재하는 binary 산출물의 파일명/크기/hash를 반환한다.
+
+    Called from:
+    - `build_runtime_manifest`
+
+    Why:
+    - 클라이언트가 manifest만 보고 binary 파일의 변경 여부/무결성을 판단하게 한다.
+    - hash는 stat 검증 캐시(`file_sha256`)를 써서 매 cycle 재읽기를 피한다.
+    - 없는 후보(Arrow export off, legacy만 남은 전환기)는 다음 후보로 넘어간다.
+      에러 로그는 존재하는 파일을 못 읽었을 때만 남긴다.
+    """
+    for path in candidates:
+        try:
+            size_bytes = path.stat().st_size
+            digest = ctx.file_sha256(path)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            ctx.logger.error(f"Failed to read binary export file {path.name}: {e}")
+            return None
+        if digest is None:
+            continue
+        return {
+            "format": "arrow_ipc_stream",
+            "source_file": path.name,
+            "size_bytes": size_bytes,
+            "sha256": digest,
+            "last_modified": http_last_modified(path),
+        }
+    return None
+
+
 def build_runtime_manifest(
     ctx,
     symbols: list[str],
@@ -138,7 +336,7 @@ def build_runtime_manifest(
         )
 
         for timeframe in timeframes:
-            history_updated_at, history_file = extract_updated_at_from_files(
+            history_updated_at, history_file = resolve_updated_at(
                 ctx,
                 static_export_candidates(
                     ctx,
@@ -148,9 +346,33 @@ def build_runtime_manifest(
                     static_dir=resolved_static_dir,
                 ),
             )
-            snapshot = ctx.evaluate_prediction_status(
-                symbol=symbol,
-                timeframe=timeframe,
+            history_path = resolved_static_dir / history_file if history_file else None
+            prediction_path = next(
+                (
+                    path
+                    for path in ctx.prediction_file_candidates(
+                        symbol, timeframe, resolved_static_dir
+                    )
+                    if path.exists()
+                ),
+                None,
+            )
+            tail_path, _ = ctx._static_export_paths(
+                "history_tail", symbol, timeframe, static_dir=resolved_static_dir
+            )
+            indicators_path, _ = ctx._static_export_paths(
+                "history_indicators", symbol, timeframe, static_dir=resolved_static_dir
+            )
+            segment_index_path = (
+                ctx._history_segment_dir(
+                    symbol, timeframe, static_dir=resolved_static_dir
+                )
+                / "index.json"
+            )
+            snapshot = resolve_prediction_status(
+                ctx,
+                symbol,
+                timeframe,
                 now=resolved_now,
                 static_dir=resolved_static_dir,
             )
@@ -177,10 +399,53 @@ def build_runtime_manifest(
                     "history": {
                         "updated_at": history_updated_at,
                         "source_file": history_file,
+                        **describe_http_validators(ctx, history_path),
+                        # v2 segment index(상대 경로). 미발행이면 None.
+                        # segment/tail 각각의 last_modified는 index 안에 있다.
+                        "segment_index": (
+                            segment_index_path.relative_to(
+                                resolved_static_dir
+                            ).as_posix()
+                            if segment_index_path.exists()
+                            else None
+                        ),
+                        "segment_index_last_modified": http_last_modified(
+                            segment_index_path
+                        ),
+                        # 최신 K개 candle polling용 tail 파일. 미발행이면 None.
+                        "tail_file": (
+                            tail_path.name if tail_path.exists() else None
+                        ),
+                        "tail_last_modified": http_last_modified(tail_path),
+                        # 지표 채널 sidecar. 미발행이면 None.
+                        "indicators_file": (
+                            indicators_path.name
+                            if indicators_path.exists()
+                            else None
+                        ),
+                        "indicators_last_modified": http_last_modified(
+                            indicators_path
+                        ),
+                        # downsampled level 목록(point budget 내림차순). 미발행이면 None.
+                        "pyramid": describe_history_pyramid(
+                            ctx, symbol, timeframe, resolved_static_dir
+                        ),
+                        "binary": describe_binary_export(
+                            ctx,
+                            static_export_candidates(
+                                ctx,
+                                "history",
+                                symbol,
+                                timeframe,
+                                static_dir=resolved_static_dir,
+                                suffix=ctx.HISTORY_ARROW_SUFFIX,
+                            ),
+                        ),
                     },
                     "prediction": {
                         "status": snapshot.status,
                         "updated_at": snapshot.updated_at,
+                        **describe_http_validators(ctx, prediction_path),
                         "age_minutes": snapshot.age_minutes,
                         "threshold_minutes": {
                             "soft": snapshot.soft_limit_minutes,
@@ -234,7 +499,7 @@ def write_runtime_manifest(
     prediction_health_path: Path | None = None,
     symbol_activation_entries: dict[str, dict] | None = None,
     path: Path | None = None,
-) -> None:
+) -> dict:
     """
     manifest 생성 후 파일에 atomic write한다.
 
@@ -243,6 +508,9 @@ def write_runtime_manifest(
 
     Why:
     - 부분 쓰기 파일 노출을 피하고, 읽는 쪽(FE/admin)의 일관성을 유지한다.
+
+    Returns:
+      - dict: 생성한 manifest payload(skip 여부와 무관). prediction bundle이 재사용한다.
     """
     resolved_path = path or ctx.MANIFEST_FILE
     payload = build_runtime_manifest(
@@ -254,42 +522,1100 @@ def write_runtime_manifest(
         prediction_health_path=prediction_health_path,
         symbol_activation_entries=symbol_activation_entries,
     )
-    ctx.atomic_write_json(resolved_path, payload, indent=2)
+    # generated_at/age_minutes는 매 cycle 바뀌므로 비교에서 뺀다. skip되면 파일의 두 값은
+    # 마지막으로 내용이 바뀐 시점 값이다. 소비자(admin)는 age를 updated_at으로 계산한다.
+    result = ctx.atomic_write_json(
+        resolved_path,
+        payload,
+        indent=2,
+        precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+        skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        ignore_keys=("generated_at",),
+        normalize=_manifest_fingerprint_payload,
+    )
+    if not result.written:
+        ctx.logger.info(f"Runtime manifest unchanged: {resolved_path}")
+        return payload
     ctx.logger.info(f"Runtime manifest updated: {resolved_path}")
+    return payload
 
 
-def save_history_to_json(ctx, df, symbol, timeframe):
+def _manifest_shard_entry(entry: dict) -> dict:
     """
-    history DataFrame을 정적 JSON으로 저장한다(canonical + legacy).
+    shard용 entry. 매 cycle 값이 바뀌는 파생 값(`prediction.age_minutes`)은 뺀다.
+
+    age는 `prediction.updated_at`과 index `generated_at`으로 계산할 수 있고, 빼 두면
+    shard는 series 상태가 실제로 바뀔 때만 다시 쓰인다.
+    """
+    prediction = {
+        key: value
+        for key, value in entry.get("prediction", {}).items()
+        if key != "age_minutes"
+    }
+    return {**entry, "prediction": prediction}
+
+
+def _manifest_fingerprint_payload(payload: dict) -> dict:
+    """v1 manifest skip 비교용 payload. entry를 shard와 같은 규칙으로 정리한다."""
+    return {
+        **payload,
+        "entries": [
+            _manifest_shard_entry(entry) for entry in payload.get("entries", [])
+        ],
+    }
+
+
+def write_runtime_manifest_v2(
+    ctx, manifest: dict, *, static_dir: Path | None = None
+) -> Path:
+    """
+    manifest v2(`index.json` + symbol별 shard)를 기록한다.
 
     Called from:
-    - `update_full_history_file`
+    - `scripts.pipeline_worker` cycle 종료 시점(v1 manifest 기록 직후, MANIFEST_V2_ENABLED)
 
     Why:
-    - 사용자 플레인이 SSG 기반이므로, export 시점마다 완결된 JSON 산출물이 필요하다.
+    - 단일 manifest는 symbol 수에 비례해 커지고, 소비자는 매 polling마다 전체를 받아
+      다시 파싱한다. index는 summary + shard 목록(hash 포함)만 담아 작게 유지하고,
+      소비자는 hash가 바뀐 shard만 다시 받는다.
+    - shard는 skip-unchanged write로 내용이 바뀐 것만 다시 쓴다.
+    - 더 이상 manifest에 없는 symbol의 shard는 지운다.
     """
+    resolved_static_dir = static_dir or ctx.STATIC_DIR
+    root = resolved_static_dir / ctx.MANIFEST_V2_DIRNAME
+    shard_dir = root / "shards"
+    grouped: dict[str, list[dict]] = {}
+    for entry in manifest.get("entries", []):
+        grouped.setdefault(entry["symbol"], []).append(_manifest_shard_entry(entry))
+
+    shards: list[dict] = []
+    written_count = 0
+    for symbol, entries in grouped.items():
+        shard_path = shard_dir / f"{symbol.replace('/', '_')}.json"
+        result = ctx.atomic_write_json(
+            shard_path,
+            {"version": 2, "symbol": symbol, "entries": entries},
+            precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+            skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        )
+        written_count += int(result.written)
+        shards.append(
+            {
+                "symbol": symbol,
+                "url": shard_path.relative_to(root).as_posix(),
+                "sha256": result.sha256,
+                "size_bytes": result.size_bytes,
+                "last_modified": http_last_modified(shard_path),
+                "entry_count": len(entries),
+                "serve_allowed_count": sum(
+                    1 for entry in entries if entry.get("serve_allowed")
+                ),
+            }
+        )
+
+    current_names = {Path(shard["url"]).name for shard in shards}
+    if shard_dir.exists():
+        for stale_path in shard_dir.glob("*.json"):
+            if stale_path.name in current_names:
+                continue
+            for target in (stale_path, *ctx.precompressed_sibling_paths(stale_path)):
+                target.unlink(missing_ok=True)
+
+    index_path = root / "index.json"
+    # shard 목록/summary가 같으면 다시 쓰지 않으므로 generated_at은 index 내용이
+    # 마지막으로 바뀐 시각이다(admin은 "last changed"로 표시한다).
+    ctx.atomic_write_json(
+        index_path,
+        {
+            "version": 2,
+            "generated_at": manifest.get("generated_at"),
+            "summary": manifest.get("summary", {}),
+            "shards": shards,
+        },
+        indent=2,
+        precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+        skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        ignore_keys=("generated_at",),
+    )
+    ctx.logger.info(
+        f"Runtime manifest v2 updated: {index_path} "
+        f"(shards={len(shards)}, rewritten={written_count})"
+    )
+    return index_path
+
+
+def _load_prediction_payload(ctx, candidates: list[Path]) -> dict | None:
+    """
+    첫 번째로 읽을 수 있는 prediction 파일 payload를 반환한다.
+
+    파싱 결과는 publish registry에 stat과 함께 캐시해, 바뀌지 않은 파일은
+    다음 cycle bundle 생성 때 다시 읽지 않는다.
+    """
+    for path in candidates:
+        payload = ctx.publish_registry.cached_payload(path)
+        if payload is None:
+            if not path.exists():
+                continue
+            try:
+                with open(path, "r") as f:
+                    payload = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                ctx.logger.error(f"Failed to read prediction file {path.name}: {e}")
+                continue
+            ctx.publish_registry.record_payload(path, payload)
+        if isinstance(payload, dict):
+            return payload
+    return None
+
+
+def build_predictions_bundle(
+    ctx, manifest: dict, *, static_dir: Path | None = None
+) -> dict:
+    """
+    manifest에서 `serve_allowed`인 series의 forecast를 하나의 payload로 묶는다.
+
+    Called from:
+    - `write_predictions_bundle`
+
+    Why:
+    - overview 화면이 series마다 prediction 파일을 요청하지 않고 한 번에 받게 한다.
+    - 노출 판단은 manifest의 `serve_allowed`를 그대로 따른다(hidden/hard stale 제외).
+    """
+    resolved_static_dir = static_dir or ctx.STATIC_DIR
+    entries: list[dict] = []
+    for entry in manifest.get("entries", []):
+        if not entry.get("serve_allowed"):
+            continue
+        symbol = entry["symbol"]
+        timeframe = entry["timeframe"]
+        payload = _load_prediction_payload(
+            ctx,
+            static_export_candidates(
+                ctx, "prediction", symbol, timeframe, static_dir=resolved_static_dir
+            ),
+        )
+        if payload is None:
+            continue
+        entries.append(
+            {
+                "key": entry["key"],
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "status": entry["prediction"]["status"],
+                "updated_at": payload.get("updated_at"),
+                "forecast": payload.get("forecast", []),
+            }
+        )
+    return {
+        "version": 1,
+        "generated_at": manifest.get("generated_at"),
+        "entry_count": len(entries),
+        "entries": entries,
+    }
+
+
+def write_predictions_bundle(
+    ctx,
+    manifest: dict,
+    *,
+    static_dir: Path | None = None,
+    path: Path | None = None,
+) -> Path:
+    """
+    prediction bundle을 atomic write(+압축 sibling)한다.
+
+    Called from:
+    - `scripts.pipeline_worker` cycle 종료 시점(manifest 기록 직후)
+    """
+    resolved_path = path or ctx.PREDICTIONS_BUNDLE_FILE
+    bundle = build_predictions_bundle(ctx, manifest, static_dir=static_dir)
+    result = ctx.atomic_write_json(
+        resolved_path,
+        bundle,
+        precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+        skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        ignore_keys=("generated_at",),
+    )
+    if result.written:
+        ctx.logger.info(
+            f"Predictions bundle updated: {resolved_path} "
+            f"(entries={bundle['entry_count']})"
+        )
+    return resolved_path
+
+
+def _normalize_history_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    export 대상 컬럼만 남기고 index를 UTC DatetimeIndex로 정규화한다.
+    """
+    frame = df[HISTORY_EXPORT_COLUMNS].copy()
+    index = pd.DatetimeIndex(frame.index)
+    frame.index = (
+        index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    )
+    frame.index.name = "timestamp"
+    return frame
+
+
+def _encode_json_values(values: np.ndarray) -> list[str]:
+    """
+    1차원 column 값을 `json.dumps`와 같은 표기로 직렬화한다.
+
+    - float: `repr`(json 모듈과 동일), NaN/Infinity도 json 기본 표기 유지
+    - 그 외(int/None/object): `json.dumps`
+    """
+    if values.dtype.kind == "f":
+        texts = list(map(float.__repr__, values.tolist()))
+        non_finite = np.flatnonzero(~np.isfinite(values))
+        for position in non_finite.tolist():
+            texts[position] = json.dumps(float(values[position]))
+        return texts
+    return list(map(json.dumps, values.tolist()))
+
+
+def _iter_history_row_chunks(
+    frame: pd.DataFrame, chunk_rows: int = HISTORY_ENCODE_CHUNK_ROWS
+) -> Iterator[list[str]]:
+    """
+    history record를 최대 `chunk_rows`개씩 candle 단위 JSON 조각으로 직렬화해 내보낸다.
+
+    Why:
+    - DataFrame 복사/record dict 생성 없이 NumPy column을 chunk 단위로 읽어
+      `json.dumps(record)`와 같은 문자열을 만든다(중간 객체가 chunk 크기로 제한됨).
+    - 소비자가 chunk를 바로 흘려 쓰면 전체 record 문자열을 한 번에 들고 있지 않는다.
+    """
+    columns = [frame[column].to_numpy() for column in HISTORY_EXPORT_COLUMNS]
+    for start in range(0, len(frame), chunk_rows):
+        end = start + chunk_rows
+        timestamps = frame.index[start:end].strftime("%Y-%m-%dT%H:%M:%SZ")
+        encoded = [_encode_json_values(values[start:end]) for values in columns]
+        yield [
+            '{"timestamp": "%s", "open": %s, "high": %s, "low": %s, '
+            '"close": %s, "volume": %s}' % fields
+            for fields in zip(timestamps, *encoded)
+        ]
+
+
+def _encode_history_rows(
+    frame: pd.DataFrame, chunk_rows: int = HISTORY_ENCODE_CHUNK_ROWS
+) -> list[str]:
+    """
+    history record 조각 전체를 list로 반환한다.
+
+    증분 export 캐시처럼 조각을 보관해 새 candle만 인코딩하려는 경로에서 쓴다.
+    """
+    rows: list[str] = []
+    for chunk in _iter_history_row_chunks(frame, chunk_rows):
+        rows.extend(chunk)
+    return rows
+
+
+def _history_time_part(index: pd.DatetimeIndex) -> str:
+    """columnar 시간 축 조각(`"start"/"step"` 또는 `"time"`)."""
+    epoch = index.as_unit("s").asi8
+    steps = np.diff(epoch)
+    if len(epoch) <= 1 or bool((steps == steps[0]).all()):
+        start = int(epoch[0]) if len(epoch) else None
+        step = int(steps[0]) if len(steps) else None
+        return f'"start": {json.dumps(start)}, "step": {json.dumps(step)}'
+    return f'"time": {json.dumps(epoch.tolist())}'
+
+
+def _history_column_parts(
+    frame: pd.DataFrame, float_decimals: int | None = None
+) -> list[str]:
+    """
+    columnar 포맷의 데이터 조각(`"start"/"step"` 또는 `"time"` + 컬럼 배열)을 만든다.
+
+    Why:
+    - record 포맷은 candle마다 key 6개와 timestamp 문자열을 반복한다.
+      column 배열은 NumPy에서 바로 만들고 key는 한 번만 쓴다.
+    - 간격이 일정하면 epoch 배열 대신 `start`(epoch seconds) + `step`(seconds)만 쓴다.
+      gap이 있거나 월봉처럼 간격이 불규칙하면 `time`(epoch seconds 배열)을 쓴다.
+    """
+    parts = [_history_time_part(frame.index)]
+    for column in HISTORY_EXPORT_COLUMNS:
+        values = frame[column].to_numpy(dtype=np.float64)
+        if float_decimals is not None:
+            values = np.round(values, float_decimals)
+        parts.append(f"{json.dumps(column)}: {json.dumps(values.tolist())}")
+    return parts
+
+
+def _iter_history_fragment(
+    ctx, frame: pd.DataFrame, rows: list[str] | None
+) -> Iterator[str]:
+    """
+    `HISTORY_EXPORT_FORMAT`에 맞는 history 데이터 조각을 chunk 단위로 내보낸다.
+
+    - records(기본): `"data": [...]`. rows가 있으면(증분 캐시) 미리 직렬화된 record
+      조각을 재사용하고, None이면 chunk마다 그 자리에서 인코딩한다.
+    - columnar: `_history_column_parts`
+    이어 붙이면 `_history_data_fragment`와 같은 문자열이다.
+    """
+    if ctx.HISTORY_EXPORT_FORMAT == "columnar":
+        parts = _history_column_parts(frame, ctx.HISTORY_EXPORT_FLOAT_DECIMALS)
+        for position, part in enumerate(parts):
+            yield part if position == 0 else ", " + part
+        return
+    if rows is None:
+        row_chunks: Iterable[list[str]] = _iter_history_row_chunks(frame)
+    else:
+        row_chunks = (
+            rows[start : start + HISTORY_ENCODE_CHUNK_ROWS]
+            for start in range(0, len(rows), HISTORY_ENCODE_CHUNK_ROWS)
+        )
+    yield '"data": ['
+    for position, chunk in enumerate(row_chunks):
+        text = ", ".join(chunk)
+        yield text if position == 0 else ", " + text
+    yield "]"
+
+
+def _history_frame_fingerprint(ctx, frame: pd.DataFrame) -> str:
+    """
+    history 데이터 조각의 skip 비교용 digest(sha256 hex).
+
+    조각은 (포맷, 소수 자릿수, index, column 값)으로 정해지므로 문자열로 인코딩하지 않고
+    NumPy buffer를 바로 hash한다. 스트리밍 write 전에 본문을 한 번 더 만들지 않기 위해서다.
+    """
+    digest = hashlib.sha256(
+        f"{ctx.HISTORY_EXPORT_FORMAT}\n{ctx.HISTORY_EXPORT_FLOAT_DECIMALS}\n".encode(
+            "utf-8"
+        )
+    )
+    digest.update(pd.DatetimeIndex(frame.index).as_unit("ns").asi8.tobytes())
+    for column in HISTORY_EXPORT_COLUMNS:
+        values = frame[column].to_numpy()
+        digest.update(f"\n{column}:{values.dtype.str}\n".encode("utf-8"))
+        if values.dtype.kind in "biuf":
+            digest.update(np.ascontiguousarray(values).tobytes())
+            continue
+        for start in range(0, len(values), HISTORY_ENCODE_CHUNK_ROWS):
+            chunk = values[start : start + HISTORY_ENCODE_CHUNK_ROWS]
+            digest.update(",".join(_encode_json_values(chunk)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _history_data_fragment(
+    ctx, frame: pd.DataFrame, rows: list[str] | None
+) -> str:
+    """
+    `HISTORY_EXPORT_FORMAT`에 맞는 history 데이터 조각을 반환한다.
+
+    segment/tail처럼 작은 문서용이다. 전체 history는 `_iter_history_fragment`로 흘려 쓴다.
+    """
+    return "".join(_iter_history_fragment(ctx, frame, rows))
+
+
+def _history_rows_for_format(ctx, frame: pd.DataFrame) -> list[str]:
+    """
+    증분 캐시에 보관할 record 조각. records 포맷에서만 필요하고 columnar면 인코딩을 건너뛴다.
+    """
+    if ctx.HISTORY_EXPORT_FORMAT == "columnar":
+        return []
+    return _encode_history_rows(frame)
+
+
+def _iter_document(
+    fragment_chunks: Iterable[str], before: dict, after: dict | None = None
+) -> Iterator[str]:
+    """
+    데이터 조각 chunk를 끼워 JSON object를 chunk 단위로 내보낸다.
+
+    이어 붙인 결과는 `_render_document`와 같다.
+    """
+    yield "{" + "".join(
+        f"{json.dumps(key)}: {json.dumps(value)}, " for key, value in before.items()
+    )
+    yield from fragment_chunks
+    yield "".join(
+        f", {json.dumps(key)}: {json.dumps(value)}"
+        for key, value in (after or {}).items()
+    ) + "}"
+
+
+def _render_document(
+    data_fragment: str, before: dict, after: dict | None = None
+) -> str:
+    """
+    미리 만든 데이터 조각을 끼워 JSON object를 조립한다.
+
+    records 조각이면 출력은 `json.dumps({**before, "data": [...], **after})`와
+    byte 단위로 같다.
+    """
+    return "".join(_iter_document([data_fragment], before, after))
+
+
+def _history_document_fields(
+    ctx, symbol: str, timeframe: str, updated_at: str
+) -> tuple[dict, dict]:
+    """
+    history 파일에서 데이터 조각 앞/뒤에 오는 필드를 반환한다.
+
+    records 포맷은 `json.dumps(payload)`와 byte 단위로 동일한 출력을 유지해
+    full/incremental 어느 경로로 써도 소비자 계약이 바뀌지 않게 한다.
+    columnar 포맷은 `format` 필드로 구분한다.
+    """
+    after = {
+        "updated_at": updated_at,
+        "timeframe": timeframe,
+        "type": f"history_{timeframe}",
+    }
+    if ctx.HISTORY_EXPORT_FORMAT == "columnar":
+        after["format"] = "columnar"
+    return {"symbol": symbol}, after
+
+
+def _load_pyarrow_module():
     try:
-        export_df = df.copy()
-        export_df["timestamp"] = export_df.index.strftime("%Y-%m-%dT%H:%M:%SZ")
+        import pyarrow as pa  # type: ignore
+        import pyarrow.ipc  # type: ignore  # noqa: F401
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "pyarrow is required for HISTORY_ARROW_EXPORT_ENABLED. "
+            "Install dependencies first."
+        ) from exc
+    return pa
 
-        json_output = {
-            "symbol": symbol,
-            "data": export_df[
-                ["timestamp", "open", "high", "low", "close", "volume"]
-            ].to_dict(orient="records"),
-            "updated_at": datetime.now(timezone.utc).strftime(
-                "%Y-%m-%dT%H:%M:%SZ"
+
+def encode_history_arrow(
+    frame: pd.DataFrame, symbol: str, timeframe: str, updated_at: str
+) -> bytes:
+    """
+    history frame을 Arrow IPC stream bytes로 인코딩한다.
+
+    Schema:
+    - timestamp: timestamp[s, UTC]
+    - open/high/low/close/volume: float64
+    - schema metadata: symbol/timeframe/updated_at
+
+    Why:
+    - 장기 timeframe 전체 history를 받는 차트 클라이언트가 JSON 파싱 없이
+      column 버퍼를 그대로 읽게 한다.
+    """
+    pa = _load_pyarrow_module()
+    arrays = [
+        pa.array(frame.index.as_unit("s").asi8, type=pa.timestamp("s", tz="UTC"))
+    ]
+    arrays.extend(
+        pa.array(frame[column].to_numpy(dtype=np.float64), type=pa.float64())
+        for column in HISTORY_EXPORT_COLUMNS
+    )
+    table = pa.Table.from_arrays(
+        arrays,
+        names=["timestamp", *HISTORY_EXPORT_COLUMNS],
+    ).replace_schema_metadata(
+        {"symbol": symbol, "timeframe": timeframe, "updated_at": updated_at}
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _write_history_arrow(
+    ctx, symbol: str, timeframe: str, frame: pd.DataFrame, updated_at: str
+) -> None:
+    data = encode_history_arrow(frame, symbol, timeframe, updated_at)
+    canonical_path, legacy_path = ctx._static_export_paths(
+        "history", symbol, timeframe, suffix=ctx.HISTORY_ARROW_SUFFIX
+    )
+    ctx.atomic_write_bytes(canonical_path, data)
+    if legacy_path is not None:
+        ctx.atomic_link_or_copy(canonical_path, legacy_path)
+
+
+def _history_segment_format(ctx, timeframe: str) -> str:
+    period = ctx.HISTORY_SEGMENT_PERIOD_BY_TIMEFRAME.get(timeframe, "month")
+    return "%Y" if period == "year" else "%Y-%m"
+
+
+def _load_history_segment_index(path: Path) -> dict[str, dict]:
+    """
+    직전 index의 closed segment 엔트리를 id 기준으로 읽는다. 없거나 깨졌으면 빈 dict.
+    """
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    segments = payload.get("segments") if isinstance(payload, dict) else None
+    if not isinstance(segments, list):
+        return {}
+    return {
+        entry["id"]: entry
+        for entry in segments
+        if isinstance(entry, dict) and isinstance(entry.get("id"), str)
+    }
+
+
+def write_history_segments(
+    ctx,
+    symbol: str,
+    timeframe: str,
+    frame: pd.DataFrame,
+    rows: list[str] | None,
+    updated_at: str,
+    *,
+    now: datetime | None = None,
+) -> Path | None:
+    """
+    history export v2(closed segment + tail + index)를 기록한다.
+
+    Called from:
+    - `_write_history_rows` (`HISTORY_SEGMENTS_ENABLED`일 때)
+
+    Why:
+    - 닫힌 기간 segment는 내용이 바뀌지 않으므로 클라이언트가 영구 캐시하고
+      tail/index만 polling할 수 있다. worker도 매 cycle tail/index만 다시 쓴다.
+
+    Rules:
+    - closed segment는 직전 index 엔트리와 행 범위(rows/first_at/last_at)가 같으면
+      다시 렌더링/hash하지 않고 엔트리를 재사용한다. 매 cycle 비용이 전체 history가
+      아니라 tail + 새로 닫힌 segment에 비례하게 하기 위해서다.
+    - 행 범위가 달라졌거나(gap refill) 파일/엔트리가 없으면 렌더링하고, hash가 다를 때만
+      다시 쓴다. 창이 기간 일부만 덮으면(lookback timeframe의 가장 오래된 달) 기존 파일을
+      유지해 창 이동에 따라 흔들리지 않게 한다.
+    - 쓰기 순서는 segment -> tail -> index라서 index가 없는 파일을 가리키지 않는다.
+    - index에서 빠진 segment 파일은 index 기록 후 정리한다.
+    """
+    resolved_now = now or datetime.now(timezone.utc)
+    segment_dir = ctx._history_segment_dir(symbol, timeframe)
+    index_path = segment_dir / "index.json"
+    url_prefix = f"{ctx.HISTORY_SEGMENTS_DIRNAME}/{segment_dir.name}"
+    period_format = _history_segment_format(ctx, timeframe)
+    current_key = resolved_now.strftime(period_format)
+    window_start = None
+    if timeframe not in ctx.FULL_HISTORY_EXPORT_TIMEFRAMES:
+        window_start = resolved_now - timedelta(
+            days=ctx._lookback_days_for_timeframe(timeframe)
+        )
+
+    previous = _load_history_segment_index(index_path)
+    keys = list(frame.index.strftime(period_format))
+    header = {"symbol": symbol, "timeframe": timeframe}
+
+    segments: list[dict] = []
+    tail_start = len(keys)
+    start = 0
+    while start < len(keys):
+        key = keys[start]
+        if key >= current_key:
+            tail_start = start
+            break
+        end = start
+        while end < len(keys) and keys[end] == key:
+            end += 1
+
+        path = segment_dir / f"{key}.json"
+        prior = previous.get(key)
+        covered = window_start is None or (
+            pd.Timestamp(key, tz="UTC") >= pd.Timestamp(window_start)
+        )
+        first_at = frame.index[start].strftime("%Y-%m-%dT%H:%M:%SZ")
+        last_at = frame.index[end - 1].strftime("%Y-%m-%dT%H:%M:%SZ")
+        if (
+            prior is not None
+            and prior.get("sha256")
+            and path.exists()
+            and (
+                not covered
+                or (
+                    prior.get("rows") == end - start
+                    and prior.get("first_at") == first_at
+                    and prior.get("last_at") == last_at
+                )
+            )
+        ):
+            segments.append({**prior, "last_modified": http_last_modified(path)})
+            start = end
+            continue
+
+        document = _render_document(
+            _history_data_fragment(
+                ctx,
+                frame.iloc[start:end],
+                None if rows is None else rows[start:end],
             ),
+            {**header, "segment": key},
+        )
+        digest = hashlib.sha256(document.encode("utf-8")).hexdigest()
+        if prior is None or not path.exists() or prior.get("sha256") != digest:
+            ctx.atomic_write_text(
+                path, document, precompress=ctx.STATIC_PRECOMPRESS_ENABLED
+            )
+        segments.append(
+            {
+                "id": key,
+                "url": f"{url_prefix}/{key}.json",
+                "sha256": digest,
+                "last_modified": http_last_modified(path),
+                "rows": end - start,
+                "first_at": first_at,
+                "last_at": last_at,
+            }
+        )
+        start = end
+
+    tail_count = len(keys) - tail_start
+    tail_fragment = _history_data_fragment(
+        ctx, frame.iloc[tail_start:], None if rows is None else rows[tail_start:]
+    )
+    tail_document = _render_document(
+        tail_fragment,
+        {**header, "segment": "tail"},
+        {"updated_at": updated_at},
+    )
+    tail_result = ctx.atomic_write_text(
+        segment_dir / "tail.json",
+        tail_document,
+        precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+        skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        fingerprint=tail_fragment,
+    )
+    tail_entry = {
+        "url": f"{url_prefix}/tail.json",
+        # skip된 경우 디스크의 기존 tail hash를 써야 index와 파일이 일치한다.
+        "sha256": tail_result.sha256,
+        "last_modified": http_last_modified(segment_dir / "tail.json"),
+        "rows": tail_count,
+        "first_at": (
+            frame.index[tail_start].strftime("%Y-%m-%dT%H:%M:%SZ")
+            if tail_count
+            else None
+        ),
+        "last_at": (
+            frame.index[-1].strftime("%Y-%m-%dT%H:%M:%SZ") if tail_count else None
+        ),
+    }
+
+    ctx.atomic_write_json(
+        index_path,
+        {
+            "version": 2,
+            "symbol": symbol,
             "timeframe": timeframe,
-            "type": f"history_{timeframe}",
+            "type": f"history_index_{timeframe}",
+            "period": "year" if period_format == "%Y" else "month",
+            "updated_at": updated_at,
+            "segments": segments,
+            "tail": tail_entry,
+        },
+        precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+        skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        ignore_keys=("updated_at",),
+    )
+
+    referenced: set[str] = set()
+    for name in [f"{entry['id']}.json" for entry in segments] + [
+        "tail.json",
+        "index.json",
+    ]:
+        referenced.add(name)
+        referenced.update(
+            sibling.name
+            for sibling in ctx.precompressed_sibling_paths(segment_dir / name)
+        )
+    for path in segment_dir.iterdir():
+        # dotfile은 진행 중인 atomic write temp 파일이다.
+        if path.name.startswith(".") or path.name in referenced:
+            continue
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            ctx.logger.warning(
+                f"[{symbol} {timeframe}] failed to remove stale segment {path}: {e}"
+            )
+    return index_path
+
+
+def write_history_pyramid(
+    ctx,
+    symbol: str,
+    timeframe: str,
+    frame: pd.DataFrame,
+    updated_at: str,
+) -> list[Path]:
+    """
+    `HISTORY_PYRAMID_LEVELS` point budget별 축소본을 기록한다.
+
+    Called from:
+    - `_write_history_rows` (`HISTORY_PYRAMID_ENABLED`일 때)
+
+    Why:
+    - 장기 구간 차트는 화면 폭보다 많은 candle을 받을 필요가 없다. 클라이언트는
+      manifest의 level 목록에서 viewport에 맞는 budget을 골라 받는다.
+
+    Level 문서:
+    - `data`: OHLCV bucket 집계(history record와 같은 스키마, timestamp는 bucket 첫 candle)
+    - `lttb`: close 선 차트용 LTTB 선택점(`timestamp`, `close`)
+    candle 수가 budget 이하인 level은 만들지 않고, 더 이상 만들지 않는 level 파일은 지운다.
+    """
+    pyramid_dir = ctx._history_pyramid_dir(symbol, timeframe)
+    epoch = frame.index.as_unit("s").asi8
+    close = frame["close"].to_numpy(dtype=np.float64)
+    paths: list[Path] = []
+    for points in ctx.HISTORY_PYRAMID_LEVELS:
+        if points < 3 or len(frame) <= points:
+            continue
+        starts, columns = aggregate_ohlcv(
+            *(
+                frame[column].to_numpy(dtype=np.float64)
+                for column in HISTORY_EXPORT_COLUMNS
+            ),
+            buckets=points,
+        )
+        buckets = pd.DataFrame(columns, index=frame.index[starts])
+        selected = lttb_indices(epoch, close, points)
+        lttb_rows = [
+            json.dumps({"timestamp": timestamp, "close": value})
+            for timestamp, value in zip(
+                frame.index[selected].strftime("%Y-%m-%dT%H:%M:%SZ"),
+                close[selected].tolist(),
+            )
+        ]
+        data_fragment = (
+            f'"data": [{", ".join(_encode_history_rows(buckets))}], '
+            f'"lttb": [{", ".join(lttb_rows)}]'
+        )
+        document = _render_document(
+            data_fragment,
+            {
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "type": f"history_pyramid_{timeframe}",
+                "points": points,
+                "source_rows": len(frame),
+            },
+            {"updated_at": updated_at},
+        )
+        path = pyramid_dir / f"{points}.json"
+        ctx.atomic_write_text(
+            path,
+            document,
+            precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+            skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+            fingerprint=f"{len(frame)}\n{data_fragment}",
+        )
+        paths.append(path)
+
+    referenced: set[str] = set()
+    for path in paths:
+        referenced.add(path.name)
+        referenced.update(
+            sibling.name for sibling in ctx.precompressed_sibling_paths(path)
+        )
+    if pyramid_dir.exists():
+        for path in pyramid_dir.iterdir():
+            # dotfile은 진행 중인 atomic write temp 파일이다.
+            if path.name.startswith(".") or path.name in referenced:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                ctx.logger.warning(
+                    f"[{symbol} {timeframe}] failed to remove stale pyramid level "
+                    f"{path}: {e}"
+                )
+    return paths
+
+
+def describe_history_pyramid(
+    ctx, symbol: str, timeframe: str, static_dir: Path
+) -> list[dict] | None:
+    """
+    발행된 pyramid level 목록(`points` 내림차순, 상대 url)을 반환한다. 없으면 None.
+
+    Called from:
+    - `build_runtime_manifest`
+    """
+    pyramid_dir = ctx._history_pyramid_dir(symbol, timeframe, static_dir=static_dir)
+    if not pyramid_dir.exists():
+        return None
+    levels = sorted(
+        (
+            int(path.stem)
+            for path in pyramid_dir.glob("*.json")
+            if path.stem.isdigit()
+        ),
+        reverse=True,
+    )
+    if not levels:
+        return None
+    url_prefix = pyramid_dir.relative_to(static_dir).as_posix()
+    return [
+        {
+            "points": points,
+            "url": f"{url_prefix}/{points}.json",
+            "last_modified": http_last_modified(pyramid_dir / f"{points}.json"),
         }
+        for points in levels
+    ]
+
+
+def _load_history_tail_sequence(path: Path) -> int:
+    """기존 tail 파일의 sequence를 읽는다. 없거나 깨졌으면 0."""
+    try:
+        with open(path, "r") as f:
+            payload = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return 0
+    sequence = payload.get("sequence") if isinstance(payload, dict) else None
+    if isinstance(sequence, bool) or not isinstance(sequence, int) or sequence < 0:
+        return 0
+    return sequence
+
+
+def write_history_tail(
+    ctx,
+    symbol: str,
+    timeframe: str,
+    frame: pd.DataFrame,
+    rows: list[str] | None,
+    updated_at: str,
+) -> Path:
+    """
+    마지막 `HISTORY_TAIL_CANDLES`개 candle만 담은 tail 파일(canonical)을 기록한다.
+
+    Called from:
+    - `_write_history_rows`
+
+    Why:
+    - 이미 history를 가진 클라이언트가 새 candle 1개를 위해 전체 파일을 다시 받지 않게 한다.
+    - `sequence`는 tail 본문이 바뀔 때만 1씩 증가한다. 클라이언트는 마지막으로 본 값과
+      비교해 갱신 여부를 판단하고, `data`를 timestamp 기준으로 기존 history에 병합한다.
+    - 본문/포맷은 history 파일과 같은 규칙(`HISTORY_EXPORT_FORMAT`)을 따른다.
+    - legacy alias는 발행하지 않는다. timeframe 없는 이름을 여러 timeframe이 번갈아 가리키면
+      그 이름으로 읽는 쪽의 sequence가 서로 다른 counter 사이를 오가며 뒤로 간다.
+    """
+    tail_count = ctx.HISTORY_TAIL_CANDLES
+    tail_frame = frame.iloc[-tail_count:]
+    tail_rows = None if rows is None else rows[-tail_count:]
+    data_fragment = _history_data_fragment(ctx, tail_frame, tail_rows)
+    canonical_path, _ = ctx._static_export_paths("history_tail", symbol, timeframe)
+    key = ctx._prediction_health_key(symbol, timeframe)
+    previous_sequence = _history_tail_sequences.get(key)
+    if previous_sequence is None:
+        previous_sequence = _load_history_tail_sequence(canonical_path)
+    sequence = previous_sequence + 1
+
+    after = {
+        "updated_at": updated_at,
+        "timeframe": timeframe,
+        "type": f"history_tail_{timeframe}",
+        "sequence": sequence,
+        "candles": len(tail_frame),
+    }
+    if ctx.HISTORY_EXPORT_FORMAT == "columnar":
+        after["format"] = "columnar"
+    document = _render_document(data_fragment, {"symbol": symbol}, after)
+    write_options = {
+        "precompress": ctx.STATIC_PRECOMPRESS_ENABLED,
+        "skip_unchanged": ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        # sequence/updated_at을 뺀 본문이 같으면 sequence를 올리지 않는다.
+        "fingerprint": f"{ctx.HISTORY_EXPORT_FORMAT}\n{data_fragment}",
+    }
+    result = ctx.atomic_write_text(canonical_path, document, **write_options)
+    _history_tail_sequences[key] = sequence if result.written else previous_sequence
+    return canonical_path
+
+
+def write_history_indicators(
+    ctx,
+    symbol: str,
+    timeframe: str,
+    frame: pd.DataFrame,
+    updated_at: str,
+) -> Path:
+    """
+    `HISTORY_INDICATORS` 지표 채널 파일(canonical)을 기록한다.
+
+    Called from:
+    - `_write_history_rows` (`HISTORY_INDICATORS_ENABLED`일 때)
+
+    Why:
+    - 차트 클라이언트가 전체 history로 지표를 다시 계산하지 않게 한다.
+    - 직전 계산 state를 이어받아 바뀐 candle(새 candle, 정정된 마지막 candle)부터만
+      계산한다. cold start나 backfill처럼 앞부분이 달라지면 전체를 다시 계산한다.
+    - 새 sidecar라 legacy alias를 두지 않는다. timeframe 없는 이름은 마지막으로 쓴
+      timeframe에 따라 내용이 바뀐다.
+
+    형식:
+    - history columnar와 같은 시간 축(`start`/`step` 또는 `time`) + 지표별 배열.
+      history candle과 1:1로 정렬되며 warmup 구간은 null이다.
+    """
+    key = ctx._prediction_health_key(symbol, timeframe)
+    state, _ = compute_indicators(
+        frame, ctx.HISTORY_INDICATORS, _history_indicator_states.get(key)
+    )
+    _history_indicator_states[key] = state
+
+    float_decimals = ctx.HISTORY_EXPORT_FLOAT_DECIMALS
+    parts = [_history_time_part(frame.index)]
+    for column in indicator_output_columns(ctx.HISTORY_INDICATORS):
+        values = state.columns[column]
+        if float_decimals is not None:
+            values = np.round(values, float_decimals)
+        # NaN은 JSON 표준 밖이므로 null로 쓴다.
+        encoded = [None if value != value else value for value in values.tolist()]
+        parts.append(f"{json.dumps(column)}: {json.dumps(encoded)}")
+    data_fragment = ", ".join(parts)
+    document = _render_document(
+        data_fragment,
+        {"symbol": symbol},
+        {
+            "updated_at": updated_at,
+            "timeframe": timeframe,
+            "type": f"history_indicators_{timeframe}",
+            "indicators": [spec.name for spec in ctx.HISTORY_INDICATORS],
+            "candles": len(frame),
+        },
+    )
+    canonical_path, _ = ctx._static_export_paths(
+        "history_indicators", symbol, timeframe
+    )
+    ctx.atomic_write_text(
+        canonical_path,
+        document,
+        precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+        skip_unchanged=ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        fingerprint=data_fragment,
+    )
+    return canonical_path
+
+
+def _write_history_rows(
+    ctx, symbol: str, timeframe: str, frame: pd.DataFrame, rows: list[str] | None
+) -> tuple[Path, Path | None]:
+    """
+    history 파일(canonical + legacy)을 `HISTORY_EXPORT_FORMAT`으로 기록한다.
+
+    rows는 증분 캐시의 record 조각이다. None이면 쓰는 동안 chunk 단위로 인코딩한다.
 
-        canonical_path, legacy_path = ctx._static_export_paths(
-            "history", symbol, timeframe
+    v2 segment / pyramid / tail / indicator / Arrow 발행이 켜져 있으면 같은 updated_at으로
+    함께 갱신한다.
+    JSON 본문이 바뀌지 않아 skip됐으면 부가 산출물도 다시 만들지 않는다.
+    부가 산출물 실패는 JSON 산출물 발행을 막지 않도록 에러 로그로만 남긴다.
+    """
+    updated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    before, after = _history_document_fields(ctx, symbol, timeframe, updated_at)
+    canonical_path, legacy_path = ctx._static_export_paths(
+        "history", symbol, timeframe
+    )
+    write_options = {
+        "precompress": ctx.STATIC_PRECOMPRESS_ENABLED,
+        "skip_unchanged": ctx.STATIC_SKIP_UNCHANGED_WRITES,
+        # updated_at을 뺀 본문(포맷 + 데이터 조각)이 같으면 같은 산출물로 본다.
+        "fingerprint_digest": _history_frame_fingerprint(ctx, frame),
+    }
+    # 문서를 한 문자열로 만들지 않고 chunk 단위로 temp 파일에 흘려 쓴다.
+    canonical_result = ctx.atomic_write_chunks(
+        canonical_path,
+        _iter_document(_iter_history_fragment(ctx, frame, rows), before, after),
+        **write_options,
+    )
+    # skip된 파일은 디스크 updated_at이 그대로이므로 기존 registry 엔트리를 유지한다.
+    if canonical_result.written:
+        ctx.publish_registry.record(
+            canonical_path,
+            updated_at=updated_at,
+            size_bytes=canonical_result.size_bytes,
+            sha256=canonical_result.sha256,
         )
-        ctx.atomic_write_json(canonical_path, json_output)
-        if legacy_path is not None:
-            ctx.atomic_write_json(legacy_path, json_output)
+    if legacy_path is not None:
+        # legacy는 다시 직렬화하지 않고 canonical의 hard link(불가하면 copy)로 발행한다.
+        legacy_result = ctx.atomic_link_or_copy(canonical_path, legacy_path)
+        canonical_artifact = ctx.publish_registry.resolve(canonical_path)
+        if legacy_result.written and canonical_artifact is not None:
+            ctx.publish_registry.record(
+                legacy_path,
+                updated_at=canonical_artifact.updated_at,
+                size_bytes=legacy_result.size_bytes,
+                sha256=legacy_result.sha256,
+            )
+    if not canonical_result.written:
+        ctx.logger.info(
+            f"[{symbol} {timeframe}] history unchanged. Skip rewrite: {canonical_path}"
+        )
+
+    if ctx.HISTORY_SEGMENTS_ENABLED and (
+        canonical_result.written
+        or not (ctx._history_segment_dir(symbol, timeframe) / "index.json").exists()
+    ):
+        try:
+            write_history_segments(ctx, symbol, timeframe, frame, rows, updated_at)
+        except Exception as e:
+            ctx.logger.error(f"[{symbol} {timeframe}] history segment 발행 실패: {e}")
+    if ctx.HISTORY_PYRAMID_ENABLED and (
+        canonical_result.written
+        or not ctx._history_pyramid_dir(symbol, timeframe).exists()
+    ):
+        try:
+            write_history_pyramid(ctx, symbol, timeframe, frame, updated_at)
+        except Exception as e:
+            ctx.logger.error(f"[{symbol} {timeframe}] history pyramid 발행 실패: {e}")
+    tail_path, _ = ctx._static_export_paths("history_tail", symbol, timeframe)
+    if ctx.HISTORY_TAIL_ENABLED and (
+        canonical_result.written or not tail_path.exists()
+    ):
+        try:
+            write_history_tail(ctx, symbol, timeframe, frame, rows, updated_at)
+        except Exception as e:
+            ctx.logger.error(f"[{symbol} {timeframe}] history tail 발행 실패: {e}")
+    indicators_path, _ = ctx._static_export_paths(
+        "history_indicators", symbol, timeframe
+    )
+    if ctx.HISTORY_INDICATORS_ENABLED and (
+        canonical_result.written or not indicators_path.exists()
+    ):
+        try:
+            write_history_indicators(ctx, symbol, timeframe, frame, updated_at)
+        except Exception as e:
+            ctx.logger.error(f"[{symbol} {timeframe}] history indicator 발행 실패: {e}")
+    arrow_path, _ = ctx._static_export_paths(
+        "history", symbol, timeframe, suffix=ctx.HISTORY_ARROW_SUFFIX
+    )
+    if ctx.HISTORY_ARROW_EXPORT_ENABLED and (
+        canonical_result.written or not arrow_path.exists()
+    ):
+        try:
+            _write_history_arrow(ctx, symbol, timeframe, frame, updated_at)
+        except Exception as e:
+            ctx.logger.error(f"[{symbol} {timeframe}] history arrow 발행 실패: {e}")
+    return canonical_path, legacy_path
+
+
+def save_history_to_json(ctx, df, symbol, timeframe):
+    """
+    history DataFrame을 정적 JSON으로 저장한다(canonical + legacy).
+
+    Called from:
+    - `update_full_history_file`
+
+    Why:
+    - 사용자 플레인이 SSG 기반이므로, export 시점마다 완결된 JSON 산출물이 필요하다.
+    - `HISTORY_EXPORT_MODE=incremental`이면 저장한 내용을 export 캐시에 남겨 다음 증분
+      export의 기준점으로 쓴다. full 모드는 다시 읽지 않으므로 series별로 잡아 두지 않는다.
+    """
+    try:
+        frame = _normalize_history_frame(df)
+        incremental = ctx.HISTORY_EXPORT_MODE == "incremental"
+        # full 모드는 record 조각을 보관하지 않고 쓰는 동안 chunk 단위로 인코딩한다.
+        rows = _history_rows_for_format(ctx, frame) if incremental else None
+        canonical_path, legacy_path = _write_history_rows(
+            ctx, symbol, timeframe, frame, rows
+        )
+        if incremental:
+            _history_export_cache[ctx._prediction_health_key(symbol, timeframe)] = (
+                HistoryExportCache(
+                    frame=frame,
+                    rows=rows,
+                    last_full_at=datetime.now(timezone.utc),
+                )
+            )
 
         ctx.logger.info(
             f"[{symbol} {timeframe}] 정적 파일 생성 완료: "
@@ -299,6 +1625,244 @@ def save_history_to_json(ctx, df, symbol, timeframe):
         ctx.logger.error(f"[{symbol} {timeframe}] 정적 파일 생성 실패: {e}")
 
 
+def _history_query(ctx, symbol: str, timeframe: str, range_start: str) -> str:
+    return f"""
+    from(bucket: "{ctx.INFLUXDB_BUCKET}")
+      |> range(start: {range_start})
+      |> filter(fn: (r) => r["_measurement"] == "ohlcv")
+      |> filter(fn: (r) => r["symbol"] == "{symbol}")
+      |> filter(fn: (r) => r["timeframe"] == "{timeframe}")
+      |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+      |> sort(columns: ["_time"], desc: false)
+    """
+
+
+def _flux_time(value: datetime) -> str:
+    """Flux date-time literal(초 단위 올림, UTC)."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC").ceil("s").strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _history_batch_query(
+    ctx, symbol: str, starts: dict[str, datetime | None]
+) -> str:
+    """
+    symbol의 여러 timeframe을 한 번에 받는 Flux query.
+
+    starts는 timeframe -> 조회 시작 시각(None이면 전체 기간)이다.
+    timeframe마다 자기 `range()`로 읽어 `union()`으로 합친다(왕복은 1회).
+    `_time` 조건은 `filter()`로는 storage까지 내려가지 않으므로, 한 range로 묶으면
+    전체 기간 timeframe 하나 때문에 lookback timeframe도 전체 history를 읽게 된다.
+    """
+    streams = []
+    for position, (timeframe, start) in enumerate(starts.items()):
+        range_start = "0" if start is None else _flux_time(start)
+        streams.append(
+            f"""
+    tf_{position} = from(bucket: "{ctx.INFLUXDB_BUCKET}")
+      |> range(start: {range_start})
+      |> filter(fn: (r) => r["_measurement"] == "ohlcv")
+      |> filter(fn: (r) => r["symbol"] == "{symbol}")
+      |> filter(fn: (r) => r["timeframe"] == "{timeframe}")"""
+        )
+    names = [f"tf_{position}" for position in range(len(streams))]
+    # union()은 stream 2개 이상을 받는다.
+    source = names[0] if len(names) == 1 else f"union(tables: [{', '.join(names)}])"
+    return "".join(streams) + f"""
+
+    {source}
+      |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+      |> group(columns: ["timeframe"])
+      |> sort(columns: ["_time"], desc: false)
+    """
+
+
+def prefetch_history_frames(
+    ctx, query_api, symbol: str, timeframes: list[str]
+) -> int:
+    """
+    symbol의 publish 대상 timeframe history를 Flux 한 번으로 받아 series별로 나눠 둔다.
+
+    Called from:
+    - `scripts.pipeline_worker` publish 단계 (`HISTORY_EXPORT_BATCH_QUERY`)
+
+    Why:
+    - series마다 query + pivot을 따로 돌리면 publish당 Influx 왕복이 symbol × timeframe이다.
+      timeframe tag로 묶어 한 번에 받고 client에서 나누면 symbol당 1회로 줄어든다.
+    - timeframe별 범위(증분/lookback/전체)는 `update_full_history_file`과 같은 규칙으로
+      정하고, 꺼내 쓰는 시점에 같은 규칙이 아니면 버리고 단건 조회로 돌아간다.
+
+    Returns:
+      - 준비된 series 수. 조회가 실패하면 0(각 series는 기존 단건 조회를 쓴다).
+    """
+    now = datetime.now(timezone.utc)
+    plans: dict[str, tuple[bool, datetime | None]] = {}
+    for timeframe in dict.fromkeys(timeframes):
+        cache = _resolve_incremental_cache(ctx, symbol, timeframe, now)
+        if cache is not None:
+            plans[timeframe] = (True, cache.frame.index[-1].to_pydatetime())
+        elif timeframe in ctx.FULL_HISTORY_EXPORT_TIMEFRAMES:
+            plans[timeframe] = (False, None)
+        else:
+            lookback_days = ctx._lookback_days_for_timeframe(timeframe)
+            plans[timeframe] = (False, now - timedelta(days=lookback_days))
+    if not plans:
+        return 0
+
+    query = _history_batch_query(
+        ctx, symbol, {timeframe: start for timeframe, (_, start) in plans.items()}
+    )
+    try:
+        result = query_api.query_data_frame(query)
+    except Exception as e:
+        ctx.logger.error(
+            f"[{symbol}] batched history query failed: {e}. "
+            "Falling back to per-timeframe queries."
+        )
+        return 0
+
+    frames = [
+        frame
+        for frame in (result if isinstance(result, list) else [result])
+        if isinstance(frame, pd.DataFrame) and not frame.empty
+    ]
+    parts: dict[str, pd.DataFrame] = {}
+    if frames:
+        df = pd.concat(frames, ignore_index=True)
+        if "timeframe" not in df.columns or "_time" not in df.columns:
+            ctx.logger.error(
+                f"[{symbol}] batched history query returned no timeframe/_time column. "
+                "Falling back to per-timeframe queries."
+            )
+            return 0
+        for timeframe, part in df.groupby("timeframe", sort=False):
+            parts[timeframe] = (
+                part.rename(columns={"_time": "timestamp"})
+                .set_index("timestamp")
+                .sort_index()
+            )
+    for timeframe, (incremental, _) in plans.items():
+        _history_prefetch[ctx._prediction_health_key(symbol, timeframe)] = (
+            HistoryPrefetch(
+                incremental=incremental,
+                frame=parts.get(timeframe, pd.DataFrame()),
+            )
+        )
+    return len(plans)
+
+
+def clear_history_prefetch() -> None:
+    """소비되지 않은 batch 조회 결과(gate skip 등)를 버린다."""
+    _history_prefetch.clear()
+
+
+def _take_history_prefetch(
+    ctx, symbol: str, timeframe: str, *, incremental: bool
+) -> pd.DataFrame | None:
+    """미리 받은 series history를 꺼낸다. 없거나 조회 범위 규칙이 다르면 None."""
+    prefetched = _history_prefetch.pop(
+        ctx._prediction_health_key(symbol, timeframe), None
+    )
+    if prefetched is None or prefetched.incremental != incremental:
+        return None
+    return prefetched.frame
+
+
+def _resolve_incremental_cache(
+    ctx, symbol: str, timeframe: str, now: datetime
+) -> HistoryExportCache | None:
+    """
+    증분 export에 쓸 캐시를 반환한다. full 재조회가 필요하면 None.
+
+    full로 되돌리는 조건:
+    - mode가 incremental이 아님
+    - cold start(캐시 없음) 또는 직전 산출물이 비어 있음
+    - full reconcile 주기 도래
+    - 산출물 파일이 사라짐(hidden 정책 삭제 등)
+    """
+    if ctx.HISTORY_EXPORT_MODE != "incremental":
+        return None
+    cache = _history_export_cache.get(ctx._prediction_health_key(symbol, timeframe))
+    if cache is None or cache.frame.empty:
+        return None
+    reconcile_after = timedelta(seconds=ctx.HISTORY_EXPORT_FULL_RECONCILE_SECONDS)
+    if now - cache.last_full_at >= reconcile_after:
+        return None
+    canonical_path, _ = ctx._static_export_paths("history", symbol, timeframe)
+    if not canonical_path.exists():
+        return None
+    return cache
+
+
+def _update_history_incremental(
+    ctx,
+    query_api,
+    symbol: str,
+    timeframe: str,
+    cache: HistoryExportCache,
+    now: datetime,
+    prefetched: pd.DataFrame | None = None,
+) -> bool | None:
+    """
+    마지막 export candle 이후만 조회해 캐시/파일을 갱신한다.
+
+    Returns:
+      - True: 갱신(또는 변경 없음 확인) 완료
+      - None: 증분 전제가 깨져 full 재조회가 필요함
+
+    Why:
+    - 마지막 candle부터(inclusive) 다시 받아 직전 값이 정정된 경우도 덮어쓴다.
+    - 새 candle만 인코딩하고 기존 record 조각은 재사용해 비용을 신규 분량에 비례시킨다.
+    - `prefetched`가 있으면(batch 조회) 같은 범위를 이미 받은 것이므로 다시 조회하지 않는다.
+    """
+    last_exported_at = cache.frame.index[-1]
+    if prefetched is None:
+        query = _history_query(
+            ctx, symbol, timeframe, str(int(last_exported_at.timestamp()))
+        )
+        df = query_api.query_data_frame(query)
+        if isinstance(df, pd.DataFrame) and not df.empty:
+            df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
+    else:
+        df = prefetched
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        ctx.logger.warning(
+            f"[{symbol} {timeframe}] incremental history query returned empty. "
+            "Falling back to full export."
+        )
+        return None
+    new_frame = _normalize_history_frame(df)
+
+    keep_start = 0
+    if timeframe not in ctx.FULL_HISTORY_EXPORT_TIMEFRAMES:
+        # full 경로의 `range(start: -Nd)`와 같은 창을 유지한다.
+        cutoff = now - timedelta(days=ctx._lookback_days_for_timeframe(timeframe))
+        keep_start = int(cache.frame.index.searchsorted(pd.Timestamp(cutoff)))
+    keep_end = int(cache.frame.index.searchsorted(new_frame.index[0]))
+
+    if keep_start == 0 and cache.frame.iloc[keep_end:].equals(new_frame):
+        ctx.logger.info(
+            f"[{symbol} {timeframe}] history unchanged since "
+            f"{last_exported_at.strftime('%Y-%m-%dT%H:%M:%SZ')}. Skip rewrite."
+        )
+        return True
+
+    new_rows = _history_rows_for_format(ctx, new_frame)
+    cache.frame = pd.concat([cache.frame.iloc[keep_start:keep_end], new_frame])
+    cache.rows = cache.rows[keep_start:keep_end] + new_rows
+    canonical_path, legacy_path = _write_history_rows(
+        ctx, symbol, timeframe, cache.frame, cache.rows
+    )
+    ctx.logger.info(
+        f"[{symbol} {timeframe}] 정적 파일 증분 갱신 완료: "
+        f"new_rows={len(new_frame)}, total_rows={len(cache.frame)}, "
+        f"canonical={canonical_path}, legacy={legacy_path}"
+    )
+    return True
+
+
 def update_full_history_file(ctx, query_api, symbol, timeframe) -> bool:
     """
     Influx source에서 history를 재조회해 정적 파일을 갱신한다.
@@ -308,31 +1872,47 @@ def update_full_history_file(ctx, query_api, symbol, timeframe) -> bool:
 
     Why:
     - ingest 결과를 사용자 평면(정적 파일)으로 반영하는 공식 경로를 고정한다.
+    - `HISTORY_EXPORT_MODE=incremental`이면 캐시 기준 증분 조회를 먼저 시도하고,
+      전제가 깨지면 full 재조회로 되돌아간다.
+    - `prefetch_history_frames`로 받아 둔 결과가 있으면 Influx를 다시 조회하지 않는다.
     """
+    now = datetime.now(timezone.utc)
+    cache = _resolve_incremental_cache(ctx, symbol, timeframe, now)
+    prefetched = _take_history_prefetch(
+        ctx, symbol, timeframe, incremental=cache is not None
+    )
+    if cache is not None:
+        try:
+            incremental_ok = _update_history_incremental(
+                ctx, query_api, symbol, timeframe, cache, now, prefetched
+            )
+            if incremental_ok is not None:
+                return incremental_ok
+        except Exception as e:
+            ctx.logger.error(
+                f"[{symbol} {timeframe}] History 증분 갱신 중 에러: {e}. "
+                "Falling back to full export."
+            )
+
     if timeframe in ctx.FULL_HISTORY_EXPORT_TIMEFRAMES:
         range_start = "0"
     else:
         lookback_days = ctx._lookback_days_for_timeframe(timeframe)
         range_start = f"-{lookback_days}d"
 
-    query = f"""
-    from(bucket: "{ctx.INFLUXDB_BUCKET}")
-      |> range(start: {range_start})
-      |> filter(fn: (r) => r["_measurement"] == "ohlcv")
-      |> filter(fn: (r) => r["symbol"] == "{symbol}")
-      |> filter(fn: (r) => r["timeframe"] == "{timeframe}")
-      |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-      |> sort(columns: ["_time"], desc: false)
-    """
     try:
-        df = query_api.query_data_frame(query)
+        if prefetched is not None and cache is None:
+            df = prefetched
+        else:
+            query = _history_query(ctx, symbol, timeframe, range_start)
+            df = query_api.query_data_frame(query)
+            if not df.empty:
+                df = df.rename(columns={"_time": "timestamp"}).set_index("timestamp")
         if df.empty:
             ctx.logger.warning(
                 f"[{symbol} {timeframe}] history source query returned empty."
             )
             return False
-        df.rename(columns={"_time": "timestamp"}, inplace=True)
-        df.set_index("timestamp", inplace=True)
         save_history_to_json(ctx, df, symbol, timeframe)
         return True
     except Exception as e:
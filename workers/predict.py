@@ -15,6 +15,27 @@ from pathlib import Path
 import pandas as pd
 from prophet.serialize import model_from_json
 
+from utils.forecast_table import (
+    FORECAST_STEPS,
+    decode_forecast_table,
+    forecast_table_path,
+    model_meta_path,
+)
+from utils.model_cache import ModelCache
+from utils.prophet_numpy import (
+    ProphetParams,
+    UnsupportedProphetModel,
+    compact_model_path,
+    decode_prophet_params,
+    evaluate_forecast,
+    extract_prophet_params,
+)
+
+FORECAST_COLUMNS = ["ds", "yhat", "yhat_lower", "yhat_upper"]
+
+# inference pool 자식 프로세스 전용 model cache. 자식마다 따로 적재/유지한다.
+_worker_model_cache: ModelCache | None = None
+
 
 def load_prediction_health(ctx, path: Path) -> dict[str, dict]:
     """
@@ -34,6 +55,10 @@ def load_prediction_health(ctx, path: Path) -> dict[str, dict]:
     Returns:
       - dict[str, dict]: Prediction health 정보
     """
+    cached = ctx.publish_registry.cached_payload(path)
+    if cached is not None:
+        # 호출자가 entries를 수정한 뒤 저장하므로 캐시 원본은 공유하지 않는다.
+        return dict(cached)
     if not path.exists():
         return {}
 
@@ -48,6 +73,7 @@ def load_prediction_health(ctx, path: Path) -> dict[str, dict]:
     if not isinstance(entries, dict):
         ctx.logger.error("Invalid prediction health format: entries is not a dict.")
         return {}
+    ctx.publish_registry.record_payload(path, dict(entries))
     return entries
 
 
@@ -72,7 +98,9 @@ def save_prediction_health(ctx, entries: dict[str, dict], path: Path) -> None:
         "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "entries": entries,
     }
-    ctx.atomic_write_json(path, payload, indent=2)
+    ctx.atomic_write_json(path, payload, indent=2, durable=True)
+    # manifest/upsert가 같은 cycle에 파일을 다시 파싱하지 않게 한다.
+    ctx.publish_registry.record_payload(path, dict(entries))
 
 
 def upsert_prediction_health(
@@ -135,6 +163,252 @@ def upsert_prediction_health(
     return updated, was_degraded, bool(updated["degraded"])
 
 
+def resolve_model_file(ctx, symbol: str, timeframe: str) -> Path | None:
+    """
+    series가 사용할 모델 파일 경로. 후보가 모두 없으면 None.
+
+    Called from:
+      - `run_prediction_and_save`
+      - `preload_models`
+    """
+    safe_symbol = symbol.replace("/", "_")
+    model_candidates = [
+        ctx.MODELS_DIR / f"model_{safe_symbol}_{timeframe}.json",
+        ctx.MODELS_DIR / f"model_{safe_symbol}.json",
+    ]
+    # timeframe 전용 모델 우선, 없으면 legacy 단일 모델 fallback.
+    # 이 순서를 유지하면 다중 timeframe 전환 중에도 서비스 중단 없이 점진 전환 가능하다.
+    return next(
+        (candidate for candidate in model_candidates if candidate.exists()),
+        None,
+    )
+
+
+def preload_models(ctx, symbols: list[str], timeframes: list[str]) -> int:
+    """
+    예측 대상 series의 모델을 model cache에 미리 적재한다.
+
+    Called from:
+      - `scripts.pipeline_worker.preload_models` (worker 시작 시 1회)
+
+    Why:
+      - 첫 publish cycle도 steady-state와 같은 시간 안에 끝나게 한다.
+
+    Returns:
+      - 적재에 성공한 모델 수. 개별 실패는 경고만 남기고 predict 단계에서 다시 시도한다.
+    """
+    if not ctx.model_cache.enabled:
+        return 0
+    loaded = 0
+    for symbol in symbols:
+        for timeframe in timeframes:
+            if not ctx.prediction_enabled_for_timeframe(timeframe):
+                continue
+            model_file = resolve_model_file(ctx, symbol, timeframe)
+            if model_file is None:
+                continue
+            try:
+                _load_model(ctx.model_cache, model_file, ctx.PREDICT_ENGINE)
+            except Exception as e:
+                ctx.logger.warning(
+                    f"[{symbol} {timeframe}] model preload failed: {e}"
+                )
+                continue
+            loaded += 1
+    return loaded
+
+
+def init_inference_worker(model_cache_max_bytes: int) -> None:
+    """
+    inference pool 자식 프로세스 initializer.
+
+    Called from:
+      - `utils.inference_pool.RecyclingProcessPool` (자식 프로세스 시작 시)
+    """
+    global _worker_model_cache
+    _worker_model_cache = ModelCache(model_cache_max_bytes)
+
+
+def _model_loader(engine: str):
+    """engine별 model cache loader. numpy engine은 학습 파라미터만 남긴다."""
+    return _load_numpy_forecaster if engine == "numpy" else model_from_json
+
+
+def _load_numpy_forecaster(raw: str):
+    model = model_from_json(raw)
+    try:
+        return extract_prophet_params(model)
+    except UnsupportedProphetModel:
+        # holiday/regressor 등 NumPy 평가기가 재현하지 않는 모델은 Prophet.predict로 처리한다.
+        return model
+
+
+def _load_compact_model(cache: ModelCache, model_file: Path) -> ProphetParams | None:
+    """
+    학습 시 함께 저장한 compact artifact(`.compact.npz`). 없거나 쓸 수 없으면 None.
+
+    artifact에 기록된 원본 model_version이 `.meta.json`과 다르면(재학습 도중 등)
+    모델 JSON과 어긋날 수 있으므로 쓰지 않는다.
+    """
+    artifact_path = compact_model_path(model_file)
+    meta_path = model_meta_path(model_file)
+    if not artifact_path.exists() or not meta_path.exists():
+        return None
+    try:
+        params = cache.get(artifact_path, decode_prophet_params, binary=True)
+        metadata = cache.get(meta_path, json.loads)
+    except Exception:
+        return None
+    if params.model_version is None or params.model_version != metadata.get(
+        "model_version"
+    ):
+        return None
+    return params
+
+
+def _load_model(cache: ModelCache, model_file: Path, engine: str):
+    """
+    engine에 맞는 모델 표현을 cache에서 꺼낸다.
+
+    Called from:
+      - `preload_models` / `predict_forecast` / `predict_forecast_in_worker`
+
+    Why:
+      - numpy engine은 학습 파라미터만 필요하다. compact artifact가 있으면
+        history/설정 전체가 든 모델 JSON 대신 수십 배 작은 npz만 읽는다.
+    """
+    if engine == "numpy":
+        params = _load_compact_model(cache, model_file)
+        if params is not None:
+            return params
+    return cache.get(model_file, _model_loader(engine))
+
+
+def _run_forecast(
+    model, future: pd.DataFrame, interval_method: str, interval_samples: int
+) -> pd.DataFrame:
+    if isinstance(model, ProphetParams):
+        values = evaluate_forecast(
+            model,
+            future["ds"].to_numpy(),
+            interval_method=interval_method,
+            interval_samples=interval_samples,
+        )
+        return pd.DataFrame({"ds": future["ds"].to_numpy(), **values})
+    return model.predict(future)
+
+
+def _predict_settings(ctx) -> tuple[str, str, int]:
+    """(engine, interval_method, interval_samples). 잘못된 설정은 기본값으로 되돌린다."""
+    engine = (
+        ctx.PREDICT_ENGINE
+        if ctx.PREDICT_ENGINE in ctx.VALID_PREDICT_ENGINES
+        else "prophet"
+    )
+    interval_method = (
+        ctx.PREDICT_INTERVAL_METHOD
+        if ctx.PREDICT_INTERVAL_METHOD in ctx.VALID_PREDICT_INTERVAL_METHODS
+        else "sampling"
+    )
+    return engine, interval_method, ctx.PREDICT_INTERVAL_SAMPLES
+
+
+def predict_forecast_in_worker(
+    model_path: str,
+    future: pd.DataFrame,
+    settings: tuple[str, str, int] = ("prophet", "sampling", 0),
+) -> tuple[pd.DataFrame, dict[str, int | float]]:
+    """
+    자식 프로세스에서 모델을 (cache에서) 꺼내 predict한다.
+
+    Returns:
+      - (forecast, cache_stats): 부모로 돌려보내는 pickle 크기를 줄이기 위해
+        forecast는 `FORECAST_COLUMNS`만 남긴다. cache_stats는 부모 메트릭에 합산된다.
+    """
+    engine, interval_method, interval_samples = settings
+    cache = _worker_model_cache if _worker_model_cache is not None else ModelCache(0)
+    model = _load_model(cache, Path(model_path), engine)
+    forecast = _run_forecast(model, future, interval_method, interval_samples)
+    return forecast[FORECAST_COLUMNS], cache.consume_stats()
+
+
+def predict_forecast(ctx, model_file: Path, future: pd.DataFrame) -> pd.DataFrame:
+    """
+    모델 적재 + predict. inference pool이 있으면 자식 프로세스에서 실행한다.
+
+    Called from:
+      - `run_prediction_and_save`
+
+    Why:
+      - CPU-bound predict를 worker 프로세스 밖으로 보내 publish thread들이
+        여러 core에서 동시에 predict하고, 모델 메모리는 자식 수명 안에 가둔다.
+      - pool이 없으면 프로세스 내 model cache를 쓴다. 파일 signature(재학습 시
+        rename으로 바뀜)가 같으면 역직렬화를 건너뛴다.
+      - PREDICT_ENGINE=numpy면 `Prophet.predict` 대신 `utils.prophet_numpy`로
+        trend/seasonality/구간을 직접 평가한다. 학습 시 저장한 compact artifact가
+        있으면 모델 JSON 대신 그것을 적재한다.
+    """
+    settings = _predict_settings(ctx)
+    if ctx.inference_pool is None:
+        model = _load_model(ctx.model_cache, model_file, settings[0])
+        return _run_forecast(model, future, settings[1], settings[2])
+    forecast, cache_stats = ctx.inference_pool.run(
+        predict_forecast_in_worker, str(model_file), future, settings
+    )
+    ctx.model_cache.merge_stats(cache_stats)
+    return forecast
+
+
+def resolve_model_version(ctx, model_file: Path) -> str:
+    """
+    모델의 `.meta.json` model_version. meta가 없거나 읽을 수 없으면 파일 signature.
+
+    Called from:
+      - `run_prediction_and_save` (prediction memo key)
+    """
+    try:
+        metadata = ctx.model_cache.get(model_meta_path(model_file), json.loads)
+    except (OSError, ValueError):
+        metadata = None
+    if isinstance(metadata, dict) and metadata.get("model_version"):
+        return str(metadata["model_version"])
+    stat_result = model_file.stat()
+    return f"stat:{stat_result.st_ino}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
+
+def lookup_forecast_table(
+    ctx, model_file: Path, prediction_start: datetime
+) -> pd.DataFrame | None:
+    """
+    학습 시 저장한 forecast table에서 `prediction_start`부터 24행을 잘라낸다.
+
+    Called from:
+      - `run_prediction_and_save`
+
+    Returns:
+      - Prophet forecast와 같은 column(ds/yhat/yhat_lower/yhat_upper)의 DataFrame.
+        표가 없거나, `.meta.json`의 model_version과 다르거나(재학습 도중 등),
+        horizon 밖이면 None을 돌려 실시간 예측으로 넘긴다.
+    """
+    if not ctx.PREDICT_FORECAST_TABLE_ENABLED:
+        return None
+    table_path = forecast_table_path(model_file)
+    meta_path = model_meta_path(model_file)
+    if not table_path.exists() or not meta_path.exists():
+        return None
+    try:
+        table = ctx.model_cache.get(table_path, decode_forecast_table, binary=True)
+        metadata = ctx.model_cache.get(meta_path, json.loads)
+    except Exception as e:
+        ctx.logger.warning(f"[{model_file.name}] forecast table load failed: {e}")
+        return None
+    if table.model_version is None or table.model_version != metadata.get(
+        "model_version"
+    ):
+        return None
+    return table.window(prediction_start, FORECAST_STEPS)
+
+
 def run_prediction_and_save(
     ctx,
     write_api,
@@ -155,7 +429,8 @@ def run_prediction_and_save(
 
     Orchestrator contract:
       - 이 함수는 watermark를 직접 갱신하지 않는다.
-      - 반환 코드(ok/skipped/failed)를 바탕으로
+      - memo_hit은 같은 모델/구간의 forecast가 이미 발행돼 있어 다시 쓰지 않은 성공이다.
+      - 반환 코드(ok/memo_hit/skipped/failed)를 바탕으로
         `scripts.pipeline_worker`가 predict watermark 전진 여부를 결정한다.
     """
     if not ctx.prediction_enabled_for_timeframe(timeframe):
@@ -180,59 +455,95 @@ def run_prediction_and_save(
             )
             return "skipped", "insufficient_data"
 
-    safe_symbol = symbol.replace("/", "_")
-    model_candidates = [
-        ctx.MODELS_DIR / f"model_{safe_symbol}_{timeframe}.json",
-        ctx.MODELS_DIR / f"model_{safe_symbol}.json",
-    ]
-    # timeframe 전용 모델 우선, 없으면 legacy 단일 모델 fallback.
-    # 이 순서를 유지하면 다중 timeframe 전환 중에도 서비스 중단 없이 점진 전환 가능하다.
-    model_file = next(
-        (candidate for candidate in model_candidates if candidate.exists()),
-        None,
-    )
+    model_file = resolve_model_file(ctx, symbol, timeframe)
     if model_file is None:
         ctx.logger.warning(f"[{symbol} {timeframe}] 모델 없음")
         return "failed", "model_missing"
 
     try:
-        with open(model_file, "r") as fin:
-            model = model_from_json(fin.read())
-
         now = datetime.now(timezone.utc)
         # 예측 시작점은 "현재 시각"이 아니라 "다음 닫힌 캔들 경계"다.
         # 이유: 미완료 구간(open candle) 예측을 피하고, 백테스트/운영 시계열 축을
         # 안정적으로 맞추기 위해서다.
         prediction_start = ctx.next_timeframe_boundary(now, timeframe)
-        prediction_freq = ctx.timeframe_to_pandas_freq(timeframe)
-        future = pd.DataFrame(
-            {
-                "ds": pd.date_range(
-                    start=prediction_start, periods=24, freq=prediction_freq
-                )
-            }
+        canonical_path, legacy_path = ctx._static_export_paths(
+            "prediction", symbol, timeframe
         )
-        future["ds"] = future["ds"].dt.tz_localize(None)
+        memo_key: dict[str, str] | None = None
+        if ctx.PREDICTION_MEMO_ENABLED:
+            memo_key = {
+                "model_version": resolve_model_version(ctx, model_file),
+                "prediction_start": prediction_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+            # 같은 모델, 같은 구간이면 forecast도 같다. 이미 발행한 파일/Influx 기록을 유지하되
+            # manifest가 읽는 publish registry에는 발행 파일이 등록돼 있게 한다.
+            # legacy(`prediction_{symbol}.json`)는 symbol의 모든 timeframe이 번갈아 가리키므로
+            # memo는 canonical만 비교하고, hit이면 legacy를 이 series로 다시 맞춘다.
+            canonical_artifact = (
+                ctx.publish_registry.resolve(canonical_path)
+                if ctx.prediction_memo.matches(
+                    symbol, timeframe, **memo_key, paths=[canonical_path]
+                )
+                else None
+            )
+            if canonical_artifact is not None:
+                if legacy_path is not None:
+                    legacy_result = ctx.atomic_link_or_copy(
+                        canonical_path, legacy_path
+                    )
+                    if legacy_result.written:
+                        ctx.publish_registry.record(
+                            legacy_path,
+                            updated_at=canonical_artifact.updated_at,
+                            size_bytes=legacy_result.size_bytes,
+                            sha256=legacy_result.sha256,
+                        )
+                    else:
+                        ctx.publish_registry.resolve(legacy_path)
+                ctx.logger.info(
+                    f"[{symbol} {timeframe}] forecast unchanged "
+                    f"(model_version={memo_key['model_version']}, "
+                    f"start={memo_key['prediction_start']}). Skipping publish."
+                )
+                return "memo_hit", None
+        # 학습 시 미리 계산한 forecast table이 이 구간을 덮으면 잘라 쓰기만 한다.
+        next_forecast = lookup_forecast_table(ctx, model_file, prediction_start)
+        if next_forecast is None:
+            prediction_freq = ctx.timeframe_to_pandas_freq(timeframe)
+            future = pd.DataFrame(
+                {
+                    "ds": pd.date_range(
+                        start=prediction_start,
+                        periods=FORECAST_STEPS,
+                        freq=prediction_freq,
+                    )
+                }
+            )
+            future["ds"] = future["ds"].dt.tz_localize(None)
 
-        forecast = model.predict(future)
-        next_forecast = forecast.head(24).copy()
+            forecast = predict_forecast(ctx, model_file, future)
+            next_forecast = forecast.head(FORECAST_STEPS).copy()
 
         if next_forecast.empty:
             ctx.logger.warning(f"[{symbol} {timeframe}] 예측 범위 생성 실패.")
             return "failed", "empty_forecast"
 
-        export_data = next_forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]]
-        export_data["ds"] = pd.to_datetime(export_data["ds"]).dt.strftime(
-            "%Y-%m-%dT%H:%M:%SZ"
-        )
-        export_data.rename(
-            columns={
-                "ds": "timestamp",
-                "yhat": "price",
-                "yhat_lower": "lower_bound",
-                "yhat_upper": "upper_bound",
-            },
-            inplace=True,
+        # forecast table window/predict 결과의 view를 수정하지 않도록 새 frame으로 만든다.
+        export_data = (
+            next_forecast[FORECAST_COLUMNS]
+            .assign(
+                ds=lambda frame: pd.to_datetime(frame["ds"]).dt.strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                )
+            )
+            .rename(
+                columns={
+                    "ds": "timestamp",
+                    "yhat": "price",
+                    "yhat_lower": "lower_bound",
+                    "yhat_upper": "upper_bound",
+                }
+            )
         )
 
         json_output = {
@@ -242,14 +553,26 @@ def run_prediction_and_save(
             "forecast": export_data.to_dict(orient="records"),
         }
 
-        canonical_path, legacy_path = ctx._static_export_paths(
-            "prediction", symbol, timeframe
-        )
         # canonical + legacy dual-write는 이행기 호환 장치다.
         # 하위 소비자가 canonical로 완전 전환되기 전까지 읽기 경로 단절을 막는다.
-        ctx.atomic_write_json(canonical_path, json_output, indent=2)
+        # legacy는 한 번 직렬화한 canonical 파일의 hard link(불가하면 copy)로 발행한다.
+        results = [
+            ctx.atomic_write_json(
+                canonical_path,
+                json_output,
+                indent=2,
+                precompress=ctx.STATIC_PRECOMPRESS_ENABLED,
+            )
+        ]
         if legacy_path is not None:
-            ctx.atomic_write_json(legacy_path, json_output, indent=2)
+            results.append(ctx.atomic_link_or_copy(canonical_path, legacy_path))
+        for result in results:
+            ctx.publish_registry.record(
+                result.path,
+                updated_at=json_output["updated_at"],
+                size_bytes=result.size_bytes,
+                sha256=result.sha256,
+            )
 
         ctx.logger.info(
             f"[{symbol} {timeframe}] SSG 파일 생성 완료: "
@@ -259,7 +582,7 @@ def run_prediction_and_save(
         )
 
         next_forecast["ds"] = pd.to_datetime(next_forecast["ds"]).dt.tz_localize("UTC")
-        next_forecast = next_forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]]
+        next_forecast = next_forecast[FORECAST_COLUMNS]
         next_forecast.rename(columns={"ds": "timestamp"}, inplace=True)
         next_forecast.set_index("timestamp", inplace=True)
         next_forecast["symbol"] = symbol
@@ -276,6 +599,13 @@ def run_prediction_and_save(
         # - 운영 분석(추세/실패 구간)과 추후 모델 비교(shadow/champion)의
         #   기준 데이터를 보존하기 위해서다.
         ctx.logger.info(f"[{symbol} {timeframe}] {len(next_forecast)}개 예측 저장 완료")
+        if memo_key is not None:
+            ctx.prediction_memo.remember(
+                symbol,
+                timeframe,
+                **memo_key,
+                paths=[canonical_path],
+            )
         return "ok", None
 
     except Exception as e: